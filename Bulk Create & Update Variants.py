@@ -0,0 +1,48 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO CREATE & UPDATE VARIANTS IN BULK IN Shopify USING GraphQL Admin API
+
+The variant scripts create one variant per productVariantCreate round trip. This script manages many
+variants per call instead, which turns a sizing matrix with hundreds of variants, or a store-wide
+repricing, into a handful of calls per product.
+
+    1. Read Variant Rows – Load the variants to create (product, option values, price, SKU) or to
+                           update (product, variant, price, compare-at price) from a CSV file.
+    2. Group By Product – The bulk variant mutations work on one product at a time, so the rows are
+                          grouped per product and split into chunks of VARIANTS_PER_CALL.
+    3. Create Or Update – Send productVariantsBulkCreate / productVariantsBulkUpdate calls, processing
+                          several products concurrently, and map every userError back to its row.
+
+CSV columns for creating variants:  product_id, options (e.g. "Size=M;Color=Red"), price,
+                                    compareAtPrice, sku
+CSV columns for updating variants:  product_id, variant_id, price, compareAtPrice
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.variants import (
+    bulk_create_variants, bulk_update_variants, process_variants, read_variants_by_product, summarize,
+    variant_create_input, variant_update_input,
+)
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: create a sizing matrix, then reprice variants across the store
+    new_variants_csv = "new_variants.csv"       # product_id, options, price, compareAtPrice, sku
+    price_updates_csv = "price_updates.csv"     # product_id, variant_id, price, compareAtPrice
+
+    variants_to_create = read_variants_by_product(new_variants_csv, variant_create_input)
+    print("Variants Created:", json.dumps(summarize(process_variants(variants_to_create, bulk_create_variants)), indent=2))
+
+    variants_to_update = read_variants_by_product(price_updates_csv, variant_update_input)
+    print("Variants Updated:", json.dumps(summarize(process_variants(variants_to_update, bulk_update_variants)), indent=2))
@@ -0,0 +1,43 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO CREATE PRODUCTS IN BULK FROM A FILE IN Shopify USING GraphQL Admin API
+
+Creating a seasonal catalog of thousands of products one productCreate call at a time takes hours.
+This script streams product definitions from a file and creates them with Shopify's bulk mutation
+support instead:
+
+    1. Read Product Definitions – Stream ProductSetInput definitions from a JSONL file (one product
+                                  per line) or from a CSV file with simple product columns.
+    2. Write The Variables File – Write one {"input": ...} line per product to a JSONL file, the format
+                                  bulkOperationRunMutation expects.
+    3. Staged Upload – Reserve an upload target with stagedUploadsCreate and upload the JSONL file to it.
+    4. Run The Bulk Mutation – Start bulkOperationRunMutation with productSet and wait for it to finish.
+    5. Map The Results – Stream the result file and map every created product GID back to the input
+                         row it came from, using the __lineNumber Shopify adds to each result line.
+
+Small batches do not need the staged upload round trip: below SMALL_BATCH_LIMIT products the script
+sends productSet calls concurrently instead. The upload only talks to the URL and form parameters of
+the staged target, so it can be exercised against a local stub server in place of Shopify's storage.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.product_import import bulk_create_products
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: load a seasonal catalog and record the created product GIDs per input row
+    products_file = "seasonal_catalog.jsonl"    # One ProductSetInput per line, or a CSV file
+    results_file = "seasonal_catalog_results.csv"
+
+    print("Bulk Product Creation:", json.dumps(bulk_create_products(products_file, results_file), indent=2))
@@ -0,0 +1,42 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO PURGE PRODUCT METAFIELDS ACROSS THE WHOLE CATALOG IN Shopify USING GraphQL Admin API
+
+This script removes every product metafield that matches a namespace and key pattern, for example
+when a deprecated namespace has to be cleaned up across thousands of products.
+
+    1. Discover Metafields – Find the matching metafields either with paginated products queries
+                             (filtered to the namespace on the server) or with a bulk operation
+                             that exports the whole catalog as a JSONL file.
+    2. Delete In Batches – Remove the metafields with the metafieldsDelete mutation, which accepts
+                           many metafield identifiers per call, using several concurrent workers.
+    3. Report – Print how many metafields were found, deleted and failed.
+
+Deletion starts while discovery is still running, and a dry run only reports what would be deleted.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.metafields import purge_metafields
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: remove every metafield of a deprecated namespace from all products
+    namespace = "legacy_import"     # Namespace to clean up
+    key_pattern = "*"               # Shell-style pattern of the keys to delete, e.g. "old_*"
+
+    # Count what would be deleted before deleting anything
+    print("Dry Run:", json.dumps(purge_metafields(namespace, key_pattern, dry_run=True), indent=2))
+
+    # Delete the matching metafields
+    print("Purge Report:", json.dumps(purge_metafields(namespace, key_pattern, use_bulk=True, dry_run=False), indent=2))
@@ -0,0 +1,37 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO DELETE PRODUCTS IN BULK AND VERIFY THE DELETION IN Shopify USING GraphQL Admin API
+
+This script purges many products at once, for example thousands of discontinued SKUs, instead of
+deleting one product and retrieving it again to confirm it is gone.
+
+    1. Select Products – Take a list of product GIDs, or stream the IDs of every product matching a
+                         Shopify search query (e.g. "status:archived tag:discontinued").
+    2. Dry Run – Count the products that would be deleted without deleting anything.
+    3. Delete Concurrently – Send productDelete mutations from several workers while staying inside
+                             Shopify's query cost budget.
+    4. Verify In Batches – Confirm the deletions with nodes(ids:) lookups of up to 250 IDs each; a
+                           deleted product comes back as null.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.products import bulk_delete_products
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: purge discontinued products
+    search_query = "tag:discontinued status:archived"
+
+    print("Dry Run:", json.dumps(bulk_delete_products(search_query=search_query, dry_run=True), indent=2))
+    print("Delete Report:", json.dumps(bulk_delete_products(search_query=search_query, dry_run=False), indent=2))
@@ -0,0 +1,45 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO SET METAFIELDS ON MANY PRODUCTS IN BATCHES IN Shopify USING GraphQL Admin API
+
+This script writes large numbers of metafields (a backfill of thousands of products, for example)
+by packing them into full metafieldsSet mutations instead of sending one mutation per metafield.
+
+    1. Read Metafield Rows – Stream (owner, namespace, key, value, type) rows from a CSV file or any
+                             other iterable, without loading the whole backfill into memory.
+    2. Pack Into Batches – Group the rows into batches of up to 25 inputs, the maximum accepted by a
+                           single metafieldsSet call. One batch may span many different products.
+    3. Send The Batches – Send the batches concurrently while staying inside Shopify's query cost
+                          budget, and map every per-item userError back to the row that caused it.
+
+metafieldsSet is atomic: when one input of a batch fails validation, none of the batch is saved.
+The rows that did not fail are therefore sent again without the failing ones, so a single bad
+row never blocks the other 24. A 50,000 metafield backfill takes about 2,000 calls instead of 50,000.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.metafields import bulk_set_metafields, read_metafield_rows
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: backfill the metafields listed in a CSV file
+    # (columns: owner_id, namespace, key, value, type)
+    metafields_csv = "metafields_backfill.csv"
+
+    result = bulk_set_metafields(read_metafield_rows(metafields_csv))
+    print(f"Batches sent: {result['batches']}")
+    print(f"Metafields written: {len(result['written'])}")
+    print("Failed rows:", json.dumps(
+        [{"row": row._asdict(), "errors": messages} for row, messages in result["failed"]], indent=2
+    ))
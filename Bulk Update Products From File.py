@@ -0,0 +1,38 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO UPDATE ONLY THE CHANGED PRODUCT FIELDS FROM A FILE IN Shopify USING GraphQL Admin API
+
+Nightly content syncs mostly send products that did not change, and every productUpdate still pays the
+full mutation cost. This script compares the desired product fields with the current ones and only
+sends the fields that differ, for the products that differ.
+
+    1. Load Desired Fields – Read product fields (title, descriptionHtml, vendor, productType, tags,
+                             status, ...) keyed by product ID from a JSON or CSV file.
+    2. Load Current Fields – Use the cache written by the previous run, or fetch the current values in
+                             batches with nodes(ids:), selecting only the fields present in the file.
+    3. Field-Level Diff – Compare every field; products without any difference are skipped.
+    4. Update Concurrently – Send productUpdate with only the changed fields, from several workers,
+                             and remember the new values in the cache.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.product_sync import sync_products
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: nightly content sync
+    desired_file = "product_content.json"       # JSON list or CSV with id, title, descriptionHtml, ...
+    cache_path = "product_content_cache.json"   # Current product fields remembered between runs
+
+    print("Product Sync Report:", json.dumps(sync_products(desired_file, cache_path), indent=2))
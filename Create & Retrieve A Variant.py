@@ -19,89 +19,30 @@ to Shopify’s API structure.
 
 # Importing the necessary packages
 import json
-import requests
+
+from shopify_graphql.client import configure
+from shopify_graphql.variants import create_variant, retrieve_product_variants
 
 # Shopify Admin API details
 SHOP_URL = "your_store_name.myshopify.com"
 ACCESS_TOKEN = "<your_access_token>"
-API_VERSION = "2024-01"  # Update as per latest supported version
-GRAPHQL_URL = f"https://{SHOP_URL}/admin/api/{API_VERSION}/graphql.json"
-
-# Headers for authentication
-HEADERS = {
-    "X-Shopify-Access-Token": ACCESS_TOKEN,
-    "Content-Type": "application/json",
-}
 
-# Function to retrieve the existing Variants of a Product
-def retrieve_product_variants(product_id):
-    """
-    Retrieves all variants of a given product by its ID.
-    """
-    query = """
-        query getProduct($id: ID!) {
-            product(id: $id) {
-                id
-                title
-                variants(first: 10) {
-                    edges {
-                        node {
-                            id
-                            title  # Variant title
-                            sku
-                            price
-                        }
-                    }
-                }
-            }
-        }
-    """
-    variables = {"id": product_id}
-    response = requests.post(GRAPHQL_URL, json={"query": query, "variables": variables}, headers=HEADERS)
-    return response.json()
 
-def create_variant(product_id, sku, price, title):
-    """
-    Creates a new variant for a given product.
-    """
-    mutation = """
-        mutation createVariant($input: ProductVariantInput!) {
-            productVariantCreate(input: $input) {
-                productVariant {
-                    id
-                    title  # Variant title
-                    sku
-                    price
-                }
-                userErrors {
-                    field
-                    message
-                }
-            }
-        }
-    """
-    variables = {
-        "input": {
-            "productId": product_id,
-            "sku": sku,
-            "price": price,
-            "options": [title]  # Assign title to variant
-        }
-    }
-    response = requests.post(GRAPHQL_URL, json={"query": mutation, "variables": variables}, headers=HEADERS)
-    return response.json()
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
 
-# Define the parameters and values for creating the new Variant
-product_id = "gid://shopify/Product/8941400326381"
-sku = "PTP-PS-VAR369"
-price = "500.00"
-variant_title = "1L"
+    # Define the parameters and values for creating the new Variant
+    product_id = "gid://shopify/Product/8941400326381"
+    sku = "PTP-PS-VAR369"
+    price = "500.00"
+    variant_title = "1L"
 
-# Retrieve existing variants
-print("Existing Variants:", json.dumps(retrieve_product_variants(product_id), indent=2))
+    # Retrieve existing variants
+    print("Existing Variants:", json.dumps(retrieve_product_variants(product_id), indent=2))
 
-# Create new variant
-print("Creating New Variant:", json.dumps(create_variant(product_id, sku, price, variant_title), indent=2))
+    # Create new variant
+    print("Creating New Variant:", json.dumps(create_variant(product_id, sku, price, variant_title), indent=2))
 
-# Retrieve updated variants
-print("New Variants:", json.dumps(retrieve_product_variants(product_id), indent=2))
+    # Retrieve updated variants
+    print("New Variants:", json.dumps(retrieve_product_variants(product_id), indent=2))
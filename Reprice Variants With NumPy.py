@@ -0,0 +1,45 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO REPRICE VARIANTS IN BULK WITH NUMPY IN Shopify USING GraphQL Admin API
+
+Repricing tens of thousands of variants with a Python loop over dicts is slow and easy to get wrong.
+This script loads all variant prices into NumPy arrays, applies a rule set to every price at once and
+only sends the prices that actually changed.
+
+    1. Load Prices – Read variant prices from a catalog export (CSV) or with a paginated productVariants
+                     query. IDs are stored as integers and prices as integer cents.
+    2. Apply Rules – Apply percentage moves, currency conversion, price endings (e.g. .99), rounding
+                     steps and min/max clamps to the whole price array in one vectorized pass.
+    3. Emit Changes – Keep only the variants whose price changed, group them per product and send them
+                      as productVariantsBulkUpdate calls, several products at a time.
+
+Install NumPy using the Command - pip install numpy
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.repricing import load_prices_from_csv, reprice_variants
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: raise all prices by 8%, convert to EUR, end them in .99 and keep them between 5 and 999
+    price_rules = [
+        {"type": "percent", "value": 8},
+        {"type": "convert", "rate": 0.92},
+        {"type": "ending", "value": 0.99},
+        {"type": "clamp", "min": 5, "max": 999.99},
+    ]
+
+    price_arrays = load_prices_from_csv("variant_prices.csv")   # Or: load_prices_from_shopify("vendor:Acme")
+    print("Repricing Dry Run:", json.dumps(reprice_variants(price_arrays, price_rules, dry_run=True), indent=2))
+    print("Repricing Result:", json.dumps(reprice_variants(price_arrays, price_rules, dry_run=False), indent=2))
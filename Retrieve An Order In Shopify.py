@@ -16,96 +16,22 @@ This script helps in efficiently managing orders within Shopify by accessing str
 
 # Importing necessary packages
 import json
-import requests
+
+from shopify_graphql.client import configure
+from shopify_graphql.orders import retrieve_order
 
 # Shopify Admin API details
 SHOP_URL = "<your_store_name>.myshopify.com"
 ACCESS_TOKEN = "<your_store_access_token>"
-API_VERSION = "2025-01"  # Update as per latest supported version
-GRAPHQL_URL = f"https://{SHOP_URL}/admin/api/{API_VERSION}/graphql.json"
-
-# Function to retrieve order details
-def retrieve_order(order_id):
-    """
-    Retrieves complete details of an order in Shopify.
-
-    Arguments:
-    order_id -- The unique Shopify order ID (GraphQL GID format).
-
-    Returns:
-    JSON response containing order details or error messages.
-    """
-    query = """
-    query getOrder($id: ID!) {
-        order(id: $id) {
-            id                                      # Unique Shopify order ID
-            name                                    # Shopify-generated order name (e.g., #1001)
-            email                                   # Email ID of the Customer
-            customer {
-                firstName                           # First name of the Customer
-                lastName                            # Last name of the Customer
-                email                               # Email ID of the Customer
-                phone                               # Contact Number of the Customer
-            }
-            billingAddress {
-                firstName                           # First name on the billing address
-                lastName                            # Last name on the billing address
-                address1                            # Primary address line
-                address2                            # Secondary address line (if any)
-                city                                # City name
-                province                            # Province or state
-                country                             # Country name
-                zip                                 # Zip or postal code
-                phone                               # Phone number associated with billing address
-            }
-            shippingAddress {
-                firstName                           # First name on the shipping address
-                lastName                            # Last name on the shipping address
-                address1                            # Primary address line
-                address2                            # Secondary address line (if any)
-                city                                # City name
-                province                            # Province or state
-                country                             # Country name
-                zip                                 # Zip or postal code
-                phone                               # Phone number associated with shipping address
-            }
-            lineItems(first: 5) {
-                edges {
-                    node {
-                        title                       # Product title in the order
-                        quantity                    # Quantity of the product ordered
-                        originalUnitPriceSet {
-                            presentmentMoney {
-                                amount              # Price per unit
-                                currencyCode        # Currency of the price
-                            }
-                        }
-                    }
-                }
-            }
-            totalPriceSet {
-                presentmentMoney {
-                    amount                          # Total order price
-                    currencyCode                    # Currency of the total price
-                }
-            }
-        }
-    }
-    """
-    variables = {"id": order_id}                    # GraphQL variables containing the order ID
 
-    # Sending the request to Shopify GraphQL API
-    response = requests.post(
-        GRAPHQL_URL,
-        json={"query": query, "variables": variables},
-        headers={"X-Shopify-Access-Token": ACCESS_TOKEN, "Content-Type": "application/json"},
-    )
-    return response.json()
 
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
 
-# Define the Order ID to retrieve
-order_id = "gid://shopify/Order/<your_order_id>"  # Replace with an actual Order GID
+    # Define the Order ID to retrieve
+    order_id = "gid://shopify/Order/<your_order_id>"  # Replace with an actual Order GID
 
-# Retrieve and print order details
-order_response = retrieve_order(order_id)
-print("Order Details:", json.dumps(order_response, indent=2))
+    # Retrieve and print order details
+    order_response = retrieve_order(order_id)
+    print("Order Details:", json.dumps(order_response, indent=2))
@@ -0,0 +1,48 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO RETRIEVE PRODUCT METAFIELDS BY NAMESPACE & KEY IN Shopify USING GraphQL Admin API
+
+Fetching metafields(first: 10) and looping over the edges to find a key silently misses the
+target on products with more than 10 metafields. This script shows the two complete alternatives
+the other metafield scripts build on:
+
+    1. Direct Keyed Lookup – Fetch specific metafields with metafield(namespace:, key:) for many
+                             products in one request, using a GraphQL alias per product and per key.
+    2. Complete Listing – Page through all metafields of a product and build a local
+                          {(namespace, key): metafield} dict, so every lookup is a dict access
+                          and nothing is ever truncated.
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.metafields import retrieve_all_product_metafields, retrieve_metafields_by_key
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage (replace with actual Product GIDs)
+    product_ids = [
+        "gid://shopify/Product/8941400326381",
+        "gid://shopify/Product/<your_product_id>",
+    ]
+    identifiers = [("custom", "origin"), ("custom", "active")]
+
+    # Look up two metafields on every product with a single request
+    keyed_metafields = retrieve_metafields_by_key(product_ids, identifiers)
+    for product_id, metafields in keyed_metafields.items():
+        for (namespace, key), metafield in metafields.items():
+            print(f"{product_id} {namespace}.{key}:", metafield["value"] if metafield else "<not set>")
+
+    # Build a complete local index of one product's metafields
+    all_metafields = retrieve_all_product_metafields(product_ids[0])
+    print("Number of Metafields:", len(all_metafields))
+    print("custom.origin:", json.dumps(all_metafields.get(("custom", "origin")), indent=2))
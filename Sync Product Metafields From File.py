@@ -0,0 +1,43 @@
+"""
+Programmer - python_scripts (Abhijith Warrier)
+
+PYTHON SCRIPT TO SYNC PRODUCT METAFIELDS FROM A DESIRED-STATE FILE IN Shopify USING GraphQL Admin API
+
+This script makes the product metafields in Shopify match a desired-state file (JSON or CSV) and only
+sends the metafields that really changed. Nightly jobs that rewrite mostly unchanged values no longer
+pay for a mutation per metafield.
+
+    1. Load Desired State – Read (owner_id, namespace, key, value, type) rows from a JSON or CSV file.
+    2. Load Remote State – Use the cache written by the previous sync, or fetch the current metafields
+                           with a bulk operation when there is no cache (or a refresh is requested).
+                           Only a content hash of every value is kept, not the value itself.
+    3. Compare – Classify every metafield as an add, update, delete or no-op by comparing hashes.
+    4. Apply – Send the adds and updates as batched metafieldsSet calls, the deletes as batched
+               metafieldsDelete calls, and save the new remote state to the cache.
+
+Deletes are only planned for metafields whose product and namespace appear in the desired-state file,
+and only when pruning is enabled. Refresh the cache from time to time when metafields are also edited
+outside of this sync (in the Shopify admin, for example).
+"""
+
+# Importing the necessary packages
+import json
+
+from shopify_graphql.client import configure
+from shopify_graphql.metafield_sync import sync_metafields
+
+# Shopify Admin API details
+SHOP_URL = "<your_store_name>.myshopify.com"
+ACCESS_TOKEN = "<your_access_token>"
+
+
+if __name__ == "__main__":
+    # Connect the package's default client to the store
+    configure(SHOP_URL, ACCESS_TOKEN)
+
+    # Example usage: nightly sync of the product metafields listed in a JSON file
+    desired_file = "desired_metafields.json"        # JSON list or CSV with owner_id, namespace, key, value, type
+    cache_path = "metafield_sync_cache.json"        # Remote state remembered between runs
+
+    sync_report = sync_metafields(desired_file, cache_path, prune=False)
+    print("Metafield Sync Report:", json.dumps(sync_report, indent=2))
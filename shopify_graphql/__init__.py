@@ -0,0 +1,63 @@
+"""
+Shopify Admin GraphQL operations for Products, Variants, Orders and Metafields.
+
+The operations live in one module per resource (orders, products, variants, metafields, ...) and
+share the pooled, throttle-aware client from shopify_graphql.client. They are also available as
+subcommands of the `shopify-graphql` command line tool.
+
+The most used operations can be imported from the package directly; their modules are only
+imported on first use, so `import shopify_graphql` stays cheap:
+
+    from shopify_graphql import configure, retrieve_order, update_order
+
+    configure("your-store.myshopify.com", "shpat_...")
+    for order_id in order_ids:
+        update_order(order_id, ["Priority"], "Customer requested express delivery.")
+"""
+
+import importlib
+
+__version__ = "0.1.0"
+
+# Names exported by the package and the modules defining them
+EXPORTS = {
+    "ShopifyClient": "client",
+    "configure": "client",
+    "get_client": "client",
+    "paginate": "pagination",
+    "retrieve_order": "orders",
+    "create_order": "orders",
+    "update_order": "orders",
+    "fulfill_order": "fulfillments",
+    "fulfill_order_items": "fulfillments",
+    "refund_order": "refunds",
+    "refund_order_items": "refunds",
+    "generate_packing_slip_pdf": "packing_slips",
+    "render_packing_slip": "packing_slips",
+    "retrieve_product": "products",
+    "iter_products": "products",
+    "create_product": "products",
+    "update_product": "products",
+    "delete_product": "products",
+    "retrieve_product_variants": "variants",
+    "create_variant": "variants",
+    "retrieve_product_metafields": "metafields",
+    "set_metafield": "metafields",
+    "set_metafields": "metafields",
+    "delete_product_metafield": "metafields",
+}
+
+__all__ = sorted(EXPORTS)
+
+
+# Function to import an exported name from its module on first access
+def __getattr__(name):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
@@ -0,0 +1,6 @@
+# Allows running the command line interface with: python -m shopify_graphql
+import sys
+
+from .cli import main
+
+sys.exit(main())
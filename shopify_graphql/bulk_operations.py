@@ -0,0 +1,168 @@
+"""
+Bulk operations: run bulk queries and bulk mutations and stream their JSONL results.
+
+Bulk operations are not subject to the per-request cost limit, which makes them the right tool for
+exporting or writing whole catalogs. Only one bulk operation of each kind can run per shop at a time.
+"""
+
+# Importing the necessary packages
+import os
+import time
+
+import requests
+
+from .client import DEFAULT_TIMEOUT, get_client, raise_for_errors
+
+BULK_POLL_INTERVAL = 5      # Seconds between two checks of a running bulk operation
+
+RUN_BULK_QUERY_MUTATION = """
+mutation runBulkQuery($query: String!) {
+    bulkOperationRunQuery(query: $query) {
+        bulkOperation {
+            id
+            status
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+RUN_BULK_MUTATION_MUTATION = """
+mutation runBulkMutation($mutation: String!, $stagedUploadPath: String!) {
+    bulkOperationRunMutation(mutation: $mutation, stagedUploadPath: $stagedUploadPath) {
+        bulkOperation {
+            id
+            status
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+BULK_OPERATION_QUERY = """
+query bulkOperation($id: ID!) {
+    node(id: $id) {
+        ... on BulkOperation {
+            id
+            status
+            errorCode
+            objectCount
+            url                 # Result file
+            partialDataUrl      # Results processed before a failure, if any
+        }
+    }
+}
+"""
+
+STAGED_UPLOAD_MUTATION = """
+mutation stagedUpload($input: [StagedUploadInput!]!) {
+    stagedUploadsCreate(input: $input) {
+        stagedTargets {
+            url                 # Where the file has to be uploaded
+            resourceUrl
+            parameters {        # Form fields that have to be sent along with the file
+                name
+                value
+            }
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to poll a bulk operation until Shopify has finished it
+def wait_for_bulk_operation(operation_id, client=None):
+    """
+    Returns the BulkOperation once its status is COMPLETED, FAILED, CANCELED or EXPIRED.
+    """
+    client = get_client(client)
+    while True:
+        operation = client.execute(BULK_OPERATION_QUERY, {"id": operation_id}, cost=1)["data"]["node"]
+        if operation["status"] in ("COMPLETED", "FAILED", "CANCELED", "EXPIRED"):
+            return operation
+        time.sleep(BULK_POLL_INTERVAL)
+
+
+# Function to run a bulk query and stream the rows of its JSONL result
+def run_bulk_query(bulk_query, client=None):
+    """
+    Starts bulkOperationRunQuery, waits for it and yields every line of the result.
+    Rows of nested connections reference their parent through "__parentId".
+    """
+    client = get_client(client)
+    data = raise_for_errors(client.execute(RUN_BULK_QUERY_MUTATION, {"query": bulk_query}), "Bulk query")
+    result = data["data"]["bulkOperationRunQuery"]
+    if result["userErrors"]:
+        raise RuntimeError(f"Bulk operation could not be started: {result['userErrors']}")
+
+    operation = wait_for_bulk_operation(result["bulkOperation"]["id"], client=client)
+    if operation["status"] != "COMPLETED":
+        raise RuntimeError(f"Bulk operation {operation['id']} ended as {operation['status']}: "
+                           f"{operation['errorCode']}")
+    if operation["url"]:
+        yield from client.stream_jsonl(operation["url"])
+
+
+# Function to reserve a staged upload target for a bulk mutation variables file
+def create_staged_upload(filename, client=None):
+    variables = {
+        "input": [{
+            "resource": "BULK_MUTATION_VARIABLES",
+            "filename": filename,
+            "mimeType": "text/jsonl",
+            "httpMethod": "POST",
+        }]
+    }
+    data = raise_for_errors(get_client(client).execute(STAGED_UPLOAD_MUTATION, variables), "Staged upload")
+    result = data["data"]["stagedUploadsCreate"]
+    if result["userErrors"]:
+        raise RuntimeError(f"Staged upload could not be created: {result['userErrors']}")
+    return result["stagedTargets"][0]
+
+
+# Function to upload a file to a staged upload target
+def upload_staged_file(target, jsonl_path, timeout=DEFAULT_TIMEOUT):
+    """
+    Uploads the file as a multipart form to target["url"] with the target's parameters and
+    returns the staged upload path (the "key" parameter) for bulkOperationRunMutation.
+    Any server accepting a multipart POST can stand in for the target, e.g. a local stub.
+    """
+    form_fields = {parameter["name"]: parameter["value"] for parameter in target["parameters"]}
+    with open(jsonl_path, "rb") as jsonl_file:
+        # The Shopify token must not be sent to the storage provider, so a plain request is used
+        response = requests.post(
+            target["url"],
+            data=form_fields,
+            files={"file": (os.path.basename(jsonl_path), jsonl_file, "text/jsonl")},
+            timeout=timeout,
+        )
+    response.raise_for_status()
+    return form_fields["key"]
+
+
+# Function to run a bulk mutation over a variables file
+def run_bulk_mutation(mutation, jsonl_path, client=None):
+    """
+    Uploads the variables file, starts bulkOperationRunMutation with `mutation` and waits for it.
+    Returns the finished BulkOperation.
+    """
+    client = get_client(client)
+    target = create_staged_upload(os.path.basename(jsonl_path), client=client)
+    staged_upload_path = upload_staged_file(target, jsonl_path)
+
+    variables = {"mutation": mutation, "stagedUploadPath": staged_upload_path}
+    data = raise_for_errors(client.execute(RUN_BULK_MUTATION_MUTATION, variables), "Bulk mutation")
+    result = data["data"]["bulkOperationRunMutation"]
+    if result["userErrors"]:
+        raise RuntimeError(f"Bulk mutation could not be started: {result['userErrors']}")
+    return wait_for_bulk_operation(result["bulkOperation"]["id"], client=client)
@@ -0,0 +1,238 @@
+"""
+Record-and-replay cassettes of GraphQL exchanges for offline runs and benchmarks.
+
+A RecordingClient wraps a ShopifyClient and stores every request and its response in a cassette,
+a SQLite file. A ReplayClient serves the same requests from the cassette without any network
+access, so production incidents can be reproduced and parsing or rendering code benchmarked
+deterministically. Both clients can be passed to any operation as `client=`, or installed as the
+default client with use_cassette():
+
+    from shopify_graphql.cassettes import use_cassette
+    from shopify_graphql.orders import retrieve_order
+
+    with use_cassette("incident.db", mode="replay"):
+        order = retrieve_order("gid://shopify/Order/6166080454893")
+
+Exchanges are keyed by the operation name, a digest of the query text (several modules share
+names such as getOrder) and the variables. `first` is left out of the key, so paginations whose
+page size was tuned at runtime replay page by page. A key recorded several times, such as the
+reads before and after an update, replays its responses in the recorded order. Responses are
+stored zlib-compressed and deduplicated by digest.
+"""
+
+# Importing the necessary packages
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+from .client import get_client, set_default_client
+
+OPERATION_NAME = re.compile(r"^\s*(?:query|mutation|subscription)\s+(\w+)")
+UNKEYED_VARIABLES = ("first",)      # Left out of the key, see the module docstring
+JSONL_OPERATION = "jsonl"           # Operation name of recorded JSONL downloads, keyed by URL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bodies (
+    digest TEXT PRIMARY KEY,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exchanges (
+    operation TEXT NOT NULL,
+    query_digest TEXT NOT NULL,
+    variables TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    digest TEXT NOT NULL REFERENCES bodies (digest),
+    seconds REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (operation, query_digest, variables, sequence)
+);
+"""
+
+
+class CassetteMiss(LookupError):
+    """
+    Raised when a replayed request was not recorded in the cassette.
+    """
+
+
+# Function to get the name of the operation of a query, e.g. getOrder
+def operation_name(query):
+    match = OPERATION_NAME.match(query)
+    return match.group(1) if match else "anonymous"
+
+
+# Function to build the key an exchange is stored under
+def exchange_key(query, variables):
+    variables = {name: value for name, value in (variables or {}).items() if name not in UNKEYED_VARIABLES}
+    return (
+        operation_name(query),
+        hashlib.sha1(query.encode("utf-8")).hexdigest()[:16],
+        json.dumps(variables, sort_keys=True, separators=(",", ":"), default=str),
+    )
+
+
+class Cassette:
+    """
+    A SQLite file holding recorded exchanges. It can be shared by the threads of one process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.positions = {}         # Next sequence to replay per key
+        self.rerecorded = set()     # Keys whose older recordings were dropped by this session
+
+    # Function to store the response of a request
+    def record(self, key, response, seconds=0.0):
+        """
+        Appends `response` to the responses of `key`. The first time a key is recorded through
+        this Cassette object, the responses recorded for it by earlier sessions are dropped.
+        """
+        body = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"), 9)
+        digest = hashlib.sha1(body).hexdigest()
+        with self.lock, self.connection:
+            if key not in self.rerecorded:
+                self.connection.execute(
+                    "DELETE FROM exchanges WHERE operation = ? AND query_digest = ? AND variables = ?", key
+                )
+                self.rerecorded.add(key)
+            sequence = self.connection.execute(
+                "SELECT COALESCE(MAX(sequence) + 1, 0) FROM exchanges "
+                "WHERE operation = ? AND query_digest = ? AND variables = ?", key
+            ).fetchone()[0]
+            self.connection.execute("INSERT OR IGNORE INTO bodies (digest, body) VALUES (?, ?)", (digest, body))
+            self.connection.execute(
+                "INSERT INTO exchanges (operation, query_digest, variables, sequence, digest, seconds, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (*key, sequence, digest, seconds, time.time())
+            )
+
+    # Function to get the next recorded response of a request
+    def play(self, key):
+        """
+        Returns (response, seconds) for the next recorded response of `key`; once all of them
+        have been played, the last one is returned again. Raises CassetteMiss when the key was
+        never recorded.
+        """
+        with self.lock:
+            position = self.positions.get(key, 0)
+            row = self.connection.execute(
+                "SELECT bodies.body, exchanges.seconds, exchanges.sequence FROM exchanges "
+                "JOIN bodies ON bodies.digest = exchanges.digest "
+                "WHERE operation = ? AND query_digest = ? AND variables = ? AND sequence <= ? "
+                "ORDER BY sequence DESC LIMIT 1", (*key, position)
+            ).fetchone()
+            if row is None:
+                raise CassetteMiss(f"No recorded response for {key[0]} with variables {key[2]}")
+            self.positions[key] = row[2] + 1
+        return json.loads(zlib.decompress(row[0])), row[1]
+
+    # Function to rewind replay to the first recorded responses
+    def rewind(self):
+        with self.lock:
+            self.positions.clear()
+
+    def stats(self):
+        with self.lock:
+            exchanges, operations = self.connection.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT operation) FROM exchanges"
+            ).fetchone()
+            bodies, stored_bytes = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM bodies"
+            ).fetchone()
+        return {"exchanges": exchanges, "operations": operations, "responses": bodies, "stored_bytes": stored_bytes}
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class RecordingClient:
+    """
+    Sends requests through `client` and records every exchange in `cassette`. Everything else,
+    such as the throttle state, is the wrapped client's.
+    """
+
+    def __init__(self, client, cassette):
+        self.client = client
+        self.cassette = cassette
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def __repr__(self):
+        return f"RecordingClient({self.client!r}, cassette={self.cassette.path!r})"
+
+    def execute(self, query, variables=None, **options):
+        started = time.perf_counter()
+        data = self.client.execute(query, variables, **options)
+        self.cassette.record(exchange_key(query, variables), data, time.perf_counter() - started)
+        return data
+
+    def stream_jsonl(self, url):
+        started = time.perf_counter()
+        lines = list(self.client.stream_jsonl(url))
+        self.cassette.record(exchange_key(JSONL_OPERATION, {"url": url}), lines, time.perf_counter() - started)
+        yield from lines
+
+
+class ReplayClient:
+    """
+    Answers requests from `cassette` without network access. With `latency=True` every response
+    is delayed by the time it took when it was recorded.
+    """
+
+    def __init__(self, cassette, shop="replay", latency=False):
+        self.cassette = cassette
+        self.shop = shop
+        self.latency = latency
+        self.api_version = None
+        self.throttle_state = {"available": None, "maximum": 1000.0, "restore_rate": 50.0, "updated_at": 0.0}
+        self.throttle_lock = threading.Lock()
+        self.page_size_tuners = {}
+
+    def __repr__(self):
+        return f"ReplayClient(cassette={self.cassette.path!r})"
+
+    def play(self, key):
+        data, seconds = self.cassette.play(key)
+        if self.latency:
+            time.sleep(seconds)
+        return data
+
+    def execute(self, query, variables=None, **options):
+        return self.play(exchange_key(query, variables))
+
+    def stream_jsonl(self, url):
+        yield from self.play(exchange_key(JSONL_OPERATION, {"url": url}))
+
+
+# Function to run operations against a cassette through the default client
+@contextmanager
+def use_cassette(path, mode="replay", client=None, latency=False):
+    """
+    Installs a RecordingClient (mode="record", wrapping `client` or the default client) or a
+    ReplayClient (mode="replay") as the default client for the duration of the block, and
+    yields it. The previous default client is restored afterwards.
+    """
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Unknown cassette mode: {mode!r}")
+    cassette = Cassette(path)
+    try:
+        if mode == "record":
+            cassette_client = RecordingClient(get_client(client), cassette)
+        else:
+            cassette_client = ReplayClient(cassette, latency=latency)
+        previous = set_default_client(cassette_client)
+        try:
+            yield cassette_client
+        finally:
+            set_default_client(previous)
+    finally:
+        cassette.close()
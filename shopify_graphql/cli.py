@@ -0,0 +1,545 @@
+"""
+Command line interface exposing the Shopify operations as subcommands, e.g.
+
+    shopify-graphql orders get gid://shopify/Order/6166080454893
+    shopify-graphql orders refund gid://shopify/Order/6188303286509 --note "Damaged in transit"
+    shopify-graphql products export --query "status:active" --output catalog.jsonl
+    shopify-graphql slips render gid://shopify/Order/6193832886509 gid://shopify/Order/6193832886510
+
+Every subcommand imports its operation module only when it runs, so quick commands do not pay for
+heavy dependencies such as ReportLab or NumPy, and commands accepting several IDs handle them all
+in one process over one connection.
+"""
+
+# Importing the necessary packages
+import argparse
+import json
+import os
+import sys
+
+
+# Function to set up the default client from the command line options
+def configure_client(args):
+    from .client import DEFAULT_API_VERSION, configure
+
+    if not args.shop or not args.access_token:
+        sys.exit("The store and access token are required: pass --shop and --access-token "
+                 "or set SHOPIFY_STORE and SHOPIFY_ACCESS_TOKEN")
+    configure(args.shop, args.access_token, args.api_version or DEFAULT_API_VERSION, http2=args.http2)
+
+
+# Function to run an operation once per ID and return one result or a list of results
+def for_each(ids, operation):
+    results = [operation(item_id) for item_id in ids]
+    return results[0] if len(results) == 1 else results
+
+
+# Function to write records as JSON lines to a file or standard output
+def write_json_lines(records, output_path):
+    output = open(output_path, "w", encoding="utf-8") if output_path else sys.stdout
+    try:
+        count = 0
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return {"exported": count} if output_path else None
+
+
+# Orders
+def orders_get(args):
+    if args.fields:
+        from .selections import fetch_node
+        return for_each(args.order_ids, lambda order_id: fetch_node("order", order_id, args.fields))
+    from .orders import retrieve_order
+    return for_each(args.order_ids, retrieve_order)
+
+
+def orders_export(args):
+    from .orders import iter_orders
+    return write_json_lines(iter_orders(args.query, args.line_items, page_size=args.page_size), args.output)
+
+
+def orders_export_parquet(args):
+    from .export import export_orders
+    return export_orders(args.output, args.line_items_output, args.query, use_bulk=args.bulk)
+
+
+def orders_create(args):
+    from .orders import create_order
+    with open(args.order_file, encoding="utf-8") as order_file:
+        order = json.load(order_file)
+    return create_order(order["line_items"], order["customer_details"], order["billing_address"],
+                        order["shipping_address"])
+
+
+def orders_update(args):
+    from .orders import update_order
+    if args.tags is None and args.note is None:
+        sys.exit("Nothing to update: pass --tags and/or --note")
+    return update_order(args.order_id, args.tags, args.note)
+
+
+def orders_tag(args):
+    from .order_tagging import tag_orders
+    return tag_orders(args.query, args.add, args.remove, dry_run=not args.yes, max_workers=args.max_workers,
+                      progress_path=args.progress)
+
+
+def orders_fulfill(args):
+    from .fulfillments import fulfill_order_items
+    return for_each(args.order_ids, lambda order_id: fulfill_order_items(
+        order_id, args.tracking_number, args.tracking_url))
+
+
+def orders_refund(args):
+    from .refunds import refund_order_items
+    return for_each(args.order_ids, lambda order_id: refund_order_items(order_id, note=args.note))
+
+
+# Products
+def products_get(args):
+    if args.fields:
+        from .selections import fetch_node
+        return for_each(args.product_ids, lambda product_id: fetch_node("product", product_id, args.fields))
+    from .products import retrieve_product
+    return for_each(args.product_ids, retrieve_product)
+
+
+def products_export(args):
+    from .products import iter_products
+    return write_json_lines(iter_products(args.query, page_size=args.page_size), args.output)
+
+
+def products_export_parquet(args):
+    from .export import export_catalog
+    return export_catalog(args.output, args.query, use_bulk=args.bulk)
+
+
+def products_create(args):
+    from .products import create_product
+    return create_product(args.title, args.description)
+
+
+def products_update(args):
+    from .products import update_product
+    return update_product(args.product_id, args.title, args.description)
+
+
+def products_delete(args):
+    from .products import delete_product
+    return for_each(args.product_ids, delete_product)
+
+
+def products_bulk_create(args):
+    from .product_import import bulk_create_products
+    return bulk_create_products(args.definitions_file, args.results)
+
+
+def products_bulk_delete(args):
+    from .products import bulk_delete_products
+    product_ids = None
+    if args.ids_file:
+        with open(args.ids_file, encoding="utf-8") as ids_file:
+            product_ids = [line.strip() for line in ids_file if line.strip()]
+    return bulk_delete_products(product_ids, args.query, dry_run=not args.yes)
+
+
+def products_sync(args):
+    from .product_sync import sync_products
+    return sync_products(args.desired_file, args.cache, refresh=args.refresh, dry_run=args.dry_run)
+
+
+# Variants
+def variants_get(args):
+    from .variants import retrieve_product_variants
+    return for_each(args.product_ids, retrieve_product_variants)
+
+
+def variants_create(args):
+    from .variants import create_variant
+    return create_variant(args.product_id, args.sku, args.price, args.title, option_name=args.option_name)
+
+
+def variants_bulk_create(args):
+    from .variants import bulk_create_variants, process_variants, read_variants_by_product, summarize, \
+        variant_create_input
+    variants = read_variants_by_product(args.csv_file, variant_create_input)
+    return summarize(process_variants(variants, bulk_create_variants))
+
+
+def variants_bulk_update(args):
+    from .variants import bulk_update_variants, process_variants, read_variants_by_product, summarize, \
+        variant_update_input
+    variants = read_variants_by_product(args.csv_file, variant_update_input)
+    return summarize(process_variants(variants, bulk_update_variants))
+
+
+def variants_reprice(args):
+    from .repricing import load_prices_from_csv, load_prices_from_shopify, reprice_variants
+    with open(args.rules, encoding="utf-8") as rules_file:
+        rules = json.load(rules_file)
+    arrays = load_prices_from_csv(args.csv) if args.csv else load_prices_from_shopify(args.query)
+    return reprice_variants(arrays, rules, dry_run=not args.apply)
+
+
+# Metafields
+def metafields_get(args):
+    from .metafields import retrieve_all_product_metafields, retrieve_metafields_by_key
+    if args.key:
+        identifiers = [tuple(identifier.split(".", 1)) for identifier in args.key]
+        results = retrieve_metafields_by_key([args.product_id], identifiers)
+        metafields = results.get(args.product_id, {})
+    else:
+        metafields = retrieve_all_product_metafields(args.product_id)
+    return {f"{namespace}.{key}": metafield for (namespace, key), metafield in metafields.items()}
+
+
+def metafields_set(args):
+    from .metafields import set_metafield
+    return set_metafield(args.owner_id, args.namespace, args.key, args.value, args.type)
+
+
+def metafields_delete(args):
+    from .metafields import delete_product_metafield
+    return for_each(args.metafield_ids, delete_product_metafield)
+
+
+def metafields_bulk_set(args):
+    from .metafields import bulk_set_metafields, read_metafield_rows
+    summary = bulk_set_metafields(read_metafield_rows(args.csv_file))
+    return {
+        "batches": summary["batches"],
+        "written": len(summary["written"]),
+        "failed": [{"row": row._asdict(), "errors": messages} for row, messages in summary["failed"]],
+    }
+
+
+def metafields_purge(args):
+    from .metafields import purge_metafields
+    return purge_metafields(args.namespace, args.key_pattern, args.query, use_bulk=args.bulk, dry_run=not args.yes)
+
+
+def metafields_sync(args):
+    from .metafield_sync import sync_metafields
+    return sync_metafields(args.desired_file, args.cache, prune=args.prune, refresh=args.refresh,
+                           dry_run=args.dry_run)
+
+
+# Packing slips
+def slips_render(args):
+    from .packing_slips import render_packing_slip
+    return for_each(args.order_ids, lambda order_id: {
+        "order_id": order_id,
+        "file": render_packing_slip(order_id, store_name=args.store_name, output_dir=args.output_dir),
+    })
+
+
+# Daemon
+def serve(args):
+    from .daemon import serve as serve_daemon
+    serve_daemon(args.host, args.port, cache_ttl=args.cache_ttl, verbose=args.verbose)
+
+
+# Multiple stores
+def shops_run(args):
+    from .shops import create_clients, load_shop_registry, run_operation_across_shops
+    clients = create_clients(load_shop_registry(args.registry), http2=args.http2)
+    shop_arguments = None
+    if args.shop_args:
+        with open(args.shop_args, encoding="utf-8") as shop_args_file:
+            shop_arguments = json.load(shop_args_file)
+    return run_operation_across_shops(args.operation, json.loads(args.args), clients, max_workers=args.max_workers,
+                                      shop_arguments=shop_arguments)
+
+
+def shops_export_products(args):
+    from .shops import create_clients, export_products_across_shops, load_shop_registry
+    clients = create_clients(load_shop_registry(args.registry), http2=args.http2)
+    return export_products_across_shops(clients, args.output_dir, args.query, max_workers=args.max_workers)
+
+
+# Jobs
+def jobs_enqueue(args):
+    from .jobs import JobQueue
+    job_id = JobQueue(args.queue).enqueue(args.operation, json.loads(args.args), priority=args.priority,
+                                          max_attempts=args.max_attempts)
+    return {"job_id": job_id}
+
+
+def jobs_work(args):
+    from .jobs import run_workers
+    return run_workers(args.queue, workers=args.workers, stop_when_empty=args.until_empty)
+
+
+def jobs_status(args):
+    from .jobs import JobQueue
+    return JobQueue(args.queue).counts()
+
+
+def jobs_dead(args):
+    from .jobs import JobQueue
+    return JobQueue(args.queue).dead_jobs(args.limit)
+
+
+def jobs_requeue(args):
+    from .jobs import JobQueue
+    return {"requeued": JobQueue(args.queue).requeue_dead(args.job_ids or None)}
+
+
+# Query cost
+def read_query(args):
+    with open(args.query_file, encoding="utf-8") as query_file:
+        return query_file.read()
+
+
+def cost_estimate(args):
+    from .cost import explain_query_cost
+    return explain_query_cost(read_query(args), json.loads(args.variables), args.operation_name)
+
+
+def cost_optimize(args):
+    from .cost import optimize_page_sizes
+    minimums = {}
+    for page_variable in args.page_variable or ["first"]:
+        name, _, minimum = page_variable.partition("=")
+        minimums[name] = int(minimum or 1)
+    return optimize_page_sizes(read_query(args), minimums, json.loads(args.variables), ceiling=args.ceiling)
+
+
+# Function to build the argument parser with all the subcommands
+def build_parser():
+    parser = argparse.ArgumentParser(prog="shopify-graphql", description="Shopify Admin GraphQL operations")
+    parser.add_argument("--shop", default=os.environ.get("SHOPIFY_STORE"),
+                        help="Store domain, e.g. your-store.myshopify.com (default: $SHOPIFY_STORE)")
+    parser.add_argument("--access-token", default=os.environ.get("SHOPIFY_ACCESS_TOKEN"),
+                        help="Admin API access token (default: $SHOPIFY_ACCESS_TOKEN)")
+    parser.add_argument("--api-version", default=os.environ.get("SHOPIFY_API_VERSION"),
+                        help="Admin API version (default: $SHOPIFY_API_VERSION or the library default)")
+    parser.add_argument("--http2", action="store_true",
+                        help="Multiplex the requests over one compressed HTTP/2 connection (needs httpx[http2])")
+    parser.add_argument("--transfer-stats", action="store_true",
+                        help="Print the response bytes on the wire and after decompression to stderr")
+    parser.add_argument("--cassette", help="Cassette file to record the requests to or replay them from")
+    parser.add_argument("--cassette-mode", choices=["record", "replay"], default="replay",
+                        help="Record the requests of this run or replay them without network (default: replay)")
+    groups = parser.add_subparsers(dest="group", metavar="GROUP", required=True)
+
+    def command(group, name, handler, help_text):
+        subparser = group.add_parser(name, help=help_text)
+        subparser.set_defaults(handler=handler)
+        return subparser
+
+    # orders
+    orders = groups.add_parser("orders", help="Create, retrieve, update, fulfill and refund orders")
+    orders = orders.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    orders_get_parser = command(orders, "get", orders_get, "Retrieve orders")
+    orders_get_parser.add_argument("order_ids", nargs="+")
+    orders_get_parser.add_argument("--fields", nargs="+",
+                                   help="Select only these fields, e.g. name shippingAddress.city lineItems.sku")
+    orders_export_parser = command(orders, "export", orders_export, "Export orders as JSON lines")
+    orders_export_parser.add_argument("--query", help="Shopify search query selecting the orders")
+    orders_export_parser.add_argument("--line-items", type=int, default=10, help="Line items per order (default: 10)")
+    orders_export_parser.add_argument("--page-size", type=int, help="Orders per page (default: adapted while running)")
+    orders_export_parser.add_argument("--output", help="File to write to (default: standard output)")
+    orders_parquet = command(orders, "export-parquet", orders_export_parquet,
+                             "Export orders and their line items to Parquet files")
+    orders_parquet.add_argument("--output", default="orders.parquet")
+    orders_parquet.add_argument("--line-items-output", default="order_line_items.parquet")
+    orders_parquet.add_argument("--query", help="Shopify search query selecting the orders")
+    orders_parquet.add_argument("--bulk", action="store_true", help="Read the orders with a bulk operation")
+    command(orders, "create", orders_create, "Create an order from a JSON file").add_argument("order_file")
+    tag = command(orders, "tag", orders_tag, "Add or remove tags on every matching order (dry run unless --yes)")
+    tag.add_argument("--query", required=True, help="Shopify search query selecting the orders")
+    tag.add_argument("--add", nargs="+", default=[], help="Tags to add")
+    tag.add_argument("--remove", nargs="+", default=[], help="Tags to remove")
+    tag.add_argument("--progress", help="Progress file; rerunning with it skips the orders already tagged")
+    tag.add_argument("--max-workers", type=int, default=8)
+    tag.add_argument("--yes", action="store_true", help="Really change the tags")
+    update = command(orders, "update", orders_update, "Replace the tags and/or note of an order")
+    update.add_argument("order_id")
+    update.add_argument("--tags", nargs="*", help="Tags replacing all tags of the order; left unchanged if omitted")
+    update.add_argument("--note", help="Note replacing the note of the order; left unchanged if omitted")
+    fulfill = command(orders, "fulfill", orders_fulfill, "Fulfill all line items of orders")
+    fulfill.add_argument("order_ids", nargs="+")
+    fulfill.add_argument("--tracking-number")
+    fulfill.add_argument("--tracking-url")
+    refund = command(orders, "refund", orders_refund, "Refund one unit of every line item of orders")
+    refund.add_argument("order_ids", nargs="+")
+    refund.add_argument("--note")
+
+    # products
+    products = groups.add_parser("products", help="Create, retrieve, export, update and delete products")
+    products = products.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    products_get_parser = command(products, "get", products_get, "Retrieve products")
+    products_get_parser.add_argument("product_ids", nargs="+")
+    products_get_parser.add_argument("--fields", nargs="+", help="Select only these fields, e.g. title handle status")
+    export = command(products, "export", products_export, "Export all products as JSON lines")
+    export.add_argument("--query", help="Shopify search query selecting the products")
+    export.add_argument("--page-size", type=int, help="Products per page (default: adapted while running)")
+    export.add_argument("--output", help="File to write to (default: standard output)")
+    products_parquet = command(products, "export-parquet", products_export_parquet,
+                               "Export the catalog, one row per variant, to a Parquet file")
+    products_parquet.add_argument("--output", default="catalog.parquet")
+    products_parquet.add_argument("--query", help="Shopify search query selecting the products")
+    products_parquet.add_argument("--bulk", action="store_true", help="Read the products with a bulk operation")
+    create = command(products, "create", products_create, "Create a product")
+    create.add_argument("--title", required=True)
+    create.add_argument("--description", default="")
+    product_update = command(products, "update", products_update, "Update the title and description of a product")
+    product_update.add_argument("product_id")
+    product_update.add_argument("--title", required=True)
+    product_update.add_argument("--description", required=True)
+    command(products, "delete", products_delete, "Delete products").add_argument("product_ids", nargs="+")
+    bulk_create = command(products, "bulk-create", products_bulk_create, "Create products from a JSONL or CSV file")
+    bulk_create.add_argument("definitions_file")
+    bulk_create.add_argument("--results", required=True, help="CSV file receiving one result row per input row")
+    bulk_delete = command(products, "bulk-delete", products_bulk_delete,
+                          "Delete many products (dry run unless --yes is given)")
+    selection = bulk_delete.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--ids-file", help="File with one product GID per line")
+    selection.add_argument("--query", help="Shopify search query selecting the products")
+    bulk_delete.add_argument("--yes", action="store_true", help="Really delete the products")
+    product_sync = command(products, "sync", products_sync, "Update only the changed product fields from a file")
+    product_sync.add_argument("desired_file")
+    product_sync.add_argument("--cache", required=True)
+    product_sync.add_argument("--refresh", action="store_true")
+    product_sync.add_argument("--dry-run", action="store_true")
+
+    # variants
+    variants = groups.add_parser("variants", help="Retrieve, create, update and reprice variants")
+    variants = variants.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    command(variants, "get", variants_get, "Retrieve the variants of products").add_argument("product_ids", nargs="+")
+    variant_create = command(variants, "create", variants_create, "Create a variant")
+    variant_create.add_argument("product_id")
+    variant_create.add_argument("--sku", required=True)
+    variant_create.add_argument("--price", required=True)
+    variant_create.add_argument("--title", required=True, help="Value of the variant's option")
+    variant_create.add_argument("--option-name", default="Title")
+    command(variants, "bulk-create", variants_bulk_create, "Create variants from a CSV file").add_argument("csv_file")
+    command(variants, "bulk-update", variants_bulk_update, "Update variants from a CSV file").add_argument("csv_file")
+    reprice = command(variants, "reprice", variants_reprice, "Reprice variants (dry run unless --apply is given)")
+    reprice.add_argument("--rules", required=True, help="JSON file with the list of price rules")
+    source = reprice.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="Catalog export with product_id, variant_id and price columns")
+    source.add_argument("--query", help="Shopify search query selecting the variants")
+    reprice.add_argument("--apply", action="store_true", help="Send the changed prices to Shopify")
+
+    # metafields
+    metafields = groups.add_parser("metafields", help="Look up, set, delete, purge and sync metafields")
+    metafields = metafields.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    metafield_get = command(metafields, "get", metafields_get, "List a product's metafields")
+    metafield_get.add_argument("product_id")
+    metafield_get.add_argument("--key", action="append", help="namespace.key to look up directly (repeatable)")
+    metafield_set = command(metafields, "set", metafields_set, "Create or update a metafield")
+    for argument in ("owner_id", "namespace", "key", "value"):
+        metafield_set.add_argument(argument)
+    metafield_set.add_argument("--type", default="single_line_text_field")
+    command(metafields, "delete", metafields_delete, "Delete metafields by ID").add_argument("metafield_ids", nargs="+")
+    command(metafields, "bulk-set", metafields_bulk_set, "Set metafields from a CSV file").add_argument("csv_file")
+    purge = command(metafields, "purge", metafields_purge,
+                    "Delete a namespace's metafields from all products (dry run unless --yes is given)")
+    purge.add_argument("namespace")
+    purge.add_argument("--key-pattern", default="*")
+    purge.add_argument("--query", help="Shopify search query selecting the products")
+    purge.add_argument("--bulk", action="store_true", help="Discover the metafields with a bulk operation")
+    purge.add_argument("--yes", action="store_true", help="Really delete the metafields")
+    metafield_sync = command(metafields, "sync", metafields_sync, "Sync metafields from a desired-state file")
+    metafield_sync.add_argument("desired_file")
+    metafield_sync.add_argument("--cache", required=True)
+    metafield_sync.add_argument("--prune", action="store_true")
+    metafield_sync.add_argument("--refresh", action="store_true")
+    metafield_sync.add_argument("--dry-run", action="store_true")
+
+    # packing slips
+    slips = groups.add_parser("slips", help="Render packing slips")
+    slips = slips.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    render = command(slips, "render", slips_render, "Render packing slip PDFs for orders")
+    render.add_argument("order_ids", nargs="+")
+    render.add_argument("--store-name", default="<your_store_name>")
+    render.add_argument("--output-dir", default=".")
+
+    # daemon
+    daemon = groups.add_parser("serve", help="Run a local HTTP/JSON service keeping the connection and caches warm")
+    daemon.set_defaults(handler=serve)
+    daemon.add_argument("--host", default="127.0.0.1")
+    daemon.add_argument("--port", type=int, default=8765)
+    daemon.add_argument("--cache-ttl", type=float, default=30, help="Seconds read results are cached (0 disables)")
+    daemon.add_argument("--verbose", action="store_true", help="Log every request")
+
+    # query cost
+    cost = groups.add_parser("cost", help="Estimate query costs and choose page sizes offline")
+    cost.set_defaults(needs_client=False)
+    cost = cost.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    estimate = command(cost, "estimate", cost_estimate, "Estimate the requestedQueryCost of a query")
+    estimate.add_argument("--operation-name", help="Operation to estimate when the file holds several")
+    optimize = command(cost, "optimize", cost_optimize, "Choose the page sizes requesting the most nodes")
+    optimize.add_argument("--page-variable", action="append",
+                          help="Page size variable, optionally with its minimum, e.g. first or variantsFirst=10 "
+                               "(repeatable, outermost connection first; default: first)")
+    optimize.add_argument("--ceiling", type=int, default=1000, help="Highest acceptable cost (default: 1000)")
+    for cost_command in (estimate, optimize):
+        cost_command.add_argument("query_file", help="File holding the GraphQL document")
+        cost_command.add_argument("--variables", default="{}", help="JSON object of the query's variables")
+
+    # multiple stores
+    shops = groups.add_parser("shops", help="Run operations across all the stores of a shop registry")
+    shops.set_defaults(needs_client=False)
+    shops = shops.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    shops_run_parser = command(shops, "run", shops_run, "Run a registered operation on every store")
+    shops_run_parser.add_argument("operation", help="Operation name, e.g. orders.get or metafields.set")
+    shops_run_parser.add_argument("--args", default="{}", help="JSON object of the arguments shared by all stores")
+    shops_run_parser.add_argument("--shop-args", help="JSON file mapping shop names to the arguments of that store")
+    shops_export = command(shops, "export-products", shops_export_products,
+                           "Export the products of every store into one JSONL file per store")
+    shops_export.add_argument("--output-dir", required=True)
+    shops_export.add_argument("--query", help="Shopify search query selecting the products")
+    for shops_command in (shops_run_parser, shops_export):
+        shops_command.add_argument("--registry", required=True, help="JSON or CSV file listing the stores")
+        shops_command.add_argument("--max-workers", type=int, help="Stores processed at once (default: all)")
+
+    # jobs
+    jobs = groups.add_parser("jobs", help="Queue operations in a local job queue and run them with workers")
+    jobs.add_argument("--queue", default="jobs.db", help="SQLite file of the job queue (default: jobs.db)")
+    jobs.set_defaults(needs_client=False)
+    jobs = jobs.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    enqueue = command(jobs, "enqueue", jobs_enqueue, "Queue a registered operation")
+    enqueue.add_argument("operation", help="Operation name, e.g. orders.fulfill or products.delete")
+    enqueue.add_argument("--args", default="{}", help="JSON object of the operation's arguments")
+    enqueue.add_argument("--priority", type=int, default=0, help="Jobs with a higher priority run first")
+    enqueue.add_argument("--max-attempts", type=int, default=5)
+    work = command(jobs, "work", jobs_work, "Run the queued jobs with a pool of workers")
+    work.add_argument("--workers", type=int, default=4)
+    work.add_argument("--until-empty", action="store_true", help="Stop once no job is queued or running")
+    work.set_defaults(needs_client=True)
+    command(jobs, "status", jobs_status, "Count the jobs by status")
+    command(jobs, "dead", jobs_dead, "List the dead-lettered jobs").add_argument("--limit", type=int, default=100)
+    command(jobs, "requeue", jobs_requeue, "Requeue dead-lettered jobs (all unless IDs are given)").add_argument(
+        "job_ids", nargs="*", type=int)
+    return parser
+
+
+# Function to run the command line interface
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    replaying = args.cassette and args.cassette_mode == "replay"
+    if getattr(args, "needs_client", True) and not replaying:
+        configure_client(args)
+    if args.cassette:
+        from .cassettes import use_cassette
+        with use_cassette(args.cassette, args.cassette_mode):
+            result = args.handler(args)
+    else:
+        result = args.handler(args)
+    if result is not None:
+        print(json.dumps(result, indent=2, default=str))
+    if args.transfer_stats and not replaying:
+        from .client import get_client
+        print(json.dumps(get_client().transfer_summary()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
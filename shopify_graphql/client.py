@@ -0,0 +1,271 @@
+"""
+Shopify Admin GraphQL client shared by all the operation modules.
+
+A ShopifyClient keeps one HTTP session (and so one pooled connection) per shop and tracks the
+query cost budget Shopify reports with every response, so concurrent callers are paced instead of
+being throttled, and identical reads sent concurrently share one request. Operations use the default
+client unless they are given one explicitly; the default client is configured from the SHOPIFY_STORE,
+SHOPIFY_ACCESS_TOKEN and SHOPIFY_API_VERSION environment variables or with configure().
+"""
+
+# Importing the necessary packages
+import copy
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+DEFAULT_API_VERSION = "2025-01"  # orderCreate is available from 2024-10 onwards
+DEFAULT_COST = 10           # Assumed cost of a request when the caller does not know it
+DEFAULT_TIMEOUT = 60.0      # Seconds to wait for a connection, or for the next bytes of a response
+WRITE_OPERATION = re.compile(r"^\s*(?:mutation|subscription)\b")
+
+
+class Flight:
+    """
+    A read in progress that identical concurrent reads wait for instead of sending their own.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+class ShopifyClient:
+    """
+    Sends GraphQL requests to one Shopify store over a persistent session.
+    """
+
+    def __init__(self, shop, access_token, api_version=DEFAULT_API_VERSION, max_retries=5, single_flight=True,
+                 timeout=DEFAULT_TIMEOUT):
+        self.shop = shop
+        self.api_version = api_version
+        self.graphql_url = f"https://{shop}/admin/api/{api_version}/graphql.json"
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"X-Shopify-Access-Token": access_token, "Content-Type": "application/json",
+                                     "Accept-Encoding": ACCEPT_ENCODING})
+
+        # Latest throttle status reported by Shopify, shared by all threads using this client
+        self.throttle_state = {"available": None, "maximum": 1000.0, "restore_rate": 50.0, "updated_at": 0.0}
+        self.throttle_lock = threading.Lock()
+
+        # Bytes of the GraphQL responses as transferred and after decompression
+        self.transfer_stats = {"responses": 0, "wire_bytes": 0, "decoded_bytes": 0}
+        self.transfer_lock = threading.Lock()
+
+        # Reads in progress, shared by identical concurrent reads (see execute)
+        self.single_flight = single_flight
+        self.flights = {}
+        self.flights_lock = threading.Lock()
+        self.coalesced_reads = 0
+
+        # Adaptive page sizes of the paginated queries run with this client (see pagination.py)
+        self.page_size_tuners = {}
+
+    def __repr__(self):
+        return f"ShopifyClient(shop={self.shop!r}, api_version={self.api_version!r})"
+
+    # Function to wait until the cost bucket holds enough points for the next request
+    def wait_for_budget(self, cost, reserve=None):
+        """
+        Blocks until Shopify's leaky bucket is expected to hold `cost` points and reserves them.
+        The estimate starts from the last reported throttleStatus and adds the restore rate over time.
+
+        Shopify only runs a query while its whole requested cost is available, but then refunds what
+        the query did not use. `reserve`, when given, is the part expected to be used; only that
+        much is taken from the estimate, so concurrent requests are not held back by points that
+        come back with the next throttleStatus.
+        """
+        state = self.throttle_state
+        while True:
+            with self.throttle_lock:
+                if state["available"] is None:
+                    return
+                now = time.monotonic()
+                refilled = (now - state["updated_at"]) * state["restore_rate"]
+                available = min(state["maximum"], state["available"] + refilled)
+                if available >= cost:
+                    state["available"] = available - (cost if reserve is None else min(reserve, cost))
+                    state["updated_at"] = now
+                    return
+                delay = (cost - available) / state["restore_rate"]
+            time.sleep(delay)
+
+    # Function to remember the throttle status returned with a response
+    def record_throttle_status(self, data):
+        status = data.get("extensions", {}).get("cost", {}).get("throttleStatus")
+        if status:
+            with self.throttle_lock:
+                self.throttle_state["available"] = float(status["currentlyAvailable"])
+                self.throttle_state["maximum"] = float(status["maximumAvailable"])
+                self.throttle_state["restore_rate"] = float(status["restoreRate"])
+                self.throttle_state["updated_at"] = time.monotonic()
+
+    # Function to get the number of bytes a response took on the wire, before decompression
+    def wire_bytes(self, response):
+        return response.raw.tell() if response.raw is not None else len(response.content)
+
+    # Function to count the bytes of a response
+    def record_transfer(self, response):
+        wire_bytes, decoded_bytes = self.wire_bytes(response), len(response.content)
+        with self.transfer_lock:
+            self.transfer_stats["responses"] += 1
+            self.transfer_stats["wire_bytes"] += wire_bytes
+            self.transfer_stats["decoded_bytes"] += decoded_bytes
+
+    # Function to report the bytes transferred so far and how much compression saved
+    def transfer_summary(self):
+        with self.transfer_lock:
+            stats = dict(self.transfer_stats)
+        stats["compression_ratio"] = stats["decoded_bytes"] / stats["wire_bytes"] if stats["wire_bytes"] else None
+        return stats
+
+    # Function to send a GraphQL request, sharing the response of identical reads in progress
+    def execute(self, query, variables=None, cost=DEFAULT_COST, reserve=None):
+        """
+        Sends a GraphQL request and returns the JSON response, including any "errors".
+        Throttled requests are retried after waiting for the bucket to refill.
+
+        A query sent while the same query with the same variables is already in progress on this
+        client waits for that request and gets a copy of its response, so concurrent jobs reading
+        the same order or product cost one request. Mutations are always sent. `reserve` is the
+        part of `cost` the request is expected to use (see wait_for_budget).
+        """
+        if not self.single_flight or WRITE_OPERATION.match(query):
+            return self.send(query, variables, cost, reserve)
+        key = (query, json.dumps(variables or {}, sort_keys=True, default=str))
+        with self.flights_lock:
+            flight = self.flights.get(key)
+            if flight is None:
+                leading, flight = True, self.flights.setdefault(key, Flight())
+            else:
+                leading = False
+                flight.followers += 1
+                self.coalesced_reads += 1
+        if not leading:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = self.send(query, variables, cost, reserve)
+        except Exception as error:
+            flight.error = error
+            raise
+        finally:
+            with self.flights_lock:
+                del self.flights[key]
+                followers = flight.followers
+            flight.done.set()
+        # The followers copy the response, so it must not change while they do
+        return copy.deepcopy(flight.result) if followers else flight.result
+
+    # Function to send one GraphQL request, retrying when Shopify throttles it
+    def send(self, query, variables=None, cost=DEFAULT_COST, reserve=None):
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_budget(cost, reserve)
+            response = self.session.post(self.graphql_url, json={"query": query, "variables": variables or {}},
+                                         timeout=self.timeout)
+            self.record_transfer(response)
+            if response.status_code == 429 and attempt < self.max_retries:
+                time.sleep(float(response.headers.get("Retry-After", 1)))
+                continue
+            data = response.json()
+            self.record_throttle_status(data)
+            throttled = any(
+                error.get("extensions", {}).get("code") == "THROTTLED" for error in data.get("errors", [])
+            )
+            if throttled and attempt < self.max_retries:
+                status = data["extensions"]["cost"]["throttleStatus"]
+                requested = data["extensions"]["cost"]["requestedQueryCost"]
+                time.sleep(max(requested - status["currentlyAvailable"], 1) / status["restoreRate"])
+                continue
+            return data
+        return data
+
+    # Function to stream a JSONL file, such as the result of a bulk operation
+    def stream_jsonl(self, url):
+        """
+        Yields the parsed lines of a JSONL file. The access token is not sent along, since
+        these files are served by Shopify's storage provider.
+        """
+        with self.session.get(url, stream=True, headers={"X-Shopify-Access-Token": None},
+                              timeout=self.timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+
+# The client used by operations that are not given one explicitly
+default_client = None
+default_client_lock = threading.Lock()
+
+
+# Function to set up the default client
+def configure(shop, access_token, api_version=DEFAULT_API_VERSION, http2=False, **options):
+    """
+    Replaces the default client with one for the given store and returns it. With http2=True
+    the client sends its requests over HTTP/2 (see shopify_graphql.http2).
+    """
+    global default_client
+    client_class = ShopifyClient
+    if http2:
+        from .http2 import Http2ShopifyClient as client_class
+    with default_client_lock:
+        default_client = client_class(shop, access_token, api_version, **options)
+    return default_client
+
+
+# Function to replace the default client with any client, returning the previous one
+def set_default_client(client):
+    """
+    Installs `client`, which may also be a wrapper such as the cassette clients, as the default
+    client. Passing None makes the next get_client() create one from the environment again.
+    """
+    global default_client
+    with default_client_lock:
+        previous, default_client = default_client, client
+    return previous
+
+
+# Function to get the default client, creating it from the environment on first use
+def get_client(client=None):
+    """
+    Returns `client` when one is given, otherwise the default client. The default client is
+    created from SHOPIFY_STORE, SHOPIFY_ACCESS_TOKEN and SHOPIFY_API_VERSION when configure()
+    has not been called.
+    """
+    global default_client
+    if client is not None:
+        return client
+    with default_client_lock:
+        if default_client is None:
+            try:
+                shop = os.environ["SHOPIFY_STORE"]
+                access_token = os.environ["SHOPIFY_ACCESS_TOKEN"]
+            except KeyError as error:
+                raise RuntimeError(
+                    f"{error.args[0]} is not set; call shopify_graphql.client.configure() "
+                    "or set SHOPIFY_STORE and SHOPIFY_ACCESS_TOKEN"
+                ) from None
+            default_client = ShopifyClient(
+                shop, access_token, os.environ.get("SHOPIFY_API_VERSION", DEFAULT_API_VERSION)
+            )
+        return default_client
+
+
+# Function to raise when a response carries top-level GraphQL errors
+def raise_for_errors(data, action):
+    if data.get("errors"):
+        raise RuntimeError(f"{action} failed: {data['errors']}")
+    return data
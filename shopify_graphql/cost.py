@@ -0,0 +1,379 @@
+"""
+Offline estimate of the requestedQueryCost Shopify calculates for a GraphQL document, and a
+page-size optimizer built on it.
+
+The estimate follows Shopify's cost rules without needing the schema:
+  - scalar and enum fields (fields without a selection set) cost 0
+  - object fields cost 1, pageInfo and __typename are free
+  - connections (fields with a first or last argument) cost 2 plus the cost of one node (1 plus
+    the cost of the node's own selection) weighted by the page size on a log2 scale: 1 for up to
+    2 nodes, 2 for up to 4, 4 for up to 16, 8 for up to 256. A product with metafields(first: 10)
+    thus costs 1 + 2 + 4 * 1 = 7, the requestedQueryCost Shopify reports for it, and 4 when two
+    metafields are returned, its actualQueryCost
+  - a mutation costs 10
+  - of inline fragments on different types only the most expensive one counts, since a node can
+    only be one of the types
+"""
+
+# Importing the necessary packages
+import re
+from functools import lru_cache
+from itertools import product as product_of
+
+MAX_QUERY_COST = 1000       # Maximum requested cost Shopify accepts for a single query
+MAX_PAGE_SIZE = 250         # Maximum value of first/last on a connection
+MUTATION_COST = 10
+FREE_FIELDS = {"pageInfo", "__typename"}
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<ignored>[\s,]+|\#[^\n]*)
+  | (?P<block_string>"""(?:\\"""|[^"]|"(?!""))*""")
+  | (?P<string>"(?:\\.|[^"\\\n])*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+  | (?P<spread>\.\.\.)
+  | (?P<punctuator>[!$&():=@\[\]{}|])
+''', re.VERBOSE)
+
+
+class Field:
+    def __init__(self, name, arguments, directives, selections):
+        self.name = name
+        self.arguments = arguments
+        self.directives = directives
+        self.selections = selections
+
+
+class FragmentSpread:
+    def __init__(self, name, directives):
+        self.name = name
+        self.directives = directives
+
+
+class InlineFragment:
+    def __init__(self, type_condition, directives, selections):
+        self.type_condition = type_condition
+        self.directives = directives
+        self.selections = selections
+
+
+class Variable:
+    def __init__(self, name):
+        self.name = name
+
+
+# Function to split a GraphQL document into (kind, value) tokens
+def tokenize(document):
+    tokens = []
+    position = 0
+    while position < len(document):
+        match = TOKEN_PATTERN.match(document, position)
+        if not match:
+            raise ValueError(f"Unexpected character {document[position]!r} at position {position}")
+        position = match.end()
+        if match.lastgroup != "ignored":
+            tokens.append((match.lastgroup, match.group()))
+    return tokens
+
+
+class Parser:
+    """
+    Parses the parts of a GraphQL document the cost estimate needs: operations, fragments,
+    fields with their arguments and directives, and fragment spreads.
+    """
+
+    def __init__(self, document):
+        self.tokens = tokenize(document)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, expected=None):
+        kind, value = self.peek()
+        if kind is None or (expected is not None and value != expected):
+            raise ValueError(f"Expected {expected or 'a token'} but found {value!r}")
+        self.position += 1
+        return value
+
+    def skip(self, value):
+        if self.peek()[1] == value:
+            self.position += 1
+            return True
+        return False
+
+    def parse_document(self):
+        operations, fragments = [], {}
+        while self.peek()[0] is not None:
+            if self.peek()[1] == "{":
+                operations.append(("query", None, self.parse_selection_set()))
+            elif self.peek()[1] == "fragment":
+                self.take()
+                name = self.take()
+                self.take("on")
+                type_condition = self.take()
+                self.parse_directives()
+                fragments[name] = InlineFragment(type_condition, {}, self.parse_selection_set())
+            else:
+                operation_type = self.take()
+                name = self.take() if self.peek()[0] == "name" else None
+                if self.skip("("):
+                    # Variable definitions do not change the cost
+                    depth = 1
+                    while depth:
+                        value = self.take()
+                        depth += {"(": 1, ")": -1}.get(value, 0)
+                self.parse_directives()
+                operations.append((operation_type, name, self.parse_selection_set()))
+        return operations, fragments
+
+    def parse_selection_set(self):
+        self.take("{")
+        selections = []
+        while not self.skip("}"):
+            if self.skip("..."):
+                if self.peek()[1] == "on":
+                    self.take()
+                    type_condition = self.take()
+                    selections.append(InlineFragment(type_condition, self.parse_directives(),
+                                                     self.parse_selection_set()))
+                elif self.peek()[1] in ("{", "@"):
+                    selections.append(InlineFragment(None, self.parse_directives(), self.parse_selection_set()))
+                else:
+                    selections.append(FragmentSpread(self.take(), self.parse_directives()))
+                continue
+            name = self.take()
+            if self.skip(":"):
+                name = self.take()      # The alias does not change the cost
+            arguments = self.parse_arguments()
+            directives = self.parse_directives()
+            field_selections = self.parse_selection_set() if self.peek()[1] == "{" else None
+            selections.append(Field(name, arguments, directives, field_selections))
+        return selections
+
+    def parse_arguments(self):
+        arguments = {}
+        if self.skip("("):
+            while not self.skip(")"):
+                name = self.take()
+                self.take(":")
+                arguments[name] = self.parse_value()
+        return arguments
+
+    def parse_directives(self):
+        directives = {}
+        while self.skip("@"):
+            name = self.take()
+            directives[name] = self.parse_arguments()
+        return directives
+
+    def parse_value(self):
+        kind, value = self.peek()
+        if self.skip("$"):
+            return Variable(self.take())
+        if self.skip("["):
+            values = []
+            while not self.skip("]"):
+                values.append(self.parse_value())
+            return values
+        if self.skip("{"):
+            fields = {}
+            while not self.skip("}"):
+                name = self.take()
+                self.take(":")
+                fields[name] = self.parse_value()
+            return fields
+        self.take()
+        if kind == "number":
+            return float(value) if any(c in value for c in ".eE") else int(value)
+        if kind == "name":
+            return {"true": True, "false": False, "null": None}.get(value, value)
+        return value
+
+
+# Function to parse a document once and keep the result for later estimates
+@lru_cache(maxsize=256)
+def parse_document(document):
+    return Parser(document).parse_document()
+
+
+# Function to get the value of an argument, looking up variables
+def resolve_value(value, variables):
+    if isinstance(value, Variable):
+        return variables.get(value.name)
+    return value
+
+
+# Function to check the @skip and @include directives of a selection
+def is_included(directives, variables):
+    if "skip" in directives and resolve_value(directives["skip"].get("if"), variables):
+        return False
+    if "include" in directives and not resolve_value(directives["include"].get("if"), variables):
+        return False
+    return True
+
+
+# Function to compute the cost of a selection set for one parent object
+def selection_cost(selections, variables, fragments, path, connections, multiplier=1):
+    cost = 0
+    fragment_costs = {}
+    for selection in selections:
+        if not is_included(selection.directives, variables):
+            continue
+        if isinstance(selection, FragmentSpread):
+            fragment = fragments[selection.name]
+            selection_type = fragment.type_condition
+            selection_cost_value = selection_cost(fragment.selections, variables, fragments, path, connections,
+                                                  multiplier)
+        elif isinstance(selection, InlineFragment):
+            selection_type = selection.type_condition
+            selection_cost_value = selection_cost(selection.selections, variables, fragments, path, connections,
+                                                  multiplier)
+        else:
+            cost += field_cost(selection, variables, fragments, path, connections, multiplier)
+            continue
+        fragment_costs[selection_type] = fragment_costs.get(selection_type, 0) + selection_cost_value
+    # Fragments without a type condition always apply; of the typed ones only the costliest can
+    untyped = fragment_costs.pop(None, 0)
+    return cost + untyped + max(fragment_costs.values(), default=0)
+
+
+# Function to compute the cost of one field
+def field_cost(field, variables, fragments, path, connections, multiplier=1):
+    """
+    Returns the cost of `field` for one parent object. Every connection found is added to
+    `connections` with the number of nodes it requests in total, i.e. its page size times the
+    `multiplier` of nodes requested by the connections around it.
+    """
+    if field.selections is None or field.name in FREE_FIELDS:
+        return 0
+    field_path = f"{path}.{field.name}" if path else field.name
+    size_argument = field.arguments.get("first", field.arguments.get("last"))
+    if size_argument is None:
+        return 1 + selection_cost(field.selections, variables, fragments, field_path, connections, multiplier)
+
+    page_size = resolve_value(size_argument, variables)
+    if page_size is None:
+        raise ValueError(f"The page size of {field_path} is not set")
+    node_selections, other_selections = [], []
+    for selection in field.selections:
+        if isinstance(selection, Field) and selection.name == "edges" and selection.selections:
+            for edge_selection in selection.selections:
+                if isinstance(edge_selection, Field) and edge_selection.name == "node":
+                    node_selections.extend(edge_selection.selections or [])
+        elif isinstance(selection, Field) and selection.name == "nodes":
+            node_selections.extend(selection.selections or [])
+        else:
+            other_selections.append(selection)
+
+    connection = {"path": field_path, "page_size": page_size, "nodes": page_size * multiplier}
+    connections.append(connection)
+    node_cost = 1 + selection_cost(node_selections, variables, fragments, field_path, connections,
+                                   page_size * multiplier)
+    extra_cost = selection_cost(other_selections, variables, fragments, field_path, connections, multiplier)
+    connection["node_cost"] = node_cost
+    connection["cost"] = 2 + page_weight(page_size) * node_cost + extra_cost
+    return connection["cost"]
+
+
+# Function to get the weight of a page of nodes in the cost of a connection
+def page_weight(page_size):
+    """
+    Returns ceil(log2(page_size)), and 1 for a page of one node (0 for an empty page).
+    """
+    return max(1, (page_size - 1).bit_length()) if page_size > 0 else 0
+
+
+# Function to explain the estimated cost of a GraphQL document
+def explain_query_cost(document, variables=None, operation_name=None):
+    """
+    Returns {"cost": estimated requestedQueryCost, "nodes": nodes requested, "connections": [...]}
+    where every connection lists its path, page size, total number of nodes requested, the cost
+    of one node and its cost for one parent object.
+    """
+    operations, fragments = parse_document(document)
+    operations = [op for op in operations if operation_name is None or op[1] == operation_name]
+    if not operations:
+        raise ValueError(f"Operation {operation_name} not found")
+    operation_type, _, selections = operations[0]
+    if operation_type == "mutation":
+        return {"cost": MUTATION_COST, "nodes": 0, "connections": []}
+    connections = []
+    cost = selection_cost(selections, variables or {}, fragments, "", connections)
+    return {"cost": cost, "nodes": sum(c["nodes"] for c in connections), "connections": connections}
+
+
+# Function to estimate the requestedQueryCost of a GraphQL document
+def estimate_query_cost(document, variables=None, operation_name=None):
+    """
+    The query of the metafield scripts, for which Shopify reports a requestedQueryCost of 7:
+
+    >>> estimate_query_cost('''
+    ... query getProductMetafields($id: ID!) {
+    ...     product(id: $id) {
+    ...         id
+    ...         title
+    ...         metafields(first: 10) { edges { node { id namespace key value type } } }
+    ...     }
+    ... }''', {"id": "gid://shopify/Product/8941400326381"})
+    7
+    """
+    return explain_query_cost(document, variables, operation_name)["cost"]
+
+
+# Function to find the largest page size that keeps a query under a cost ceiling
+def optimize_page_size(document, variable="first", variables=None, ceiling=MAX_QUERY_COST,
+                       maximum=MAX_PAGE_SIZE):
+    """
+    Returns the largest value of `variable` (at most `maximum`) whose estimated cost stays within
+    `ceiling`, with the other variables fixed at their values in `variables`. Raises ValueError
+    when even a page size of 1 is too expensive.
+    """
+    variables = dict(variables or {})
+
+    def cost_of(page_size):
+        return estimate_query_cost(document, dict(variables, **{variable: page_size}))
+
+    if cost_of(1) > ceiling:
+        raise ValueError(f"The query costs more than {ceiling} even with {variable} = 1")
+    low, high = 1, maximum
+    while low < high:
+        middle = (low + high + 1) // 2
+        if cost_of(middle) <= ceiling:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+# Function to choose the page sizes of several connections that request the most nodes
+def optimize_page_sizes(document, minimums, variables=None, ceiling=MAX_QUERY_COST, maximum=MAX_PAGE_SIZE):
+    """
+    Chooses the page size variables in `minimums` ({variable: smallest acceptable page size},
+    the outermost connection first) so the query requests as many nodes as possible without its
+    estimated cost exceeding `ceiling`. The first variable is sized exactly; the others are
+    tried at common page sizes from their minimum up.
+    Returns {variable: page size, ..., "cost": estimated cost, "nodes": nodes requested}.
+    """
+    variables = dict(variables or {})
+    page_variables = list(minimums)
+    candidates = [
+        sorted({minimums[v]} | {size for size in (1, 2, 5, 10, 25, 50, 100, 250) if minimums[v] < size <= maximum})
+        for v in page_variables[1:]
+    ]
+
+    best = None
+    for sizes in product_of(*candidates):
+        chosen = dict(variables, **dict(zip(page_variables[1:], sizes)))
+        try:
+            chosen[page_variables[0]] = optimize_page_size(document, page_variables[0], chosen, ceiling, maximum)
+        except ValueError:
+            continue
+        if chosen[page_variables[0]] < minimums[page_variables[0]]:
+            continue
+        explanation = explain_query_cost(document, chosen)
+        if best is None or explanation["nodes"] > best["nodes"]:
+            best = dict({v: chosen[v] for v in page_variables}, cost=explanation["cost"], nodes=explanation["nodes"])
+    if best is None:
+        raise ValueError(f"No page sizes keep the query within a cost of {ceiling}")
+    return best
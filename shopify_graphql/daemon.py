@@ -0,0 +1,194 @@
+"""
+Local HTTP/JSON service running the operations in one long-lived process.
+
+The daemon keeps the Shopify client (and with it the pooled connection and the throttle state),
+the imported operation modules and a short-lived cache of read results resident, so callers such
+as an ERP pay neither interpreter startup nor TLS setup per event. Operations are called with
+
+    POST /<operation>    {"order_id": "gid://shopify/Order/6193832886509"}
+
+and answer {"result": ...} or {"error": "..."}. GET /operations lists the operations and
+GET /status reports the throttle state and cache statistics.
+"""
+
+# Importing the necessary packages
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .client import get_client
+from .operations import OPERATIONS, InvalidArgumentsError, bind_arguments, resolve_operation
+
+DEFAULT_CACHE_TTL = 30      # Seconds a read result is served from the cache
+
+
+class OperationRunner:
+    """
+    Resolves operations once, runs them with the shared client and caches read results.
+    A write drops every cached read that was called with one of the write's argument values
+    (usually the order or product GID), so a read after a write never returns stale data.
+    """
+
+    def __init__(self, client=None, cache_ttl=DEFAULT_CACHE_TTL):
+        self.client = get_client(client)
+        self.cache_ttl = cache_ttl
+        self.functions = {}
+        self.cache = {}
+        self.cache_lock = threading.Lock()
+        self.generation = 0         # Counts the writes that happened while reads were in flight
+        self.invalidated = {}       # Generation of the last write per argument value
+        self.reads_running = 0
+        self.stats = {"calls": 0, "cache_hits": 0, "errors": 0}
+
+    # Function to get the function implementing an operation
+    def resolve(self, operation):
+        if operation not in self.functions:
+            self.functions[operation] = resolve_operation(operation)
+        return self.functions[operation]
+
+    # Function to run an operation with keyword arguments
+    def run(self, operation, arguments):
+        """
+        Reads run outside the lock, so a write may finish while a read is still in flight. Every
+        write stamps its argument values with a new generation, and a read is only cached when
+        none of its values was stamped after it started.
+        """
+        function = self.resolve(operation)
+        reads = OPERATIONS[operation][2]
+        caching = reads and self.cache_ttl
+        cache_key = (operation, json.dumps(arguments, sort_keys=True))
+        values = set(map(str, arguments.values()))
+        with self.cache_lock:
+            self.stats["calls"] += 1
+            if caching:
+                cached = self.cache.get(cache_key)
+                if cached and cached[0] > time.monotonic():
+                    self.stats["cache_hits"] += 1
+                    return cached[1]
+                started = self.generation
+                self.reads_running += 1
+
+        try:
+            result = function(**arguments, client=self.client)
+        except BaseException:
+            if caching:
+                with self.cache_lock:
+                    self.end_read()
+            raise
+
+        with self.cache_lock:
+            if caching:
+                stale = any(self.invalidated.get(value, started) > started for value in values)
+                self.end_read()
+            if caching and not stale:
+                now = time.monotonic()
+                # Entries are kept in the order they expire, so the expired ones are dropped from the front
+                expired = []
+                for key, entry in self.cache.items():
+                    if entry[0] > now:
+                        break
+                    expired.append(key)
+                for key in expired:
+                    del self.cache[key]
+                self.cache.pop(cache_key, None)
+                self.cache[cache_key] = (now + self.cache_ttl, result, values)
+            elif not reads:
+                self.cache = {key: entry for key, entry in self.cache.items() if not entry[2] & values}
+                if self.reads_running:
+                    self.generation += 1
+                    self.invalidated.update(dict.fromkeys(values, self.generation))
+        return result
+
+    # Function to count a read as finished (called with the cache lock held)
+    def end_read(self):
+        self.reads_running -= 1
+        if not self.reads_running:
+            # No read that started before the recorded writes is left to check
+            self.invalidated.clear()
+
+    # Function to report the state kept by the daemon
+    def status(self):
+        with self.client.throttle_lock:
+            throttle = dict(self.client.throttle_state)
+        with self.cache_lock:
+            status = dict(self.stats, cached=len(self.cache), shop=self.client.shop, throttle=throttle)
+        if hasattr(self.client, "transfer_summary"):
+            status["transfer"] = self.client.transfer_summary()
+            status["coalesced_reads"] = self.client.coalesced_reads
+        return status
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """
+    Maps HTTP requests to the OperationRunner of the server.
+    """
+
+    def send_json(self, status, body):
+        payload = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == "/operations":
+            self.send_json(200, {"operations": sorted(OPERATIONS)})
+        elif self.path == "/status":
+            self.send_json(200, self.server.runner.status())
+        else:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        operation = self.path.strip("/")
+        if operation not in OPERATIONS:
+            self.send_json(404, {"error": f"Unknown operation {operation}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            arguments = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(arguments, dict):
+                raise ValueError("The request body must be a JSON object of arguments")
+        except ValueError as error:
+            self.send_json(400, {"error": str(error)})
+            return
+
+        runner = self.server.runner
+        try:
+            bind_arguments(operation, arguments)
+            result = runner.run(operation, arguments)
+        except InvalidArgumentsError as error:
+            # Missing or unexpected arguments; any other error of the operation is a 500
+            self.send_json(400, {"error": str(error)})
+        except Exception as error:
+            with runner.cache_lock:
+                runner.stats["errors"] += 1
+            self.send_json(500, {"error": f"{type(error).__name__}: {error}"})
+        else:
+            self.send_json(200, {"result": result})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+# Function to create the daemon's HTTP server
+def create_server(host="127.0.0.1", port=8765, client=None, cache_ttl=DEFAULT_CACHE_TTL, verbose=False):
+    server = ThreadingHTTPServer((host, port), DaemonRequestHandler)
+    server.daemon_threads = True
+    server.runner = OperationRunner(client=client, cache_ttl=cache_ttl)
+    server.verbose = verbose
+    return server
+
+
+# Function to run the daemon until it is interrupted
+def serve(host="127.0.0.1", port=8765, client=None, cache_ttl=DEFAULT_CACHE_TTL, verbose=False):
+    server = create_server(host, port, client=client, cache_ttl=cache_ttl, verbose=verbose)
+    print(f"Serving Shopify operations for {server.runner.client.shop} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
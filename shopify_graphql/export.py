@@ -0,0 +1,320 @@
+"""
+Columnar export of the catalog and of orders to Parquet for analytics.
+
+Products and orders are streamed from paginated queries or from a bulk operation, decoded into
+typed records and buffered into Arrow record batches; every batch is written as one Parquet row
+group, so memory use does not grow with the size of the store. Money is written as decimals,
+timestamps as UTC timestamps and IDs as the integers of their GIDs.
+
+Install PyArrow using the Command - pip install pyarrow
+"""
+
+# Importing the necessary packages
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .bulk_operations import run_bulk_query
+from .gid import gid_number
+from .models import LineItem, Order, Product, Variant
+from .orders import ORDERS_PAGE_QUERY
+from .pagination import paginate
+
+ROW_GROUP_SIZE = 50000      # Rows buffered before a row group is written
+MONEY_TYPE = pa.decimal128(18, 3)   # Three decimals cover every currency Shopify supports
+TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+
+CATALOG_SCHEMA = pa.schema([
+    ("product_id", pa.int64()),
+    ("product_title", pa.string()),
+    ("handle", pa.string()),
+    ("status", pa.string()),
+    ("vendor", pa.string()),
+    ("product_type", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("variant_id", pa.int64()),
+    ("variant_title", pa.string()),
+    ("sku", pa.string()),
+    ("price", MONEY_TYPE),
+    ("compare_at_price", MONEY_TYPE),
+])
+
+ORDERS_SCHEMA = pa.schema([
+    ("order_id", pa.int64()),
+    ("name", pa.string()),
+    ("email", pa.string()),
+    ("created_at", TIMESTAMP_TYPE),
+    ("financial_status", pa.string()),
+    ("fulfillment_status", pa.string()),
+    ("customer_id", pa.int64()),
+    ("total_price", MONEY_TYPE),
+    ("currency", pa.string()),
+    ("shipping_country", pa.string()),
+    ("shipping_province", pa.string()),
+    ("shipping_city", pa.string()),
+    ("tags", pa.list_(pa.string())),
+    ("note", pa.string()),
+])
+
+LINE_ITEMS_SCHEMA = pa.schema([
+    ("order_id", pa.int64()),
+    ("line_item_id", pa.int64()),
+    ("variant_id", pa.int64()),
+    ("title", pa.string()),
+    ("sku", pa.string()),
+    ("quantity", pa.int32()),
+    ("unit_price", MONEY_TYPE),
+    ("currency", pa.string()),
+])
+
+PRODUCT_FIELDS = """
+    id
+    title
+    handle
+    status
+    vendor
+    productType
+    tags
+"""
+
+VARIANT_FIELDS = """
+    id
+    title
+    sku
+    price
+    compareAtPrice
+"""
+
+CATALOG_PAGE_QUERY = f"""
+query catalog($first: Int!, $after: String, $query: String, $variantsFirst: Int!) {{
+    products(first: $first, after: $after, query: $query) {{
+        edges {{
+            node {{
+                {PRODUCT_FIELDS}
+                variants(first: $variantsFirst) {{
+                    edges {{
+                        node {{ {VARIANT_FIELDS} }}
+                    }}
+                }}
+            }}
+        }}
+        pageInfo {{
+            hasNextPage
+            endCursor
+        }}
+    }}
+}}
+"""
+
+
+class ParquetTableWriter:
+    """
+    Buffers rows (dicts keyed by column name) and writes them to a Parquet file one row group
+    at a time.
+    """
+
+    def __init__(self, path, schema, row_group_size=ROW_GROUP_SIZE, compression="zstd"):
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(path, schema, compression=compression)
+        self.rows = []
+        self.count = 0
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            batch = pa.RecordBatch.from_pylist(self.rows, schema=self.schema)
+            self.writer.write_table(pa.Table.from_batches([batch]), row_group_size=self.row_group_size)
+            self.count += len(self.rows)
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Function to get the number of a GID that may be missing
+def optional_number(gid):
+    return gid_number(gid) if gid else None
+
+
+# Function to build the catalog row of a variant (or of a product without variants)
+def catalog_row(product, variant=None):
+    return {
+        "product_id": gid_number(product.id),
+        "product_title": product.title,
+        "handle": product.handle,
+        "status": product.status,
+        "vendor": product.vendor,
+        "product_type": product.product_type,
+        "tags": list(product.tags),
+        "variant_id": optional_number(variant.id) if variant else None,
+        "variant_title": variant.title if variant else None,
+        "sku": variant.sku if variant else None,
+        "price": variant.price if variant else None,
+        "compare_at_price": variant.compare_at_price if variant else None,
+    }
+
+
+# Function to build the row of an order
+def order_row(order):
+    shipping = order.shipping_address
+    return {
+        "order_id": gid_number(order.id),
+        "name": order.name,
+        "email": order.email,
+        "created_at": order.created_at,
+        "financial_status": order.financial_status,
+        "fulfillment_status": order.fulfillment_status,
+        "customer_id": optional_number(order.customer_id),
+        "total_price": order.total_price,
+        "currency": order.currency,
+        "shipping_country": shipping.country if shipping else None,
+        "shipping_province": shipping.province if shipping else None,
+        "shipping_city": shipping.city if shipping else None,
+        "tags": list(order.tags),
+        "note": order.note,
+    }
+
+
+# Function to build the row of a line item
+def line_item_row(order_id, line_item):
+    return {
+        "order_id": gid_number(order_id),
+        "line_item_id": gid_number(line_item.id),
+        "variant_id": optional_number(line_item.variant_id),
+        "title": line_item.title,
+        "sku": line_item.sku,
+        "quantity": line_item.quantity,
+        "unit_price": line_item.unit_price,
+        "currency": line_item.currency,
+    }
+
+
+# Function to build the filter argument of a bulk query connection
+def bulk_filter(search_query):
+    return f"(query: {json.dumps(search_query)})" if search_query else ""
+
+
+# Function to export the catalog, one row per variant, to a Parquet file
+def export_catalog(output_path, search_query=None, use_bulk=False, variants_per_product=50,
+                   row_group_size=ROW_GROUP_SIZE, client=None):
+    """
+    Writes one row per variant (and one row for every product without variants).
+    Paginated exports read up to `variants_per_product` variants per product; bulk exports read
+    all of them. Returns the number of products and rows written.
+    """
+    counts = {"products": 0, "rows": 0}
+    with ParquetTableWriter(output_path, CATALOG_SCHEMA, row_group_size) as writer:
+        if use_bulk:
+            bulk_query = f"""
+            {{
+                products{bulk_filter(search_query)} {{
+                    edges {{
+                        node {{
+                            {PRODUCT_FIELDS}
+                            variants {{
+                                edges {{
+                                    node {{ {VARIANT_FIELDS} }}
+                                }}
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+            """
+            # Variant lines directly follow their product, so only the current product is kept;
+            # when the next product starts it is written on its own if it had no variants
+            product, has_variants = None, False
+            for row in run_bulk_query(bulk_query, client=client):
+                if "__parentId" in row:
+                    writer.write(catalog_row(product, Variant.from_node(row, row["__parentId"])))
+                    has_variants = True
+                    continue
+                if product and not has_variants:
+                    writer.write(catalog_row(product))
+                product, has_variants = Product.from_node(row), False
+                counts["products"] += 1
+            if product and not has_variants:
+                writer.write(catalog_row(product))
+        else:
+            nodes = paginate(CATALOG_PAGE_QUERY, {"query": search_query, "variantsFirst": variants_per_product},
+                             ("products",), client=client)
+            for node in nodes:
+                product = Product.from_node(node)
+                for variant in product.variants or (None,):
+                    writer.write(catalog_row(product, variant))
+                counts["products"] += 1
+    counts["rows"] = writer.count
+    return counts
+
+
+# Function to export orders and their line items to two Parquet files
+def export_orders(orders_path, line_items_path, search_query=None, use_bulk=False, line_items_per_order=20,
+                  row_group_size=ROW_GROUP_SIZE, client=None):
+    """
+    Writes one row per order to `orders_path` and one row per line item to `line_items_path`;
+    the two tables join on order_id. Paginated exports read up to `line_items_per_order` line
+    items per order; bulk exports read all of them. Returns the number of rows written to each.
+    """
+    with ParquetTableWriter(orders_path, ORDERS_SCHEMA, row_group_size) as orders_writer, \
+            ParquetTableWriter(line_items_path, LINE_ITEMS_SCHEMA, row_group_size) as line_items_writer:
+        if use_bulk:
+            bulk_query = f"""
+            {{
+                orders{bulk_filter(search_query)} {{
+                    edges {{
+                        node {{
+                            id
+                            name
+                            email
+                            createdAt
+                            displayFinancialStatus
+                            displayFulfillmentStatus
+                            customer {{ id }}
+                            shippingAddress {{ country province city }}
+                            totalPriceSet {{ shopMoney {{ amount currencyCode }} }}
+                            tags
+                            note
+                            lineItems {{
+                                edges {{
+                                    node {{
+                                        id
+                                        title
+                                        sku
+                                        quantity
+                                        variant {{ id }}
+                                        originalUnitPriceSet {{ shopMoney {{ amount currencyCode }} }}
+                                    }}
+                                }}
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+            """
+            for row in run_bulk_query(bulk_query, client=client):
+                if "__parentId" in row:
+                    line_items_writer.write(line_item_row(row["__parentId"], LineItem.from_node(row)))
+                else:
+                    orders_writer.write(order_row(Order.from_node(row)))
+        else:
+            nodes = paginate(ORDERS_PAGE_QUERY, {"query": search_query, "lineItemsFirst": line_items_per_order},
+                             ("orders",), client=client)
+            for node in nodes:
+                order = Order.from_node(node)
+                orders_writer.write(order_row(order))
+                for line_item in order.line_items:
+                    line_items_writer.write(line_item_row(order.id, line_item))
+    return {"orders": orders_writer.count, "line_items": line_items_writer.count}
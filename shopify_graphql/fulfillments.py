@@ -0,0 +1,133 @@
+"""
+Fulfillment operations: find the fulfillment order of an order, fulfill it and verify it.
+"""
+
+# Importing the necessary packages
+from .client import get_client, raise_for_errors
+
+FULFILLMENT_ORDER_QUERY = """
+query fulfillmentOrders($id: ID!) {
+    order(id: $id) {
+        fulfillmentOrders(first: 1) {
+            edges {
+                node {
+                    id                                  # fulfillmentOrderId
+                    lineItems(first: 10) {
+                        edges {
+                            node {
+                                id                      # fulfillmentOrderLineItemId
+                                lineItem {
+                                    title
+                                    quantity
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+FULFILL_ORDER_MUTATION = """
+mutation fulfillmentCreateV2($fulfillment: FulfillmentV2Input!) {
+    fulfillmentCreateV2(fulfillment: $fulfillment) {
+        fulfillment {
+            id
+            status
+            trackingInfo {
+                number
+                url
+            }
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+FULFILLED_ORDER_QUERY = """
+query getOrder($id: ID!) {
+    order(id: $id) {
+        id
+        name
+        fulfillments(first: 5) {
+            id
+            status
+            createdAt
+            trackingInfo {
+                number
+                url
+            }
+        }
+        fulfillmentOrders(first: 5) {
+            edges {
+                node {
+                    id
+                    status
+                    createdAt
+                    lineItems(first: 5) {
+                        edges {
+                            node {
+                                id
+                                lineItem {
+                                    title
+                                    quantity
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+# Function to retrieve fulfillmentOrderId and lineItems
+def get_fulfillment_order(order_id, client=None):
+    return get_client(client).execute(FULFILLMENT_ORDER_QUERY, {"id": order_id}, cost=15)
+
+
+# Function to fulfill line items of a fulfillment order
+def fulfill_order(fulfillment_order_id, line_item_ids, tracking_number=None, tracking_url=None, client=None):
+    """
+    Fulfills one unit of each fulfillment order line item, attaching tracking information
+    when a tracking number or URL is given.
+
+    Args:
+        fulfillment_order_id (str): The Shopify ID of the fulfillment order
+        line_item_ids (list): The Shopify IDs of the fulfillment order line items to fulfill
+    """
+    fulfillment = {
+        "lineItemsByFulfillmentOrder": [
+            {
+                "fulfillmentOrderId": fulfillment_order_id,
+                "fulfillmentOrderLineItems": [{"id": line_item_id, "quantity": 1} for line_item_id in line_item_ids],
+            }
+        ],
+    }
+    if tracking_number or tracking_url:
+        fulfillment["trackingInfo"] = {"number": tracking_number, "url": tracking_url}
+    return get_client(client).execute(FULFILL_ORDER_MUTATION, {"fulfillment": fulfillment})
+
+
+# Function to fulfill every line item of an order's first fulfillment order
+def fulfill_order_items(order_id, tracking_number=None, tracking_url=None, client=None):
+    """
+    Looks up the fulfillment order of an order and fulfills all of its line items.
+    Returns the fulfillmentCreateV2 response.
+    """
+    data = raise_for_errors(get_fulfillment_order(order_id, client=client), "Fulfillment order lookup")
+    fulfillment_order = data["data"]["order"]["fulfillmentOrders"]["edges"][0]["node"]
+    line_item_ids = [item["node"]["id"] for item in fulfillment_order["lineItems"]["edges"]]
+    return fulfill_order(fulfillment_order["id"], line_item_ids, tracking_number, tracking_url, client=client)
+
+
+# Function to retrieve the order to verify fulfillment
+def retrieve_fulfilled_order(order_id, client=None):
+    return get_client(client).execute(FULFILLED_ORDER_QUERY, {"id": order_id}, cost=40)
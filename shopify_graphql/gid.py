@@ -0,0 +1,141 @@
+"""
+Codec for Shopify global IDs such as gid://shopify/ProductVariant/47696106127597.
+
+GIDs are parsed into (type, number) pairs with the type name interned, or packed into one
+integer holding a small type code above the 56-bit number. Indexes and caches keyed on those
+integers take a fraction of the memory of the GID strings and hash faster; GIDs are formatted
+back into strings only when they are sent to the API.
+"""
+
+# Importing the necessary packages
+import sys
+import threading
+from collections import namedtuple
+
+GID_PREFIX = "gid://shopify/"
+NUMBER_BITS = 56                    # Shopify IDs are well below 2**56
+NUMBER_MASK = (1 << NUMBER_BITS) - 1
+
+# A parsed GID
+Gid = namedtuple("Gid", ["type", "number"])
+
+# Type codes used in packed GIDs. The codes of these types never change; other types get the
+# next free code the first time they are seen, which only holds within one process.
+TYPE_CODES = {
+    type_name: code for code, type_name in enumerate([
+        None, "Product", "ProductVariant", "Order", "LineItem", "Metafield", "Customer", "Collection",
+        "FulfillmentOrder", "FulfillmentOrderLineItem", "Fulfillment", "Refund", "OrderTransaction",
+        "InventoryItem", "Location", "Shop", "BulkOperation", "MediaImage", "ProductOption",
+    ]) if type_name
+}
+TYPE_NAMES = {code: type_name for type_name, code in TYPE_CODES.items()}
+type_codes_lock = threading.Lock()
+
+
+# Function to parse a GID into its type and number
+def parse_gid(gid):
+    """
+    Returns Gid(type, number) for a GID string. Query parameters, as in
+    gid://shopify/ImageSource/1?v=2, are dropped.
+    """
+    if not gid.startswith(GID_PREFIX):
+        raise ValueError(f"Not a Shopify GID: {gid!r}")
+    type_name, _, number = gid[len(GID_PREFIX):].partition("/")
+    return Gid(sys.intern(type_name), int(number.partition("?")[0]))
+
+
+# Function to get the number of a GID
+def gid_number(gid):
+    return int(gid[gid.rindex("/") + 1:].partition("?")[0])
+
+
+# Function to build the GID string of a type and number
+def format_gid(type_name, number):
+    return f"{GID_PREFIX}{type_name}/{number}"
+
+
+# Function to get the code of a type, registering types without a fixed code
+def type_code(type_name):
+    code = TYPE_CODES.get(type_name)
+    if code is None:
+        with type_codes_lock:
+            if type_name not in TYPE_CODES and len(TYPE_CODES) >= 255:
+                raise ValueError("Too many GID types to pack")
+            code = TYPE_CODES.setdefault(type_name, len(TYPE_CODES) + 1)
+            TYPE_NAMES[code] = type_name
+    return code
+
+
+# Function to pack a GID into one integer
+def pack_gid(gid):
+    type_name, number = parse_gid(gid)
+    if number > NUMBER_MASK:
+        raise ValueError(f"GID number too large to pack: {gid}")
+    return type_code(type_name) << NUMBER_BITS | number
+
+
+# Function to turn a packed GID back into its string
+def unpack_gid(packed):
+    return format_gid(TYPE_NAMES[packed >> NUMBER_BITS], packed & NUMBER_MASK)
+
+
+class GidIndex:
+    """
+    A dict keyed on the numbers of GIDs of one type, e.g. GidIndex("ProductVariant").
+
+    Lookups accept either GID strings or numbers, and iteration yields GID strings, so the index
+    can stand in for a dict keyed on GIDs while storing small integer keys.
+    """
+
+    def __init__(self, type_name, items=()):
+        self.type_name = type_name
+        self.prefix = f"{GID_PREFIX}{type_name}/"
+        self.entries = {}
+        for key, value in dict(items).items():
+            self[key] = value
+
+    def key(self, gid):
+        if isinstance(gid, int):
+            return gid
+        if not gid.startswith(self.prefix):
+            raise KeyError(f"{gid} is not a {self.type_name} GID")
+        return int(gid[len(self.prefix):].partition("?")[0])
+
+    def __getitem__(self, gid):
+        return self.entries[self.key(gid)]
+
+    def __setitem__(self, gid, value):
+        self.entries[self.key(gid)] = value
+
+    def __delitem__(self, gid):
+        del self.entries[self.key(gid)]
+
+    def __contains__(self, gid):
+        try:
+            return self.key(gid) in self.entries
+        except (KeyError, ValueError):
+            return False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (self.prefix + str(number) for number in self.entries)
+
+    def get(self, gid, default=None):
+        try:
+            return self.entries.get(self.key(gid), default)
+        except (KeyError, ValueError):
+            return default
+
+    def setdefault(self, gid, default=None):
+        return self.entries.setdefault(self.key(gid), default)
+
+    def pop(self, gid, *default):
+        return self.entries.pop(self.key(gid), *default)
+
+    def items(self):
+        return ((self.prefix + str(number), value) for number, value in self.entries.items())
+
+    def values(self):
+        return self.entries.values()
@@ -0,0 +1,61 @@
+"""
+ShopifyClient variant sending its requests over HTTP/2 with httpx.
+
+All threads using one Http2ShopifyClient share a single HTTP/2 connection to the shop, so concurrent
+GraphQL requests are multiplexed as streams instead of each taking a pooled HTTP/1.1 connection.
+httpx negotiates gzip, and Brotli when the brotli package is installed, which shrinks large order
+and product responses several times over; transfer_summary() reports the bytes on the wire and
+after decompression.
+
+    from shopify_graphql.client import configure
+
+    client = configure("your-store.myshopify.com", "shpat_...", http2=True)
+
+Install httpx with HTTP/2 and Brotli support using the Command - pip install "httpx[http2,brotli]"
+"""
+
+# Importing the necessary packages
+import json
+
+import httpx
+
+from .client import DEFAULT_API_VERSION, DEFAULT_TIMEOUT, ShopifyClient
+
+
+class Http2ShopifyClient(ShopifyClient):
+    """
+    A ShopifyClient whose session is an HTTP/2 httpx.Client; throttling, retries and the rest of
+    the client behave the same.
+    """
+
+    def __init__(self, shop, access_token, api_version=DEFAULT_API_VERSION, max_retries=5, single_flight=True,
+                 timeout=DEFAULT_TIMEOUT):
+        super().__init__(shop, access_token, api_version, max_retries, single_flight, timeout)
+        self.session.close()
+        self.session = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            headers={"X-Shopify-Access-Token": access_token, "Content-Type": "application/json"},
+        )
+
+    def __repr__(self):
+        return f"Http2ShopifyClient(shop={self.shop!r}, api_version={self.api_version!r})"
+
+    # Function to get the number of bytes a response took on the wire, before decompression
+    def wire_bytes(self, response):
+        return response.num_bytes_downloaded
+
+    # Function to stream a JSONL file, such as the result of a bulk operation
+    def stream_jsonl(self, url):
+        """
+        Yields the parsed lines of a JSONL file. The file is fetched without the session, so the
+        access token is not sent to Shopify's storage provider.
+        """
+        with httpx.stream("GET", url, follow_redirects=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,344 @@
+"""
+Persistent job queue and worker pool for the registered operations.
+
+Jobs are operations from shopify_graphql.operations with their keyword arguments, e.g.
+("orders.fulfill", {"order_id": ...}), ("orders.refund", ...), ("slips.render", ...),
+("metafields.set", ...) or ("products.delete", ...). They are stored in a SQLite file, so bursts of
+webhooks or ERP events can be enqueued as fast as they arrive, by several processes, and survive
+restarts. A pool of worker threads sharing one client drains the queue by priority at the rate the
+cost budget allows.
+
+A job failing with an exception or top-level GraphQL errors (network trouble, throttling, ...) is
+retried with exponential backoff; after `max_attempts` attempts, or at once when Shopify rejects
+its input with userErrors, it is dead-lettered with its last error and can be requeued later.
+Operations in NON_IDEMPOTENT_OPERATIONS (creating orders, fulfillments, refunds, ...) may already
+have been applied when such an error occurs, so they are only retried after throttling errors and
+are otherwise dead-lettered for a check before requeueing. The same holds for jobs whose worker
+stopped while running them: once their lease expires, non-idempotent jobs and jobs without
+attempts left are dead-lettered, and only the others are requeued.
+
+    from shopify_graphql.jobs import JobQueue, run_workers
+
+    queue = JobQueue("jobs.db")
+    queue.enqueue("orders.fulfill", {"order_id": "gid://shopify/Order/6193832886509"}, priority=10)
+    run_workers("jobs.db", workers=4, stop_when_empty=True)
+"""
+
+# Importing the necessary packages
+import json
+import sqlite3
+import threading
+import time
+
+from .client import get_client
+from .operations import NON_IDEMPOTENT_OPERATIONS, OPERATIONS, InvalidArgumentsError, bind_arguments, resolve_operation
+
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_DELAY = 5.0           # Seconds before the first retry; doubled for every further attempt
+MAX_RETRY_DELAY = 600.0
+LEASE_SECONDS = 900.0       # Running jobs not renewed for this long are assumed lost with their worker
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',      -- queued, running, done or dead
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_after REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority DESC, run_after, id);
+"""
+
+
+class PermanentJobError(Exception):
+    """
+    Raised for results that retrying cannot fix, such as userErrors on the job's input.
+    """
+
+
+# Function to find the errors in the result of an operation
+def result_errors(result):
+    """
+    Returns (top-level errors, userErrors) of a GraphQL response; other results have none.
+    """
+    if not isinstance(result, dict):
+        return [], []
+    user_errors = [
+        error for field in (result.get("data") or {}).values() if isinstance(field, dict)
+        for error in field.get("userErrors") or []
+    ]
+    return result.get("errors") or [], user_errors
+
+
+class JobQueue:
+    """
+    The jobs table of one SQLite file. Every thread gets its own connection.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    # Function to get the connection of the current thread
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")
+        return connection
+
+    # Function to add a job to the queue
+    def enqueue(self, operation, arguments=None, priority=0, max_attempts=DEFAULT_MAX_ATTEMPTS, delay=0.0):
+        """
+        Queues `operation` with keyword `arguments` and returns the job ID. Jobs with a higher
+        `priority` run first; jobs of equal priority run in the order they were queued.
+        """
+        if operation not in OPERATIONS:
+            raise KeyError(f"Unknown operation {operation}")
+        now = time.time()
+        cursor = self.connection().execute(
+            "INSERT INTO jobs (operation, arguments, priority, max_attempts, run_after, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (operation, json.dumps(arguments or {}), priority, max_attempts, now + delay, now, now),
+        )
+        return cursor.lastrowid
+
+    # Function to take the next ready job, marking it as running
+    def claim(self):
+        """
+        Returns (job ID, operation, arguments, attempts) of the ready job with the highest
+        priority, or None. The job is claimed in a write transaction, so no two workers, even in
+        different processes, get the same job.
+        """
+        connection = self.connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT id, operation, arguments, attempts FROM jobs WHERE status = 'queued' AND run_after <= ? "
+                "ORDER BY priority DESC, id LIMIT 1", (now,)
+            ).fetchone()
+            if row:
+                connection.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (now, row[0]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2]), row[3] + 1
+
+    # Function to mark a job as done
+    def complete(self, job_id, result):
+        self.connection().execute(
+            "UPDATE jobs SET status = 'done', result = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+            (json.dumps(result, default=str), time.time(), job_id),
+        )
+
+    # Function to schedule a failed job for a retry, or dead-letter it
+    def fail(self, job_id, error, permanent=False):
+        """
+        Returns the job's new status: "queued" again after a backoff delay, or "dead" once its
+        attempts are used up or the error is permanent.
+        """
+        connection = self.connection()
+        attempts, max_attempts = connection.execute(
+            "SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        now = time.time()
+        if permanent or attempts >= max_attempts:
+            connection.execute(
+                "UPDATE jobs SET status = 'dead', last_error = ?, updated_at = ? WHERE id = ?", (error, now, job_id)
+            )
+            return "dead"
+        delay = min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** (attempts - 1))
+        connection.execute(
+            "UPDATE jobs SET status = 'queued', last_error = ?, run_after = ?, updated_at = ? WHERE id = ?",
+            (error, now + delay, now, job_id),
+        )
+        return "queued"
+
+    # Function to renew the lease of running jobs, so they are not taken for lost
+    def renew(self, job_ids):
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        return self.connection().execute(
+            f"UPDATE jobs SET updated_at = ? WHERE status = 'running' AND id IN ({', '.join('?' * len(job_ids))})",
+            [time.time()] + job_ids,
+        ).rowcount
+
+    # Function to requeue jobs whose worker stopped while running them
+    def recover(self, lease_seconds=LEASE_SECONDS):
+        """
+        Requeues the running jobs whose lease expired and returns how many. Non-idempotent jobs
+        may have been applied before their worker stopped, and jobs without attempts left may be
+        what stopped it, so these are dead-lettered instead.
+        """
+        connection = self.connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, operation, attempts, max_attempts FROM jobs WHERE status = 'running' AND updated_at < ?",
+                (now - lease_seconds,),
+            ).fetchall()
+            requeued = 0
+            for job_id, operation, attempts, max_attempts in rows:
+                if operation in NON_IDEMPOTENT_OPERATIONS or attempts >= max_attempts:
+                    connection.execute(
+                        "UPDATE jobs SET status = 'dead', last_error = ?, updated_at = ? WHERE id = ?",
+                        ("Lease expired while running; check before requeueing", now, job_id),
+                    )
+                else:
+                    connection.execute("UPDATE jobs SET status = 'queued', updated_at = ? WHERE id = ?", (now, job_id))
+                    requeued += 1
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return requeued
+
+    # Function to requeue dead-lettered jobs with fresh attempts
+    def requeue_dead(self, job_ids=None):
+        now = time.time()
+        query = "UPDATE jobs SET status = 'queued', attempts = 0, run_after = ?, updated_at = ? WHERE status = 'dead'"
+        parameters = [now, now]
+        if job_ids is not None:
+            job_ids = list(job_ids)
+            query += f" AND id IN ({', '.join('?' * len(job_ids))})"
+            parameters += job_ids
+        return self.connection().execute(query, parameters).rowcount
+
+    # Function to list the dead-lettered jobs with their last errors
+    def dead_jobs(self, limit=100):
+        rows = self.connection().execute(
+            "SELECT id, operation, arguments, attempts, last_error FROM jobs WHERE status = 'dead' "
+            "ORDER BY updated_at DESC LIMIT ?", (limit,)
+        )
+        return [
+            {"id": job_id, "operation": operation, "arguments": json.loads(arguments), "attempts": attempts,
+             "error": error}
+            for job_id, operation, arguments, attempts, error in rows
+        ]
+
+    # Function to count the jobs by status
+    def counts(self):
+        counts = {"queued": 0, "running": 0, "done": 0, "dead": 0}
+        counts.update(self.connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return counts
+
+    # Function to delete finished jobs older than `seconds`
+    def purge_done(self, seconds=7 * 24 * 3600):
+        return self.connection().execute(
+            "DELETE FROM jobs WHERE status = 'done' AND updated_at < ?", (time.time() - seconds,)
+        ).rowcount
+
+
+# Function to run one claimed job and record its outcome
+def run_job(queue, job, client):
+    job_id, operation, arguments, attempt = job
+    try:
+        bind_arguments(operation, arguments)
+    except InvalidArgumentsError as error:
+        # Missing or unknown arguments fail the same way on every attempt
+        return queue.fail(job_id, str(error), permanent=True)
+    retry_safe = operation not in NON_IDEMPOTENT_OPERATIONS
+    try:
+        result = resolve_operation(operation)(**arguments, client=client)
+        errors, user_errors = result_errors(result)
+        if user_errors:
+            raise PermanentJobError(f"userErrors: {user_errors}")
+        if errors:
+            # Throttled requests were not executed, so even a non-idempotent write can run again
+            retry_safe = retry_safe or all(
+                (error.get("extensions") or {}).get("code") == "THROTTLED" for error in errors
+            )
+            raise RuntimeError(f"GraphQL errors: {errors}")
+    except PermanentJobError as error:
+        # Invalid input fails the same way on every attempt
+        return queue.fail(job_id, f"{type(error).__name__}: {error}", permanent=True)
+    except Exception as error:
+        # A write that may have been applied is dead-lettered rather than sent a second time
+        return queue.fail(job_id, f"{type(error).__name__}: {error}", permanent=not retry_safe)
+    queue.complete(job_id, result)
+    return "done"
+
+
+# Function to drain the queue with a pool of worker threads
+def run_workers(path, workers=4, client=None, stop_when_empty=False, poll_interval=1.0, on_result=None,
+                lease_seconds=LEASE_SECONDS):
+    """
+    Runs `workers` threads taking jobs from the queue at `path` until interrupted, or until no
+    job is queued or running any more when `stop_when_empty` is set. The workers share one client, so together they
+    stay within the store's cost budget. `on_result(job_id, operation, status)` is called after
+    every attempt. Returns the number of attempts per outcome.
+
+    While a job runs, its lease is renewed every third of `lease_seconds`; jobs of other workers
+    whose lease expired, because their process died, are requeued while the pool runs.
+    """
+    client = get_client(client)
+    queue = JobQueue(path)
+    queue.recover(lease_seconds)
+    totals = {"done": 0, "queued": 0, "dead": 0}
+    totals_lock = threading.Lock()
+    running = set()             # IDs of the jobs this pool is running
+    stopping = threading.Event()
+    finished = threading.Event()
+
+    def work():
+        while not stopping.is_set():
+            job = queue.claim()
+            if job is None:
+                counts = queue.counts()
+                if stop_when_empty and not counts["queued"] and not counts["running"]:
+                    return
+                queue.recover(lease_seconds)
+                stopping.wait(poll_interval)
+                continue
+            with totals_lock:
+                running.add(job[0])
+            try:
+                status = run_job(queue, job, client)
+            finally:
+                with totals_lock:
+                    running.discard(job[0])
+            with totals_lock:
+                totals[status] += 1
+            if on_result:
+                on_result(job[0], job[1], status)
+
+    def heartbeat():
+        while not finished.wait(lease_seconds / 3):
+            with totals_lock:
+                job_ids = list(running)
+            queue.renew(job_ids)
+            queue.recover(lease_seconds)
+
+    threads = [threading.Thread(target=work, name=f"job-worker-{number}", daemon=True) for number in range(workers)]
+    threading.Thread(target=heartbeat, name="job-heartbeat", daemon=True).start()
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(0.5)
+    except KeyboardInterrupt:
+        # Running jobs finish; the rest stay queued for the next run
+        stopping.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        finished.set()
+    return totals
@@ -0,0 +1,212 @@
+"""
+Declarative metafield sync: make product metafields match a desired-state file, sending only the
+metafields whose content hash changed.
+
+The remote state is remembered between runs; when there is no cache, or a refresh is requested,
+it is exported with a bulk query. In memory it is keyed on (packed owner GID, namespace, key) and
+holds (metafield number, content hash) pairs, so stores with millions of metafields stay compact.
+"""
+
+# Importing the necessary packages
+import csv
+import hashlib
+import json
+import os
+import sys
+from itertools import islice
+
+from .bulk_operations import run_bulk_query
+from .client import get_client
+from .gid import gid_number, pack_gid, unpack_gid
+from .metafields import DELETE_BATCH_SIZE, DELETE_METAFIELDS_MUTATION, batch_metafield_rows, write_metafield_batch
+
+# Metafield types whose values Shopify stores in a normalized form
+JSON_VALUE_TYPES = {"json", "rating", "dimension", "volume", "weight", "money", "link"}
+
+
+# Function to hash the content of a metafield
+def content_hash(value, value_type):
+    """
+    Returns a short hash of a metafield's type and value. JSON-based values are re-serialized
+    with sorted keys first, so formatting differences do not count as changes.
+    """
+    if value_type in JSON_VALUE_TYPES or value_type.startswith("list."):
+        try:
+            value = json.dumps(json.loads(value), sort_keys=True, separators=(",", ":"))
+        except ValueError:
+            pass
+    elif value_type == "boolean":
+        value = str(value).lower()
+    return hashlib.sha256(f"{value_type}\x1f{value}".encode("utf-8")).hexdigest()[:32]
+
+
+# Function to build the key identifying a metafield in the desired and remote state
+def state_key(owner_id, namespace, key):
+    return pack_gid(owner_id), sys.intern(namespace), key
+
+
+# Function to describe a state key in reports
+def describe_state_key(key):
+    return f"{unpack_gid(key[0])}|{key[1]}|{key[2]}"
+
+
+# Function to load the desired metafields from a JSON or CSV file
+def load_desired_state(file_path):
+    """
+    Reads a list of {owner_id, namespace, key, value, type} records from a .json or .csv file.
+    Returns a dict of {state key: record}.
+    """
+    with open(file_path, newline="", encoding="utf-8") as desired_file:
+        if file_path.lower().endswith(".json"):
+            records = json.load(desired_file)
+        else:
+            records = list(csv.DictReader(desired_file))
+    return {state_key(r["owner_id"], r["namespace"], r["key"]): r for r in records}
+
+
+# Function to fetch the current remote state of product metafields with a bulk operation
+def fetch_remote_state(namespaces, client=None):
+    """
+    Exports the product metafields of the given namespaces and returns a dict of
+    {state key: (metafield number, content hash)}.
+    """
+    namespaces = set(namespaces)
+    namespace_filter = f"(namespace: {json.dumps(next(iter(namespaces)))})" if len(namespaces) == 1 else ""
+    bulk_query = f"""
+    {{
+        products {{
+            edges {{
+                node {{
+                    id
+                    metafields{namespace_filter} {{
+                        edges {{
+                            node {{
+                                id
+                                namespace
+                                key
+                                value
+                                type
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}
+    """
+    remote_state = {}
+    for row in run_bulk_query(bulk_query, client=client):
+        if "__parentId" in row and row["namespace"] in namespaces:
+            remote_state[state_key(row["__parentId"], row["namespace"], row["key"])] = (
+                gid_number(row["id"]), content_hash(row["value"], row["type"])
+            )
+    return remote_state
+
+
+# Function to load the remote state from the cache, or from Shopify when needed
+def load_remote_state(cache_path, namespaces, refresh=False, client=None):
+    """
+    The cache holds one [owner GID, namespace, key, metafield number, hash] row per metafield.
+    Caches in any other format are ignored and the state is fetched again.
+    """
+    if not refresh and os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as cache_file:
+            rows = json.load(cache_file)
+        if isinstance(rows, list):
+            return {state_key(owner_id, namespace, key): (number, digest)
+                    for owner_id, namespace, key, number, digest in rows}
+    return fetch_remote_state(namespaces, client=client)
+
+
+# Function to save the remote state for the next sync
+def save_remote_state(cache_path, remote_state):
+    temporary_path = f"{cache_path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as cache_file:
+        json.dump([[unpack_gid(key[0]), key[1], key[2], number, digest]
+                   for key, (number, digest) in remote_state.items()], cache_file)
+    os.replace(temporary_path, cache_path)
+
+
+# Function to compare the desired state with the remote state
+def plan_sync(desired_state, remote_state, prune=False):
+    """
+    Returns a plan dict with the lists "add", "update", "delete" and "unchanged".
+    Adds and updates hold desired records; deletes hold state keys of remote metafields.
+    Only owners and namespaces that appear in the desired state are pruned.
+    """
+    plan = {"add": [], "update": [], "delete": [], "unchanged": []}
+    for key, record in desired_state.items():
+        remote = remote_state.get(key)
+        if remote is None:
+            plan["add"].append(record)
+        elif remote[1] != content_hash(record["value"], record["type"]):
+            plan["update"].append(record)
+        else:
+            plan["unchanged"].append(record)
+
+    if prune:
+        managed = {key[:2] for key in desired_state}
+        plan["delete"] = [key for key in remote_state if key not in desired_state and key[:2] in managed]
+    return plan
+
+
+# Function to apply a sync plan and keep the remote state up to date
+def apply_sync(plan, remote_state, client=None):
+    """
+    Sends the planned changes in batches and updates `remote_state` with every change that
+    Shopify accepted. Rows rejected with userErrors are reported without holding back the other
+    rows of their batch. Returns the list of failures as (record or key, error messages) pairs.
+    """
+    client = get_client(client)
+    failures = []
+    writes = plan["add"] + plan["update"]
+    records = {state_key(r["owner_id"], r["namespace"], r["key"]): r for r in writes}
+    rows = ((r["owner_id"], r["namespace"], r["key"], r["value"], r["type"]) for r in writes)
+    for batch in batch_metafield_rows(rows):
+        written, failed = write_metafield_batch(batch, client=client)
+        for row, metafield_id in written:
+            remote_state[state_key(row.owner_id, row.namespace, row.key)] = (
+                gid_number(metafield_id), content_hash(row.value, row.type)
+            )
+        failures.extend((records[state_key(row.owner_id, row.namespace, row.key)], messages)
+                        for row, messages in failed)
+
+    deletes = iter(plan["delete"])
+    while True:
+        batch = list(islice(deletes, DELETE_BATCH_SIZE))
+        if not batch:
+            break
+        identifiers = [{"ownerId": unpack_gid(owner), "namespace": namespace, "key": key}
+                       for owner, namespace, key in batch]
+        data = client.execute(DELETE_METAFIELDS_MUTATION, {"metafields": identifiers})
+        if "errors" in data:
+            failures.extend((describe_state_key(key), [error["message"] for error in data["errors"]])
+                            for key in batch)
+            continue
+        result = data["data"]["metafieldsDelete"]
+        for deleted in result["deletedMetafields"]:
+            if deleted:
+                remote_state.pop(state_key(deleted["ownerId"], deleted["namespace"], deleted["key"]), None)
+        if result["userErrors"]:
+            failures.append(([describe_state_key(key) for key in batch],
+                             [error["message"] for error in result["userErrors"]]))
+    return failures
+
+
+# Function to sync product metafields from a desired-state file
+def sync_metafields(desired_file, cache_path, prune=False, refresh=False, dry_run=False, client=None):
+    """
+    Runs a complete sync and returns a report with the number of adds, updates, deletes,
+    no-ops and failures.
+    """
+    desired_state = load_desired_state(desired_file)
+    namespaces = {record["namespace"] for record in desired_state.values()}
+    remote_state = load_remote_state(cache_path, namespaces, refresh=refresh, client=client)
+    plan = plan_sync(desired_state, remote_state, prune=prune)
+
+    report = {change: len(items) for change, items in plan.items()}
+    if not dry_run:
+        failures = apply_sync(plan, remote_state, client=client)
+        save_remote_state(cache_path, remote_state)
+        report["failed"] = [{"item": item, "errors": messages} for item, messages in failures]
+    return report
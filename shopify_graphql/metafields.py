@@ -0,0 +1,439 @@
+"""
+Metafield operations: set, look up, list and delete metafields, one at a time or in bulk.
+"""
+
+# Importing the necessary packages
+import csv
+import fnmatch
+import json
+import threading
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from .bulk_operations import run_bulk_query
+from .client import get_client, raise_for_errors
+from .cost import MAX_QUERY_COST
+from .pagination import paginate
+
+METAFIELDS_SET_LIMIT = 25   # Maximum number of inputs accepted by one metafieldsSet call
+DELETE_BATCH_SIZE = 250     # Metafield identifiers sent in one metafieldsDelete call
+
+# One metafield to write; the fields match the MetafieldsSetInput of the mutation
+MetafieldRow = namedtuple("MetafieldRow", ["owner_id", "namespace", "key", "value", "type"])
+
+# Selection of every metafield returned by the lookups
+METAFIELD_FIELDS = """
+    id
+    namespace
+    key
+    value
+    type
+"""
+
+PRODUCT_METAFIELDS_QUERY = f"""
+query getProductMetafields($id: ID!, $first: Int!, $after: String, $namespace: String) {{
+    product(id: $id) {{
+        id
+        title
+        metafields(first: $first, after: $after, namespace: $namespace) {{
+            edges {{
+                node {{ {METAFIELD_FIELDS} }}
+            }}
+            pageInfo {{
+                hasNextPage
+                endCursor
+            }}
+        }}
+    }}
+}}
+"""
+
+SET_METAFIELDS_MUTATION = """
+mutation setMetafields($metafields: [MetafieldsSetInput!]!) {
+    metafieldsSet(metafields: $metafields) {
+        metafields {
+            id
+            namespace
+            key
+            value
+            type
+        }
+        userErrors {
+            field               # Path of the failing input, e.g. ["metafields", "3", "value"]
+            message
+            code
+        }
+    }
+}
+"""
+
+DELETE_METAFIELD_MUTATION = """
+mutation deleteMetafield($id: ID!) {
+    metafieldDelete(input: {id: $id}) {
+        deletedId
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+DELETE_METAFIELDS_MUTATION = """
+mutation deleteMetafields($metafields: [MetafieldIdentifierInput!]!) {
+    metafieldsDelete(metafields: $metafields) {
+        deletedMetafields {
+            ownerId
+            namespace
+            key
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+DISCOVER_METAFIELDS_QUERY = """
+query discoverMetafields($first: Int!, $after: String, $query: String, $namespace: String!) {
+    products(first: $first, after: $after, query: $query) {
+        edges {
+            node {
+                id
+                metafields(first: 25, namespace: $namespace) {
+                    edges {
+                        node {
+                            id
+                            namespace
+                            key
+                        }
+                    }
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                }
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+
+# Function to retrieve the first metafields of a product
+def retrieve_product_metafields(product_id, first=10, namespace=None, client=None):
+    """
+    Retrieves the first `first` metafields of a product (at most 250) as a raw response.
+    Use retrieve_all_product_metafields when every metafield is needed.
+    """
+    variables = {"id": product_id, "first": first, "after": None, "namespace": namespace}
+    return get_client(client).execute(PRODUCT_METAFIELDS_QUERY, variables, cost=first + 3)
+
+
+# Function to retrieve every metafield of a product, following all pages
+def retrieve_all_product_metafields(product_id, namespace=None, client=None):
+    """
+    Returns a dict of {(namespace, key): metafield node} holding every metafield of the product.
+    Namespaces and keys are lowercased, matching the case-insensitive comparison of the scripts.
+    """
+    nodes = paginate(PRODUCT_METAFIELDS_QUERY, {"id": product_id, "namespace": namespace},
+                     ("product", "metafields"), page_size=250, client=client)
+    return {(node["namespace"].lower(), node["key"].lower()): node for node in nodes}
+
+
+# Function to build the aliased query looking up metafields on several products
+def build_keyed_metafields_query(product_count, identifier_count):
+    """
+    Builds a query with one `pN: product(id: $pN)` alias per product and, inside it, one
+    `kM: metafield(namespace: $nM, key: $kM)` alias per namespace/key pair.
+    """
+    variable_definitions = [f"$p{i}: ID!" for i in range(product_count)]
+    variable_definitions += [f"$n{j}: String!, $k{j}: String!" for j in range(identifier_count)]
+    metafield_selections = "\n".join(
+        f"k{j}: metafield(namespace: $n{j}, key: $k{j}) {{ {METAFIELD_FIELDS} }}" for j in range(identifier_count)
+    )
+    product_selections = "\n".join(
+        f"p{i}: product(id: $p{i}) {{ id\n{metafield_selections} }}" for i in range(product_count)
+    )
+    return f"query keyedMetafields({', '.join(variable_definitions)}) {{\n{product_selections}\n}}"
+
+
+# Function to fetch specific metafields of many products directly by namespace and key
+def retrieve_metafields_by_key(product_ids, identifiers, client=None):
+    """
+    Fetches the metafields identified by `identifiers` (a list of (namespace, key) pairs) for
+    every product, packing as many products per request as the query cost limit allows.
+
+    Returns a dict of {product_id: {(namespace, key): metafield node or None}}; products that
+    do not exist are left out.
+    """
+    client = get_client(client)
+    identifiers = list(identifiers)
+    # Each product costs 1 point plus 1 point per requested metafield
+    products_per_query = max(1, MAX_QUERY_COST // (1 + len(identifiers)))
+    results = {}
+    for start in range(0, len(product_ids), products_per_query):
+        batch = product_ids[start:start + products_per_query]
+        query = build_keyed_metafields_query(len(batch), len(identifiers))
+        variables = {f"p{i}": product_id for i, product_id in enumerate(batch)}
+        for j, (namespace, key) in enumerate(identifiers):
+            variables[f"n{j}"] = namespace
+            variables[f"k{j}"] = key
+
+        data = raise_for_errors(client.execute(query, variables, cost=len(batch) * (1 + len(identifiers))),
+                                "Keyed metafield lookup")
+        for i, product_id in enumerate(batch):
+            product = data["data"][f"p{i}"]
+            if product is not None:
+                results[product_id] = {identifier: product[f"k{j}"] for j, identifier in enumerate(identifiers)}
+    return results
+
+
+# Function to set (create or update) a single metafield
+def set_metafield(owner_id, namespace, key, value, value_type, client=None):
+    return set_metafields([MetafieldRow(owner_id, namespace, key, value, value_type)], client=client)
+
+
+# Function to set a batch of metafields in a single metafieldsSet call
+def set_metafields(batch, client=None):
+    """
+    Sends one metafieldsSet mutation for up to 25 metafields, which may belong to different owners.
+    """
+    variables = {
+        "metafields": [
+            {"ownerId": row.owner_id, "namespace": row.namespace, "key": row.key, "value": row.value,
+             "type": row.type}
+            for row in batch
+        ]
+    }
+    return get_client(client).execute(SET_METAFIELDS_MUTATION, variables)
+
+
+# Function to delete a metafield of a product
+def delete_product_metafield(metafield_id, client=None):
+    return get_client(client).execute(DELETE_METAFIELD_MUTATION, {"id": metafield_id})
+
+
+# Function to read metafield rows from a CSV file
+def read_metafield_rows(csv_path):
+    """
+    Yields one MetafieldRow per line of a CSV file with the columns
+    owner_id, namespace, key, value and type.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        for record in csv.DictReader(csv_file):
+            yield MetafieldRow(
+                record["owner_id"], record["namespace"], record["key"], record["value"], record["type"]
+            )
+
+
+# Function to pack a stream of rows into batches accepted by metafieldsSet
+def batch_metafield_rows(rows, batch_size=METAFIELDS_SET_LIMIT):
+    """
+    Groups any iterable of (owner_id, namespace, key, value, type) tuples into lists of at
+    most `batch_size` MetafieldRows. Rows are consumed lazily, one batch at a time.
+    """
+    if not 1 <= batch_size <= METAFIELDS_SET_LIMIT:
+        raise ValueError(f"batch_size must be between 1 and {METAFIELDS_SET_LIMIT}")
+    rows = iter(rows)
+    while True:
+        batch = [MetafieldRow(*row) for row in islice(rows, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+
+# Function to map the userErrors of a metafieldsSet response back to the batch rows
+def map_user_errors(batch, user_errors):
+    """
+    Returns a dict of {index in batch: [error messages]} built from the `field` path of each
+    userError. Errors that do not point at a single input are stored under the key None.
+    """
+    errors_by_index = {}
+    for error in user_errors:
+        field = error.get("field") or []
+        index = None
+        if len(field) >= 2 and field[0] == "metafields" and str(field[1]).isdigit():
+            index = int(field[1])
+            if index >= len(batch):
+                index = None
+        errors_by_index.setdefault(index, []).append(error["message"])
+    return errors_by_index
+
+
+# Function to write one batch, re-sending the valid rows when other rows fail
+def write_metafield_batch(batch, client=None):
+    """
+    Writes a batch and returns (written, failed), where `written` is a list of
+    (row, metafield_id) pairs and `failed` is a list of (row, error messages) pairs.
+    metafieldsSet is atomic, so the rows that did not fail are sent again without the failing ones.
+    """
+    written, failed = [], []
+    while batch:
+        response = set_metafields(batch, client=client)
+        if "errors" in response:
+            return written, failed + [(row, [e["message"] for e in response["errors"]]) for row in batch]
+
+        result = response["data"]["metafieldsSet"]
+        errors_by_index = map_user_errors(batch, result["userErrors"])
+        if not errors_by_index:
+            written.extend(zip(batch, [metafield["id"] for metafield in result["metafields"]]))
+            return written, failed
+
+        if None in errors_by_index:
+            # The error cannot be pinned to a single input, so the whole batch is reported
+            messages = errors_by_index.pop(None)
+            return written, failed + [(row, errors_by_index.get(i, []) + messages) for i, row in enumerate(batch)]
+
+        failed.extend((batch[index], messages) for index, messages in sorted(errors_by_index.items()))
+        batch = [row for index, row in enumerate(batch) if index not in errors_by_index]
+    return written, failed
+
+
+# Function to write any number of metafields using as few metafieldsSet calls as possible
+def bulk_set_metafields(rows, batch_size=METAFIELDS_SET_LIMIT, max_workers=4, client=None):
+    """
+    Streams rows into full metafieldsSet batches and sends them concurrently.
+    At most `max_workers * 2` batches are held in memory at any time.
+    Returns a summary with the number of batches, the written metafields and the failed rows.
+    """
+    client = get_client(client)
+    summary = {"batches": 0, "written": [], "failed": []}
+
+    def collect(futures):
+        for future in futures:
+            written, failed = future.result()
+            summary["written"].extend(written)
+            summary["failed"].extend(failed)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for batch in batch_metafield_rows(rows, batch_size):
+            pending.add(executor.submit(write_metafield_batch, batch, client))
+            summary["batches"] += 1
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        collect(pending)
+    return summary
+
+
+# Function to discover the metafields of a namespace with paginated products queries
+def discover_metafields_paginated(namespace, product_query=None, client=None):
+    """
+    Yields (product_id, metafield) pairs for every product metafield in `namespace`.
+    The namespace filter is applied by Shopify, so only candidate metafields are transferred.
+    """
+    client = get_client(client)
+    products = paginate(DISCOVER_METAFIELDS_QUERY, {"query": product_query, "namespace": namespace},
+                        ("products",), client=client)
+    for product in products:
+        for edge in product["metafields"]["edges"]:
+            yield product["id"], edge["node"]
+        page_info = product["metafields"]["pageInfo"]
+        if page_info["hasNextPage"]:
+            # Continue after the first page, which was yielded above and may already be deleted
+            remaining = paginate(PRODUCT_METAFIELDS_QUERY, {"id": product["id"], "namespace": namespace},
+                                 ("product", "metafields"), page_size=250, client=client,
+                                 after=page_info["endCursor"])
+            for node in remaining:
+                yield product["id"], node
+
+
+# Function to discover the metafields of a namespace with a bulk operation
+def discover_metafields_bulk(namespace, product_query=None, client=None):
+    """
+    Exports all products with their metafields in `namespace` through a bulk query and yields
+    (product_id, metafield) pairs. Best for very large catalogs.
+    """
+    products_arguments = f"(query: {json.dumps(product_query)})" if product_query else ""
+    bulk_query = f"""
+    {{
+        products{products_arguments} {{
+            edges {{
+                node {{
+                    id
+                    metafields(namespace: {json.dumps(namespace)}) {{
+                        edges {{
+                            node {{
+                                id
+                                namespace
+                                key
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}
+    """
+    for row in run_bulk_query(bulk_query, client=client):
+        if "__parentId" in row:
+            yield row["__parentId"], row
+
+
+# Function to delete a batch of metafields with one metafieldsDelete call
+def delete_metafields(identifiers, client=None):
+    """
+    Deletes the metafields identified by (owner_id, namespace, key) tuples.
+    Returns (deleted count, list of error messages).
+    """
+    variables = {
+        "metafields": [
+            {"ownerId": owner_id, "namespace": namespace, "key": key} for owner_id, namespace, key in identifiers
+        ]
+    }
+    data = get_client(client).execute(DELETE_METAFIELDS_MUTATION, variables)
+    if "errors" in data:
+        return 0, [error["message"] for error in data["errors"]]
+    result = data["data"]["metafieldsDelete"]
+    deleted = [metafield for metafield in result["deletedMetafields"] if metafield]
+    return len(deleted), [error["message"] for error in result["userErrors"]]
+
+
+# Function to purge all metafields matching a namespace and key pattern
+def purge_metafields(namespace, key_pattern="*", product_query=None, use_bulk=False, dry_run=True,
+                     max_workers=4, client=None):
+    """
+    Finds every product metafield in `namespace` whose key matches the shell-style
+    `key_pattern` (e.g. "legacy_*") and deletes them in concurrent metafieldsDelete batches.
+    With dry_run=True nothing is deleted and only the matches are counted.
+    """
+    client = get_client(client)
+    discover = discover_metafields_bulk if use_bulk else discover_metafields_paginated
+    matches = (
+        (owner_id, metafield["namespace"], metafield["key"])
+        for owner_id, metafield in discover(namespace, product_query, client=client)
+        if fnmatch.fnmatchcase(metafield["key"].lower(), key_pattern.lower())
+    )
+
+    report = {"matched": 0, "deleted": 0, "errors": []}
+    if dry_run:
+        report["matched"] = sum(1 for _ in matches)
+        return report
+
+    report_lock = threading.Lock()
+
+    def delete_batch(batch):
+        deleted, errors = delete_metafields(batch, client=client)
+        with report_lock:
+            report["deleted"] += deleted
+            report["errors"].extend(errors)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        while True:
+            batch = list(islice(matches, DELETE_BATCH_SIZE))
+            if not batch:
+                break
+            report["matched"] += len(batch)
+            futures.append(executor.submit(delete_batch, batch))
+        for future in futures:
+            future.result()
+    return report
@@ -0,0 +1,197 @@
+"""
+Compact typed records for orders, line items, addresses, products, variants and metafields.
+
+The records are decoded straight from GraphQL response nodes: edges/node wrappers are flattened
+into tuples, MoneyBags into a Decimal amount plus currency code, timestamps into datetimes, and
+repeated short strings (currencies, countries, statuses, metafield types, ...) are interned.
+Every record class uses __slots__, so a record holds no per-instance dict; an order with its line
+items takes a fraction of the memory of the nested response dicts it was decoded from.
+
+    from shopify_graphql.models import decode_orders
+    from shopify_graphql.orders import iter_orders
+
+    orders = list(decode_orders(iter_orders("created_at:>=2025-01-01")))
+"""
+
+# Importing the necessary packages
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+
+# Function to get the nodes of a connection, with or without edges { node }
+def connection_nodes(connection):
+    if not connection:
+        return []
+    if "edges" in connection:
+        return [edge["node"] for edge in connection["edges"]]
+    return connection.get("nodes") or []
+
+
+# Function to get the amount and currency of a MoneyBag or MoneyV2
+def decode_money(money):
+    """
+    Returns (Decimal amount, currency code). A MoneyBag is read in the shop currency when it has
+    one, otherwise in the presentment currency.
+    """
+    if not money:
+        return None, None
+    money = money.get("shopMoney") or money.get("presentmentMoney") or money
+    return Decimal(money["amount"]), intern(money.get("currencyCode"))
+
+
+# Function to parse a Shopify timestamp such as 2025-01-31T10:15:00Z
+def decode_datetime(value):
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Function to intern a short, often repeated string
+def intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """
+    Base class of the records: keyword construction, equality, repr and conversion back to plain
+    dicts for JSON output.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:3])
+        return f"{type(self).__name__}({fields}, ...)"
+
+    # Function to convert the record (and the records it holds) into plain values
+    def to_dict(self):
+        def plain(value):
+            if isinstance(value, Record):
+                return value.to_dict()
+            if isinstance(value, tuple):
+                return [plain(item) for item in value]
+            if isinstance(value, Decimal):
+                return str(value)
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return value
+
+        return {name: plain(getattr(self, name)) for name in self.__slots__}
+
+
+class Address(Record):
+    __slots__ = ("first_name", "last_name", "address1", "address2", "city", "province", "country", "zip", "phone")
+
+    @classmethod
+    def from_node(cls, node):
+        if not node:
+            return None
+        return cls(first_name=node.get("firstName"), last_name=node.get("lastName"),
+                   address1=node.get("address1"), address2=node.get("address2"), city=intern(node.get("city")),
+                   province=intern(node.get("province")), country=intern(node.get("country")),
+                   zip=node.get("zip"), phone=node.get("phone"))
+
+
+class LineItem(Record):
+    __slots__ = ("id", "title", "sku", "quantity", "variant_id", "unit_price", "currency")
+
+    @classmethod
+    def from_node(cls, node):
+        unit_price, currency = decode_money(node.get("originalUnitPriceSet"))
+        return cls(id=node.get("id"), title=intern(node.get("title")), sku=intern(node.get("sku")),
+                   quantity=node.get("quantity"), variant_id=(node.get("variant") or {}).get("id"),
+                   unit_price=unit_price, currency=currency)
+
+
+class Order(Record):
+    __slots__ = ("id", "name", "email", "created_at", "financial_status", "fulfillment_status", "customer_id",
+                 "customer_name", "billing_address", "shipping_address", "line_items", "total_price", "currency",
+                 "tags", "note")
+
+    @classmethod
+    def from_node(cls, node):
+        customer = node.get("customer") or {}
+        customer_name = " ".join(filter(None, (customer.get("firstName"), customer.get("lastName")))) or None
+        total_price, currency = decode_money(node.get("totalPriceSet"))
+        return cls(id=node.get("id"), name=node.get("name"), email=node.get("email"),
+                   created_at=decode_datetime(node.get("createdAt")),
+                   financial_status=intern(node.get("displayFinancialStatus")),
+                   fulfillment_status=intern(node.get("displayFulfillmentStatus")),
+                   customer_id=customer.get("id"), customer_name=customer_name,
+                   billing_address=Address.from_node(node.get("billingAddress")),
+                   shipping_address=Address.from_node(node.get("shippingAddress")),
+                   line_items=tuple(LineItem.from_node(item) for item in connection_nodes(node.get("lineItems"))),
+                   total_price=total_price, currency=currency,
+                   tags=tuple(intern(tag) for tag in node.get("tags") or ()), note=node.get("note"))
+
+
+class Variant(Record):
+    __slots__ = ("id", "product_id", "title", "sku", "price", "compare_at_price")
+
+    @classmethod
+    def from_node(cls, node, product_id=None):
+        compare_at_price = node.get("compareAtPrice")
+        return cls(id=node.get("id"), product_id=product_id or (node.get("product") or {}).get("id"),
+                   title=intern(node.get("title")), sku=node.get("sku"),
+                   price=Decimal(node["price"]) if node.get("price") is not None else None,
+                   compare_at_price=Decimal(compare_at_price) if compare_at_price is not None else None)
+
+
+class Metafield(Record):
+    __slots__ = ("id", "owner_id", "namespace", "key", "value", "type")
+
+    @classmethod
+    def from_node(cls, node, owner_id=None):
+        return cls(id=node.get("id"), owner_id=owner_id, namespace=intern(node.get("namespace")),
+                   key=intern(node.get("key")), value=node.get("value"), type=intern(node.get("type")))
+
+
+class Product(Record):
+    __slots__ = ("id", "title", "handle", "status", "vendor", "product_type", "description_html", "tags",
+                 "variants", "metafields")
+
+    @classmethod
+    def from_node(cls, node):
+        product_id = node.get("id")
+        return cls(id=product_id, title=node.get("title"), handle=node.get("handle"),
+                   status=intern(node.get("status")), vendor=intern(node.get("vendor")),
+                   product_type=intern(node.get("productType")), description_html=node.get("descriptionHtml"),
+                   tags=tuple(intern(tag) for tag in node.get("tags") or ()),
+                   variants=tuple(Variant.from_node(variant, product_id)
+                                  for variant in connection_nodes(node.get("variants"))),
+                   metafields=tuple(Metafield.from_node(metafield, product_id)
+                                    for metafield in connection_nodes(node.get("metafields"))))
+
+
+# Functions to decode streams of response nodes, e.g. from iter_orders or iter_products
+def decode_orders(nodes):
+    return (Order.from_node(node) for node in nodes)
+
+
+def decode_products(nodes):
+    return (Product.from_node(node) for node in nodes)
+
+
+def decode_variants(nodes):
+    return (Variant.from_node(node) for node in nodes)
+
+
+# Function to decode the order of a retrieve_order() response
+def decode_order_response(data):
+    order = (data.get("data") or {}).get("order")
+    return Order.from_node(order) if order else None
+
+
+# Function to decode the product of a retrieve_product() or retrieve_product_variant() response
+def decode_product_response(data):
+    product = (data.get("data") or {}).get("product")
+    return Product.from_node(product) if product else None
@@ -0,0 +1,59 @@
+"""
+Registry of the operations that can be called by name, e.g. from the daemon or across shops.
+"""
+
+# Importing the necessary packages
+import importlib
+import inspect
+
+# Operation name: (module, function, whether it only reads data)
+OPERATIONS = {
+    "orders.get": ("orders", "retrieve_order", True),
+    "orders.create": ("orders", "create_order", False),
+    "orders.update": ("orders", "update_order", False),
+    "orders.add_tags": ("orders", "add_order_tags", False),
+    "orders.remove_tags": ("orders", "remove_order_tags", False),
+    "orders.fulfill": ("fulfillments", "fulfill_order_items", False),
+    "orders.refund": ("refunds", "refund_order_items", False),
+    "slips.render": ("packing_slips", "render_packing_slip", False),
+    "products.get": ("products", "retrieve_product", True),
+    "products.create": ("products", "create_product", False),
+    "products.update": ("products", "update_product", False),
+    "products.delete": ("products", "delete_product", False),
+    "variants.get": ("variants", "retrieve_product_variants", True),
+    "variants.create": ("variants", "create_variant", False),
+    "metafields.get": ("metafields", "retrieve_product_metafields", True),
+    "metafields.set": ("metafields", "set_metafield", False),
+    "metafields.delete": ("metafields", "delete_product_metafield", False),
+}
+
+# Writes that create something new each time they run, so running one again after an error that
+# leaves open whether it was applied (a timeout, a dropped connection) could double an order,
+# a fulfillment or a refund
+NON_IDEMPOTENT_OPERATIONS = {"orders.create", "orders.fulfill", "orders.refund", "products.create", "variants.create"}
+
+
+# Function to get the function implementing an operation, importing its module on first use
+def resolve_operation(operation):
+    if operation not in OPERATIONS:
+        raise KeyError(f"Unknown operation {operation}")
+    module_name, function_name, _ = OPERATIONS[operation]
+    return getattr(importlib.import_module(f".{module_name}", __package__), function_name)
+
+
+class InvalidArgumentsError(TypeError):
+    """
+    Raised when keyword arguments do not fit the signature of an operation.
+    """
+
+
+# Function to check that keyword arguments fit an operation before running it
+def bind_arguments(operation, arguments):
+    """
+    Raises InvalidArgumentsError when `arguments` lack a required argument or hold an unknown
+    one, so that invalid arguments are told apart from TypeErrors raised while the operation runs.
+    """
+    try:
+        inspect.signature(resolve_operation(operation)).bind(**arguments, client=None)
+    except TypeError as error:
+        raise InvalidArgumentsError(f"Invalid arguments for {operation}: {error}") from None
@@ -0,0 +1,133 @@
+"""
+Bulk tagging: add or remove tags on every order matching a search query.
+
+The matching orders are streamed with their current tags through a paginated search, and each
+order needing a change gets one request running tagsAdd and/or tagsRemove with only the tags it
+is missing or still has; like Shopify, tags are compared without regard to case. Requests run
+concurrently and are paced by the client's cost budget. With a progress file every successfully
+tagged order is logged as it completes, and a rerun with the same file skips those orders, so an
+interrupted run can be resumed and retries the orders that failed.
+
+    from shopify_graphql.order_tagging import tag_orders
+
+    report = tag_orders("financial_status:paid created_at:>2026-10-01", add=["Reviewed"],
+                        dry_run=False, progress_path="reviewed.progress.jsonl")
+"""
+
+# Importing the necessary packages
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+from .client import get_client
+from .order_updates import send_order_update
+from .pagination import paginate
+
+ORDER_TAGS_QUERY = """
+query orderTags($first: Int!, $after: String, $query: String) {
+    orders(first: $first, after: $after, query: $query) {
+        edges {
+            node {
+                id
+                tags
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+
+# Function to read the orders a previous run has tagged from its progress file
+def load_progress(progress_path):
+    done = set()
+    if progress_path and os.path.exists(progress_path):
+        with open(progress_path, encoding="utf-8") as progress_file:
+            for line in progress_file:
+                if line.strip():
+                    entry = json.loads(line)
+                    if not entry["errors"]:
+                        done.add(entry["id"])
+    return done
+
+
+# Function to add and remove tags on every order matching a search query
+def tag_orders(search_query, add=(), remove=(), dry_run=True, max_workers=8, progress_path=None, client=None,
+               on_result=None):
+    """
+    Adds the tags in `add` and removes the tags in `remove` on every order matching
+    `search_query`. Orders that already have the wanted tags are not changed, and orders logged
+    as done in `progress_path` are skipped. A dry run only counts the orders that would change.
+    `on_result(order_id, errors)` is called after every tagged order.
+
+    Returns a report: orders matched, skipped as done, unchanged, tagged and failed (with their
+    errors), and the seconds taken.
+    """
+    client = get_client(client)
+    # Shopify tags are case-insensitive, so "vip" and "VIP" are the same tag
+    add = {tag.casefold(): tag for tag in add}
+    remove = {tag.casefold() for tag in remove}
+    if not add and not remove:
+        raise ValueError("No tags to add or remove")
+    if add.keys() & remove:
+        raise ValueError(f"Tags both added and removed: {sorted(add.keys() & remove)}")
+
+    started = time.perf_counter()
+    done = load_progress(progress_path)
+    report = {"matched": 0, "skipped_done": 0, "unchanged": 0, "tagged": 0, "failed": {}}
+    progress = open(progress_path, "a", encoding="utf-8") if progress_path and not dry_run else None
+    in_flight = {}              # Order ID of every request still running
+
+    # Only orders whose update succeeded are logged as done, so a rerun retries the failed ones
+    def record(future):
+        order_id = in_flight.pop(future)
+        try:
+            errors = future.result()
+        except Exception as error:
+            errors = [f"{type(error).__name__}: {error}"]
+        if errors:
+            report["failed"][order_id] = errors
+        else:
+            report["tagged"] += 1
+            if progress:
+                progress.write(json.dumps({"id": order_id, "errors": []}) + "\n")
+                progress.flush()
+        if on_result:
+            on_result(order_id, errors)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for node in paginate(ORDER_TAGS_QUERY, {"query": search_query}, ("orders",), client=client):
+                report["matched"] += 1
+                if node["id"] in done:
+                    report["skipped_done"] += 1
+                    continue
+                tags = {tag.casefold() for tag in node["tags"]}
+                missing = [tag for folded, tag in add.items() if folded not in tags]
+                present = [tag for tag in node["tags"] if tag.casefold() in remove]
+                if not missing and not present:
+                    report["unchanged"] += 1
+                    continue
+                if dry_run:
+                    report["tagged"] += 1
+                    continue
+                # Only a few pages of orders wait for a worker, however many orders match
+                if len(in_flight) >= max_workers * 4:
+                    for future in wait(in_flight, return_when=FIRST_COMPLETED).done:
+                        record(future)
+                future = executor.submit(send_order_update, node["id"], missing, present, client=client)
+                in_flight[future] = node["id"]
+            for future in as_completed(list(in_flight)):
+                record(future)
+    finally:
+        if progress:
+            progress.close()
+
+    if dry_run:
+        report["would_tag"] = report.pop("tagged")
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    return report
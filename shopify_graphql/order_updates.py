@@ -0,0 +1,211 @@
+"""
+Write-behind queue merging the tag and note changes of orders over a short window.
+
+Automations changing the tags of an order several times a minute would otherwise send one
+mutation per change, and with update_order() also read the order first and overwrite its whole
+tag list, losing changes made in between. The queue keeps the pending tag additions, tag
+removals and note of every order; when the order's window has passed they are sent as one
+request running tagsAdd, tagsRemove and, for the note, orderUpdate. tagsAdd and tagsRemove
+change only the given tags, so no read is needed and concurrent changes are kept.
+
+    from shopify_graphql.order_updates import OrderUpdateQueue
+
+    with OrderUpdateQueue(window=5) as queue:
+        queue.add_tags(order_id, ["Priority"])
+        queue.remove_tags(order_id, ["Backorder"])
+        queue.set_note(order_id, "Customer requested express delivery.")
+"""
+
+# Importing the necessary packages
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import get_client
+
+USER_ERRORS = "userErrors { field message }"
+UPDATE_MUTATIONS = {}       # Mutations by the kinds of changes they apply
+NO_NOTE = object()          # Marks updates leaving the note unchanged
+
+
+class PendingUpdate:
+    """
+    The changes queued for one order: tags to add, tags to remove and the new note. Like
+    Shopify, tags are compared without regard to case, so they are keyed on their casefolded form.
+    """
+    __slots__ = ("add", "remove", "note", "has_note", "changes", "queued_at")
+
+    def __init__(self):
+        self.add = {}
+        self.remove = {}
+        self.note = None
+        self.has_note = False
+        self.changes = 0
+        self.queued_at = time.monotonic()
+
+
+# Function to build the mutation applying a pending update (cached per combination of changes)
+def update_mutation(add, remove, note):
+    key = (add, remove, note)
+    if key not in UPDATE_MUTATIONS:
+        definitions, fields = ["$id: ID!"], []
+        if add:
+            definitions.append("$add: [String!]!")
+            fields.append(f"tagsAdd(id: $id, tags: $add) {{ {USER_ERRORS} }}")
+        if remove:
+            definitions.append("$remove: [String!]!")
+            fields.append(f"tagsRemove(id: $id, tags: $remove) {{ {USER_ERRORS} }}")
+        if note:
+            definitions.append("$input: OrderInput!")
+            fields.append(f"orderUpdate(input: $input) {{ {USER_ERRORS} }}")
+        UPDATE_MUTATIONS[key] = f"mutation updateOrderTagsAndNote({', '.join(definitions)}) {{\n    " + \
+            "\n    ".join(fields) + "\n}"
+    return UPDATE_MUTATIONS[key]
+
+
+# Function to apply tag additions, tag removals and a note to an order in one request
+def send_order_update(order_id, add=(), remove=(), note=NO_NOTE, client=None):
+    """
+    Returns the errors Shopify reported, or an empty list. The note is only changed when one is
+    given; None clears it. Without any change no request is sent.
+    """
+    if not add and not remove and note is NO_NOTE:
+        return []
+    variables = {"id": order_id}
+    if add:
+        variables["add"] = sorted(add)
+    if remove:
+        variables["remove"] = sorted(remove)
+    if note is not NO_NOTE:
+        variables["input"] = {"id": order_id, "note": note}
+    mutation = update_mutation(bool(add), bool(remove), note is not NO_NOTE)
+    try:
+        data = get_client(client).execute(mutation, variables, cost=10 * (len(variables) - 1))
+    except Exception as error:
+        return [f"{type(error).__name__}: {error}"]
+    errors = [error["message"] for error in data.get("errors", [])]
+    for field in (data.get("data") or {}).values():
+        errors.extend(f"{error['field']}: {error['message']}" for error in (field or {}).get("userErrors", []))
+    return errors
+
+
+class OrderUpdateQueue:
+    """
+    Collects tag and note changes per order and flushes every order `window` seconds after its
+    first pending change, with up to `max_workers` requests in flight. Changes queued for an
+    order while its previous flush is running wait for the next one, so they apply in order.
+    `on_result(order_id, result)` is called after every flush; result holds the "changes" it
+    merged and the "errors" Shopify reported, if any.
+    """
+
+    def __init__(self, window=2.0, max_workers=4, client=None, on_result=None):
+        self.window = window
+        self.client = get_client(client)
+        self.on_result = on_result
+        self.pending = {}
+        self.flushing = set()
+        self.lock = threading.Condition()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stats = {"changes": 0, "flushes": 0, "requests_saved": 0, "failed": 0}
+        self.closed = False
+        self.timer = threading.Thread(target=self.run, name="order-update-queue", daemon=True)
+        self.timer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Function to get the pending update of an order, creating it on first use
+    def pending_update(self, order_id):
+        if self.closed:
+            raise RuntimeError("The order update queue is closed")
+        update = self.pending.get(order_id)
+        if update is None:
+            update = self.pending[order_id] = PendingUpdate()
+            self.lock.notify()
+        update.changes += 1
+        self.stats["changes"] += 1
+        return update
+
+    # Functions to queue changes; a later change of the same tag or note replaces an earlier one
+    def add_tags(self, order_id, tags):
+        tags = {tag.casefold(): tag for tag in tags}
+        if not tags:
+            return
+        with self.lock:
+            update = self.pending_update(order_id)
+            update.add.update(tags)
+            for folded in tags:
+                update.remove.pop(folded, None)
+
+    def remove_tags(self, order_id, tags):
+        tags = {tag.casefold(): tag for tag in tags}
+        if not tags:
+            return
+        with self.lock:
+            update = self.pending_update(order_id)
+            update.remove.update(tags)
+            for folded in tags:
+                update.add.pop(folded, None)
+
+    def set_note(self, order_id, note):
+        with self.lock:
+            update = self.pending_update(order_id)
+            update.note, update.has_note = note, True
+
+    # Function to take the updates whose window has passed (or all of them) for flushing
+    def take_due(self, everything=False):
+        now = time.monotonic()
+        due = [
+            order_id for order_id, update in self.pending.items()
+            if order_id not in self.flushing and (everything or now - update.queued_at >= self.window)
+        ]
+        for order_id in due:
+            self.flushing.add(order_id)
+        return [(order_id, self.pending.pop(order_id)) for order_id in due]
+
+    # Function run by the timer thread, submitting due updates until the queue is closed
+    def run(self):
+        with self.lock:
+            while not self.closed:
+                for order_id, update in self.take_due():
+                    self.executor.submit(self.flush_order, order_id, update)
+                waits = [
+                    update.queued_at + self.window - time.monotonic()
+                    for order_id, update in self.pending.items() if order_id not in self.flushing
+                ]
+                self.lock.wait(max(0.01, min(waits)) if waits else None)
+
+    # Function to send the merged changes of one order
+    def flush_order(self, order_id, update):
+        note = update.note if update.has_note else NO_NOTE
+        errors = send_order_update(order_id, list(update.add.values()), list(update.remove.values()), note,
+                                   client=self.client)
+        with self.lock:
+            self.flushing.discard(order_id)
+            self.stats["flushes"] += 1
+            self.stats["requests_saved"] += update.changes - 1
+            self.stats["failed"] += bool(errors)
+            self.lock.notify_all()
+        if self.on_result:
+            self.on_result(order_id, {"changes": update.changes, "errors": errors})
+
+    # Function to send every pending change now and wait until they are applied
+    def flush(self):
+        with self.lock:
+            while self.pending or self.flushing:
+                for order_id, update in self.take_due(everything=True):
+                    self.executor.submit(self.flush_order, order_id, update)
+                if self.pending or self.flushing:
+                    self.lock.wait()
+
+    # Function to flush the pending changes and stop the queue
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.closed = True
+            self.lock.notify_all()
+        self.timer.join()
+        self.executor.shutdown()
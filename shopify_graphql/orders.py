@@ -0,0 +1,283 @@
+"""
+Order operations: create, retrieve and update orders, and add or remove their tags.
+"""
+
+# Importing the necessary packages
+from .client import get_client
+from .pagination import paginate
+
+# Address fields selected for billing and shipping addresses
+ADDRESS_FIELDS = """
+    firstName
+    lastName
+    address1                                # Primary address line
+    address2                                # Secondary address line (if any)
+    city
+    province                                # Province or state
+    country
+    zip                                     # Zip or postal code
+    phone
+"""
+
+RETRIEVE_ORDER_QUERY = f"""
+query getOrder($id: ID!) {{
+    order(id: $id) {{
+        id                                  # Unique Shopify order ID
+        name                                # Shopify-generated order name (e.g., #1001)
+        email                               # Email ID of the Customer
+        customer {{
+            firstName
+            lastName
+            email
+            phone
+        }}
+        billingAddress {{ {ADDRESS_FIELDS} }}
+        shippingAddress {{ {ADDRESS_FIELDS} }}
+        lineItems(first: 5) {{
+            edges {{
+                node {{
+                    title                   # Product title in the order
+                    quantity                # Quantity of the product ordered
+                    originalUnitPriceSet {{
+                        presentmentMoney {{
+                            amount          # Price per unit
+                            currencyCode
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        totalPriceSet {{
+            presentmentMoney {{
+                amount                      # Total order price
+                currencyCode
+            }}
+        }}
+        tags                                # Tags associated with this order
+        note                                # Notes associated with this order
+    }}
+}}
+"""
+
+CREATE_ORDER_MUTATION = f"""
+mutation OrderCreate($order: OrderCreateOrderInput!) {{
+    orderCreate(order: $order) {{
+        order {{
+            id
+            name
+            email
+            customer {{
+                firstName
+                lastName
+                email
+                phone
+            }}
+            billingAddress {{ {ADDRESS_FIELDS} }}
+            shippingAddress {{ {ADDRESS_FIELDS} }}
+            lineItems(first: 5) {{
+                edges {{
+                    node {{
+                        title
+                        quantity
+                        originalUnitPriceSet {{
+                            presentmentMoney {{
+                                amount
+                                currencyCode
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+            totalPriceSet {{
+                presentmentMoney {{
+                    amount
+                    currencyCode
+                }}
+            }}
+        }}
+        userErrors {{
+            field
+            message
+        }}
+    }}
+}}
+"""
+
+ORDERS_PAGE_QUERY = f"""
+query orders($first: Int!, $after: String, $query: String, $lineItemsFirst: Int!) {{
+    orders(first: $first, after: $after, query: $query) {{
+        edges {{
+            node {{
+                id
+                name
+                email
+                createdAt
+                displayFinancialStatus
+                displayFulfillmentStatus
+                customer {{
+                    id
+                    firstName
+                    lastName
+                    email
+                }}
+                billingAddress {{ {ADDRESS_FIELDS} }}
+                shippingAddress {{ {ADDRESS_FIELDS} }}
+                lineItems(first: $lineItemsFirst) {{
+                    edges {{
+                        node {{
+                            id
+                            title
+                            sku
+                            quantity
+                            variant {{
+                                id
+                            }}
+                            originalUnitPriceSet {{
+                                shopMoney {{
+                                    amount
+                                    currencyCode
+                                }}
+                            }}
+                        }}
+                    }}
+                }}
+                totalPriceSet {{
+                    shopMoney {{
+                        amount
+                        currencyCode
+                    }}
+                }}
+                tags
+                note
+            }}
+        }}
+        pageInfo {{
+            hasNextPage
+            endCursor
+        }}
+    }}
+}}
+"""
+
+UPDATE_ORDER_MUTATION = """
+mutation updateOrder($input: OrderInput!) {
+    orderUpdate(input: $input) {
+        order {
+            id
+            tags                            # Updated tags
+            note                            # Updated note
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+TAGS_ADD_MUTATION = """
+mutation addTags($id: ID!, $tags: [String!]!) {
+    tagsAdd(id: $id, tags: $tags) {
+        node {
+            id
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+TAGS_REMOVE_MUTATION = """
+mutation removeTags($id: ID!, $tags: [String!]!) {
+    tagsRemove(id: $id, tags: $tags) {
+        node {
+            id
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to retrieve order details
+def retrieve_order(order_id, client=None):
+    """
+    Retrieves the details of an order: customer, billing and shipping address, line items,
+    total price, tags and note.
+
+    Arguments:
+    order_id -- The unique Shopify order ID (GraphQL GID format)
+
+    Returns:
+    JSON response containing order details or error messages
+    """
+    return get_client(client).execute(RETRIEVE_ORDER_QUERY, {"id": order_id}, cost=20)
+
+
+# Function to iterate over every order matching a search query
+def iter_orders(search_query=None, line_items=10, page_size=None, client=None):
+    """
+    Yields every order matching `search_query` (e.g. "created_at:>=2025-01-01") with up to
+    `line_items` line items each. Without a `page_size` the page size adapts to the observed
+    throughput.
+    """
+    return paginate(ORDERS_PAGE_QUERY, {"query": search_query, "lineItemsFirst": line_items}, ("orders",),
+                    page_size=page_size, client=client)
+
+
+# Function to create an Order with the provided Customer Data and Line Items Data
+def create_order(line_items, customer_details, billing_address, shipping_address, client=None):
+    """
+    Creates an order in Shopify.
+
+    Returns:
+    JSON response containing the created order details or error messages
+    """
+    variables = {
+        "order": {
+            "email": customer_details["email"],
+            "billingAddress": billing_address,
+            "shippingAddress": shipping_address,
+            "lineItems": line_items,
+        }
+    }
+    return get_client(client).execute(CREATE_ORDER_MUTATION, variables)
+
+
+# Function to update order details
+def update_order(order_id, updated_tags=None, updated_note=None, client=None):
+    """
+    Updates the tags and note of an order. The tags replace the existing tags; tags or a note
+    given as None are left unchanged.
+
+    Returns:
+    JSON response confirming the update status
+    """
+    order_input = {"id": order_id}
+    if updated_tags is not None:
+        order_input["tags"] = updated_tags
+    if updated_note is not None:
+        order_input["note"] = updated_note
+    if len(order_input) == 1:
+        raise ValueError("No tags or note to update")
+    variables = {"input": order_input}
+    return get_client(client).execute(UPDATE_ORDER_MUTATION, variables)
+
+
+# Function to add tags to an order, keeping its other tags
+def add_order_tags(order_id, tags, client=None):
+    """
+    Adds `tags` to an order with tagsAdd. Unlike update_order(), the order does not have to be
+    read first, and tags added concurrently by others are not lost.
+    """
+    return get_client(client).execute(TAGS_ADD_MUTATION, {"id": order_id, "tags": list(tags)})
+
+
+# Function to remove tags from an order, keeping its other tags
+def remove_order_tags(order_id, tags, client=None):
+    return get_client(client).execute(TAGS_REMOVE_MUTATION, {"id": order_id, "tags": list(tags)})
@@ -0,0 +1,179 @@
+"""
+Packing slips: retrieve the order details a packing slip needs and render them as a PDF.
+
+ReportLab is only imported when a PDF is rendered. Install it using the Command - pip install reportlab
+"""
+
+# Importing the necessary packages
+import os
+
+from .client import get_client
+
+PACKING_SLIP_ADDRESS_FIELDS = """
+    name
+    address1
+    address2
+    city
+    province
+    country
+    zip
+    phone
+"""
+
+ORDER_DETAILS_QUERY = f"""
+query getOrder($id: ID!) {{
+    order(id: $id) {{
+        id
+        name
+        createdAt                                   # Timestamp of order creation
+        billingAddress {{ {PACKING_SLIP_ADDRESS_FIELDS} }}
+        shippingAddress {{ {PACKING_SLIP_ADDRESS_FIELDS} }}
+        currentSubtotalPriceSet {{                   # Total of all items before tax/shipping
+            shopMoney {{
+                amount
+                currencyCode
+            }}
+        }}
+        totalShippingPriceSet {{
+            shopMoney {{
+                amount
+                currencyCode
+            }}
+        }}
+        totalTaxSet {{
+            shopMoney {{
+                amount
+                currencyCode
+            }}
+        }}
+        totalPriceSet {{                             # Final total (subtotal + tax + shipping)
+            shopMoney {{
+                amount
+                currencyCode
+            }}
+        }}
+        lineItems(first: 10) {{
+            edges {{
+                node {{
+                    title
+                    quantity
+                    sku
+                    originalUnitPriceSet {{
+                        shopMoney {{
+                            amount
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}
+}}
+"""
+
+
+# Function to retrieve full order details
+def get_order_details(order_id, client=None):
+    return get_client(client).execute(ORDER_DETAILS_QUERY, {"id": order_id}, cost=20)
+
+
+# Function to generate a detailed packing slip PDF
+def generate_packing_slip_pdf(order, store_name="<your_store_name>", output_dir=".", currency_symbol="₹"):
+    """
+    Renders the packing slip of an order (the "order" object of get_order_details) to
+    PackingSlip_<order number>.pdf in `output_dir` and returns the file path.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.pdfgen import canvas
+
+    file_name = os.path.join(output_dir, f"PackingSlip_{order['name'].replace('#', '')}.pdf")
+    c = canvas.Canvas(file_name, pagesize=letter)
+    width, height = letter
+    y = height - inch
+
+    # Store Name (centered)
+    c.setFont("Helvetica-Bold", 18)
+    c.drawCentredString(width / 2, y - 50, store_name)
+    y -= 80
+
+    # Order Summary
+    c.setFont("Helvetica", 12)
+    c.drawString(50, y, f"Order: {order['name']}")
+    c.drawRightString(width - 50, y, f"Order Date: {order['createdAt'][:10]}")
+    y -= 25
+
+    # Billing & Shipping Address side-by-side
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(50, y, "Billing Address")
+    c.drawRightString(width - 50, y, "Shipping Address")
+    y -= 15
+
+    c.setFont("Helvetica", 9)
+    bill = order['billingAddress'] or {}
+    ship = order['shippingAddress'] or {}
+    for i in range(6):
+        by = bill.get("name", "") if i == 0 else bill.get(f"address{i}", "") or ""
+        sy = ship.get("name", "") if i == 0 else ship.get(f"address{i}", "") or ""
+        if i == 3:
+            by = f"{bill.get('city', '')}, {bill.get('province', '')} {bill.get('zip', '')}"
+            sy = f"{ship.get('city', '')}, {ship.get('province', '')} {ship.get('zip', '')}"
+        elif i == 4:
+            by = bill.get('country', '')
+            sy = ship.get('country', '')
+        elif i == 5:
+            by = f"Phone: {bill.get('phone', '')}"
+            sy = f"Phone: {ship.get('phone', '')}"
+
+        c.drawString(50, y, by)
+        c.drawRightString(width - 50, y, sy)
+        y -= 12
+
+    y -= 20
+
+    # Line items
+    c.setFont("Helvetica-Bold", 11)
+    c.drawString(50, y, "Items:")
+    y -= 20
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(60, y, "Title")
+    c.drawCentredString(300, y, "SKU")
+    c.drawCentredString(380, y, "Qty")
+    c.drawRightString(width - 60, y, "Price")
+    y -= 12
+    c.line(50, y, width - 50, y)
+    y -= 10
+
+    c.setFont("Helvetica", 9)
+    for edge in order['lineItems']['edges']:
+        item = edge['node']
+        c.drawString(60, y, item['title'])
+        c.drawCentredString(300, y, item['sku'] or "-")
+        c.drawCentredString(380, y, str(item['quantity']))
+        c.drawRightString(width - 60, y, f"{currency_symbol}{item['originalUnitPriceSet']['shopMoney']['amount']}")
+        y -= 15
+
+    y -= 10
+    c.line(50, y, width - 50, y)
+    y -= 25
+
+    # Totals
+    c.setFont("Helvetica-Bold", 10)
+    for label, money_set in (("Subtotal:", "currentSubtotalPriceSet"), ("Shipping:", "totalShippingPriceSet"),
+                             ("Tax:", "totalTaxSet"), ("Total:", "totalPriceSet")):
+        c.drawRightString(width - 150, y, label)
+        c.drawRightString(width - 60, y, f"{currency_symbol}{order[money_set]['shopMoney']['amount']}")
+        y -= 15
+
+    # Footer
+    c.setFont("Helvetica-Oblique", 9)
+    c.drawString(50, 40, "Thank you for your purchase! This is a system-generated packing slip.")
+    c.save()
+    return file_name
+
+
+# Function to retrieve an order and render its packing slip
+def render_packing_slip(order_id, store_name="<your_store_name>", output_dir=".", client=None):
+    data = get_order_details(order_id, client=client)
+    if data.get("errors") or not data["data"]["order"]:
+        raise RuntimeError(f"Order {order_id} could not be retrieved: {data.get('errors')}")
+    return generate_packing_slip_pdf(data["data"]["order"], store_name=store_name, output_dir=output_dir)
@@ -0,0 +1,140 @@
+"""
+Cursor pagination over Shopify GraphQL connections.
+
+Paginated queries run without a fixed page size adapt it while they run: a PageSizeTuner per
+client and query grows or shrinks `first` towards the most records per second, judged from the
+page latency and from the actualQueryCost Shopify reports, which is usually well below the
+requestedQueryCost the page size is limited by. The tuner also learns the ratio between the two,
+and every page reserves only the part of its requested cost it is expected to use from the
+client's cost budget.
+"""
+
+# Importing the necessary packages
+import threading
+import time
+
+from .client import get_client, raise_for_errors
+from .cost import MAX_QUERY_COST, estimate_query_cost, optimize_page_size
+
+
+# Function to get the connection at a path such as ("product", "metafields") from a response
+def connection_at(data, connection_path):
+    connection = data["data"]
+    for key in connection_path:
+        if connection is None:
+            return None
+        connection = connection[key]
+    return connection
+
+
+class PageSizeTuner:
+    """
+    Hill-climbs the page size of one paginated query between `minimum` and `maximum`.
+
+    After every full page the tuner estimates the records per second that page size sustains:
+    the lower of the rate the page was fetched at and the rate the throttle's restore rate allows
+    for its actualQueryCost. While the rate improves the page size keeps moving in the same
+    direction by `growth`; when it drops by more than `tolerance`, the direction is reversed.
+    The smoothed ratio of actualQueryCost to requestedQueryCost gives the expected cost of a page.
+    """
+
+    def __init__(self, page_size, maximum, minimum=1, growth=1.5, tolerance=0.05):
+        self.page_size = max(minimum, min(page_size, maximum))
+        self.maximum = maximum
+        self.minimum = minimum
+        self.growth = growth
+        self.tolerance = tolerance
+        self.direction = 1
+        self.last_rate = None
+        self.cost_ratio = None      # Smoothed actualQueryCost / requestedQueryCost
+        self.lock = threading.Lock()
+
+    # Function to learn from one fetched page and choose the next page size
+    def record(self, page_size, nodes, seconds, cost, restore_rate):
+        with self.lock:
+            if cost and cost.get("requestedQueryCost"):
+                ratio = cost["actualQueryCost"] / cost["requestedQueryCost"]
+                self.cost_ratio = ratio if self.cost_ratio is None else 0.7 * self.cost_ratio + 0.3 * ratio
+            if nodes < page_size:
+                # The last page of a connection says nothing about the page size
+                return self.page_size
+
+            rate = nodes / max(seconds, 0.001)
+            if cost and cost.get("actualQueryCost"):
+                rate = min(rate, restore_rate * nodes / cost["actualQueryCost"])
+            if self.last_rate is not None and rate < self.last_rate * (1 - self.tolerance):
+                self.direction = -self.direction
+            self.last_rate = rate
+
+            factor = self.growth if self.direction > 0 else 1 / self.growth
+            self.page_size = max(self.minimum, min(self.maximum, round(page_size * factor)))
+            return self.page_size
+
+    # Function to get the part of a page's requested cost it is expected to use
+    def expected_cost(self, requested_cost):
+        with self.lock:
+            if self.cost_ratio is None:
+                return requested_cost
+            return max(1, round(requested_cost * self.cost_ratio))
+
+    def stats(self):
+        with self.lock:
+            return {"page_size": self.page_size, "records_per_second": self.last_rate, "cost_ratio": self.cost_ratio}
+
+
+# Function to get the tuner of a query, creating it on first use
+def page_size_tuner(client, query, variables, cost_ceiling=MAX_QUERY_COST):
+    """
+    Tuners live on the client, so what one pagination learned carries over to the next run of
+    the same query. The largest page size within `cost_ceiling` bounds the tuner, and it starts
+    at a quarter of that. Integer variables, such as nested page sizes, change that bound, so
+    they are part of the tuner's key.
+    """
+    key = (query, cost_ceiling, tuple(sorted((k, v) for k, v in (variables or {}).items() if isinstance(v, int))))
+    with client.throttle_lock:
+        tuner = client.page_size_tuners.get(key)
+    if tuner is None:
+        maximum = optimize_page_size(query, "first", variables, ceiling=cost_ceiling)
+        tuner = PageSizeTuner(max(1, maximum // 4), maximum)
+        with client.throttle_lock:
+            tuner = client.page_size_tuners.setdefault(key, tuner)
+    return tuner
+
+
+# Function to iterate over every node of a paginated connection
+def paginate(query, variables, connection_path, page_size=None, cost=None, client=None,
+             cost_ceiling=MAX_QUERY_COST, after=None):
+    """
+    Yields the nodes of a connection page by page, following pageInfo.endCursor.
+
+    The query must declare $first: Int! and $after: String, pass them to the connection found at
+    `connection_path` (a tuple of keys below "data"), and select edges { node { ... } } and
+    pageInfo { hasNextPage endCursor } on it. With page_size=None the page size is tuned at
+    runtime (see PageSizeTuner) within the sizes whose estimated cost stays within `cost_ceiling`.
+    `cost` is the expected cost of one page and defaults to the estimate from shopify_graphql.cost.
+    With `after`, e.g. the endCursor of a page fetched by another query, the first page starts there.
+    """
+    client = get_client(client)
+    tuner = page_size_tuner(client, query, variables, cost_ceiling) if page_size is None else None
+    cursor = after
+    while True:
+        size = tuner.page_size if tuner else page_size
+        page_variables = dict(variables or {}, first=size, after=cursor)
+        page_cost = cost or estimate_query_cost(query, page_variables)
+        started = time.perf_counter()
+        data = raise_for_errors(
+            client.execute(query, page_variables, cost=page_cost,
+                           reserve=tuner.expected_cost(page_cost) if tuner else None),
+            "Paginated query",
+        )
+        connection = connection_at(data, connection_path)
+        if connection is None:
+            return
+        if tuner:
+            tuner.record(size, len(connection["edges"]), time.perf_counter() - started,
+                         data.get("extensions", {}).get("cost"), client.throttle_state["restore_rate"])
+        for edge in connection["edges"]:
+            yield edge["node"]
+        if not connection["pageInfo"]["hasNextPage"]:
+            return
+        cursor = connection["pageInfo"]["endCursor"]
@@ -0,0 +1,177 @@
+"""
+Bulk product creation from a file of product definitions.
+
+Large files are written to a bulk mutation variables file, uploaded through a staged upload and
+created with bulkOperationRunMutation running productSet. Small files are created with concurrent
+synchronous productSet calls instead. Every result is mapped back to the input row it came from.
+"""
+
+# Importing the necessary packages
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+
+from .bulk_operations import run_bulk_mutation
+from .client import get_client
+
+SMALL_BATCH_LIMIT = 100     # Up to this many products are created with concurrent productSet calls
+
+# The mutation run once per line of the variables file
+BULK_PRODUCT_SET_MUTATION = """
+mutation createProduct($input: ProductSetInput!) {
+    productSet(input: $input) {
+        product {
+            id
+            handle
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+PRODUCT_SET_MUTATION = """
+mutation createProduct($input: ProductSetInput!) {
+    productSet(input: $input, synchronous: true) {
+        product {
+            id
+            handle
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to stream product definitions from a JSONL or CSV file
+def read_product_definitions(file_path):
+    """
+    Yields one ProductSetInput dict per product.
+    JSONL files hold a complete ProductSetInput per line. CSV files use the columns title,
+    descriptionHtml, vendor, productType, status and tags (comma separated); empty cells are skipped.
+    """
+    with open(file_path, newline="", encoding="utf-8") as definitions_file:
+        if file_path.lower().endswith((".jsonl", ".ndjson")):
+            for line in definitions_file:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        for record in csv.DictReader(definitions_file):
+            definition = {field: value for field, value in record.items() if value and field != "tags"}
+            if record.get("tags"):
+                definition["tags"] = [tag.strip() for tag in record["tags"].split(",") if tag.strip()]
+            yield definition
+
+
+# Function to describe an input row in the results
+def row_label(definition):
+    return definition.get("handle") or definition.get("title", "")
+
+
+# Function to write the bulk mutation variables file
+def write_variables_file(definitions, jsonl_path):
+    """
+    Writes one {"input": definition} line per product and returns the list of row labels
+    (handle or title), indexed by line number, used to map the results back.
+    """
+    labels = []
+    with open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        for definition in definitions:
+            jsonl_file.write(json.dumps({"input": definition}, separators=(",", ":")) + "\n")
+            labels.append(row_label(definition))
+    return labels
+
+
+# Function to turn a productSet payload into a result row
+def product_set_result(line_number, label, product_set, errors):
+    product_set = product_set or {}
+    errors = list(errors) + product_set.get("userErrors", [])
+    return {
+        "line": line_number,
+        "row": label,
+        "product_id": (product_set.get("product") or {}).get("id"),
+        "errors": [error["message"] for error in errors],
+    }
+
+
+# Function to create products through a staged upload and bulkOperationRunMutation
+def create_products_bulk(definitions, jsonl_path="bulk_products.jsonl", client=None):
+    """
+    Yields one result per input row, mapped through the __lineNumber of the result file. When
+    the bulk operation fails part-way, the rows missing from its partial results are yielded as
+    failed.
+    """
+    client = get_client(client)
+    labels = write_variables_file(definitions, jsonl_path)
+    operation = run_bulk_mutation(BULK_PRODUCT_SET_MUTATION, jsonl_path, client=client)
+
+    result_url = operation["url"] or operation["partialDataUrl"]
+    if operation["status"] != "COMPLETED" and not result_url:
+        raise RuntimeError(f"Bulk operation ended as {operation['status']}: {operation['errorCode']}")
+    seen = set()
+    if result_url:
+        for result in client.stream_jsonl(result_url):
+            line_number = result["__lineNumber"]
+            seen.add(line_number)
+            yield product_set_result(
+                line_number,
+                labels[line_number] if line_number < len(labels) else None,
+                (result.get("data") or {}).get("productSet"),
+                result.get("errors", []),
+            )
+
+    missing_error = {"message": f"No result: the bulk operation ended as {operation['status']}"}
+    for line_number, label in enumerate(labels):
+        if line_number not in seen:
+            yield product_set_result(line_number, label, None, [missing_error])
+
+
+# Function to create a single product with a synchronous productSet call
+def create_product_set(line_number, definition, client=None):
+    data = get_client(client).execute(PRODUCT_SET_MUTATION, {"input": definition})
+    return product_set_result(
+        line_number, row_label(definition), (data.get("data") or {}).get("productSet"), data.get("errors", [])
+    )
+
+
+# Function to create a small batch of products with concurrent productSet calls
+def create_products_concurrently(definitions, max_workers=4, client=None):
+    client = get_client(client)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(lambda item: create_product_set(*item, client=client), enumerate(definitions))
+
+
+# Function to create all the products of a definitions file
+def bulk_create_products(file_path, results_path, client=None):
+    """
+    Creates every product of `file_path`, choosing concurrent productSet calls for small files
+    and a bulk mutation for large ones, and writes one CSV result row per input row.
+    Returns the number of created and failed products.
+    """
+    definitions = read_product_definitions(file_path)
+    first_definitions = list(islice(definitions, SMALL_BATCH_LIMIT + 1))
+    if len(first_definitions) <= SMALL_BATCH_LIMIT:
+        results = create_products_concurrently(first_definitions, client=client)
+    else:
+        # The rest of the file is streamed straight into the variables file
+        results = create_products_bulk(
+            chain(first_definitions, definitions), f"{os.path.splitext(results_path)[0]}_variables.jsonl",
+            client=client,
+        )
+
+    counts = {"created": 0, "failed": 0}
+    with open(results_path, "w", newline="", encoding="utf-8") as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=["line", "row", "product_id", "errors"])
+        writer.writeheader()
+        for result in results:
+            counts["created" if result["product_id"] else "failed"] += 1
+            writer.writerow(dict(result, errors="; ".join(result["errors"])))
+    return counts
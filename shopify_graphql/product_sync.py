@@ -0,0 +1,163 @@
+"""
+Field-level product sync: update only the product fields that differ from a desired-state file.
+"""
+
+# Importing the necessary packages
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import get_client, raise_for_errors
+from .gid import GidIndex
+from .products import UPDATE_PRODUCT_MUTATION
+
+UPDATABLE_FIELDS = ("title", "descriptionHtml", "handle", "vendor", "productType", "tags", "status")
+PRODUCTS_PER_LOOKUP = 100   # Products fetched in one nodes(ids:) lookup
+
+
+# Function to load the desired product fields from a JSON or CSV file
+def load_desired_products(file_path):
+    """
+    Reads records with an "id" column and any of the UPDATABLE_FIELDS. In CSV files tags are
+    comma separated and empty cells mean "leave this field alone".
+    Returns a dict of {product_id: {field: value}}.
+    """
+    with open(file_path, newline="", encoding="utf-8") as desired_file:
+        if file_path.lower().endswith(".json"):
+            records = json.load(desired_file)
+        else:
+            records = []
+            for record in csv.DictReader(desired_file):
+                record = {field: value for field, value in record.items() if value}
+                if "tags" in record:
+                    record["tags"] = [tag.strip() for tag in record["tags"].split(",") if tag.strip()]
+                records.append(record)
+    return {
+        record["id"]: {field: record[field] for field in UPDATABLE_FIELDS if field in record}
+        for record in records
+    }
+
+
+# Function to fetch the current values of the given fields in batches
+def fetch_current_products(product_ids, fields, client=None):
+    """
+    Fetches the current `fields` of all products with nodes(ids:) lookups.
+    Returns a dict of {product_id: {field: value}}; deleted products are left out.
+    """
+    client = get_client(client)
+    query = f"""
+    query currentProducts($ids: [ID!]!) {{
+        nodes(ids: $ids) {{
+            ... on Product {{
+                id
+                {" ".join(sorted(fields))}
+            }}
+        }}
+    }}
+    """
+    current = {}
+    for start in range(0, len(product_ids), PRODUCTS_PER_LOOKUP):
+        batch = product_ids[start:start + PRODUCTS_PER_LOOKUP]
+        data = raise_for_errors(client.execute(query, {"ids": batch}, cost=len(batch)), "Product lookup")
+        for node in data["data"]["nodes"]:
+            if node:
+                current[node.pop("id")] = node
+    return current
+
+
+# Function to load the current product fields from the cache or from Shopify
+def load_current_products(cache_path, product_ids, fields, refresh=False, client=None):
+    """
+    Returns the current fields as a GidIndex keyed on product numbers rather than GID strings.
+    """
+    cached = GidIndex("Product")
+    if not refresh and os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cached = GidIndex("Product", json.load(cache_file))
+
+    # Products or fields the cache does not know yet are fetched from Shopify
+    missing = [product_id for product_id in product_ids
+               if not fields.issubset(cached.get(product_id, {}))]
+    if missing:
+        for product_id, values in fetch_current_products(missing, fields, client=client).items():
+            cached.setdefault(product_id, {}).update(values)
+    return cached
+
+
+# Function to save the current product fields for the next run
+def save_current_products(cache_path, current):
+    temporary_path = f"{cache_path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as cache_file:
+        json.dump(dict(current.items()), cache_file)
+    os.replace(temporary_path, cache_path)
+
+
+# Function to compare the desired fields of a product with its current fields
+def changed_fields(desired, current):
+    """
+    Returns {field: desired value} for every field that differs. Tags are compared as sets,
+    since Shopify does not keep their order.
+    """
+    changes = {}
+    for field, value in desired.items():
+        current_value = current.get(field)
+        if field == "tags":
+            if sorted(value) != sorted(current_value or []):
+                changes[field] = value
+        elif value != current_value:
+            changes[field] = value
+    return changes
+
+
+# Function to update only the changed fields of a product
+def update_product_fields(product_id, changes, client=None):
+    data = get_client(client).execute(UPDATE_PRODUCT_MUTATION, {"input": dict(changes, id=product_id)})
+    if "errors" in data:
+        return [error["message"] for error in data["errors"]]
+    return [error["message"] for error in data["data"]["productUpdate"]["userErrors"]]
+
+
+# Function to sync product fields from a desired-state file
+def sync_products(desired_file, cache_path, refresh=False, dry_run=False, max_workers=4, client=None):
+    """
+    Updates only the products and fields that differ from the desired state.
+    Returns a report with the number of compared, unchanged, updated and failed products,
+    and how often each field changed.
+    """
+    client = get_client(client)
+    desired = load_desired_products(desired_file)
+    fields = {field for values in desired.values() for field in values}
+    current = load_current_products(cache_path, list(desired), fields, refresh=refresh, client=client)
+
+    updates = {}
+    for product_id, values in desired.items():
+        if product_id not in current:
+            continue  # The product no longer exists
+        changes = changed_fields(values, current[product_id])
+        if changes:
+            updates[product_id] = changes
+
+    missing = [product_id for product_id in desired if product_id not in current]
+    report = {
+        "compared": len(desired),
+        "missing": missing,
+        "unchanged": len(desired) - len(updates) - len(missing),
+        "field_changes": {field: sum(field in changes for changes in updates.values()) for field in sorted(fields)},
+    }
+    if dry_run:
+        report["would_update"] = len(updates)
+        return report
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = executor.map(lambda item: update_product_fields(*item, client=client), updates.items())
+        errors = dict(zip(updates, responses))
+
+    for product_id, changes in updates.items():
+        if not errors[product_id]:
+            current[product_id].update(changes)
+    save_current_products(cache_path, current)
+
+    report["updated"] = sum(1 for messages in errors.values() if not messages)
+    report["failed"] = {product_id: messages for product_id, messages in errors.items() if messages}
+    return report
@@ -0,0 +1,272 @@
+"""
+Product operations: create, retrieve, list, update and delete products, one at a time or in bulk.
+"""
+
+# Importing the necessary packages
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import get_client, raise_for_errors
+from .pagination import paginate
+
+NODES_PER_LOOKUP = 250      # Largest number of IDs accepted by one nodes(ids:) lookup
+
+RETRIEVE_PRODUCT_QUERY = """
+query getProduct($id: ID!) {
+    product(id: $id) {
+        id
+        title
+        descriptionHtml
+    }
+}
+"""
+
+RETRIEVE_PRODUCT_VARIANTS_QUERY = """
+query getProduct($id: ID!) {
+    product(id: $id) {
+        id
+        title
+        descriptionHtml
+        variants(first: 5) {
+            edges {
+                node {
+                    id
+                    title
+                    sku
+                    price
+                }
+            }
+        }
+        metafields(first: 5) {
+            edges {
+                node {
+                    namespace
+                    key
+                    value
+                }
+            }
+        }
+    }
+}
+"""
+
+PRODUCTS_PAGE_QUERY = """
+query listProducts($first: Int!, $after: String, $query: String) {
+    products(first: $first, after: $after, query: $query) {
+        edges {
+            node {
+                id
+                title
+                descriptionHtml
+                variants(first: 5) {
+                    edges {
+                        node {
+                            id
+                            title
+                            price
+                            sku
+                        }
+                    }
+                }
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+PRODUCT_IDS_QUERY = """
+query productIds($first: Int!, $after: String, $query: String) {
+    products(first: $first, after: $after, query: $query) {
+        edges {
+            node {
+                id
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+COUNT_PRODUCTS_QUERY = """
+query countProducts($query: String) {
+    productsCount(query: $query) {
+        count
+    }
+}
+"""
+
+EXISTING_NODES_QUERY = """
+query existingNodes($ids: [ID!]!) {
+    nodes(ids: $ids) {
+        id
+    }
+}
+"""
+
+CREATE_PRODUCT_MUTATION = """
+mutation createProduct($input: ProductInput!) {
+    productCreate(input: $input) {
+        product {
+            id
+            title
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+UPDATE_PRODUCT_MUTATION = """
+mutation updateProduct($input: ProductInput!) {
+    productUpdate(input: $input) {
+        product {
+            id
+            title
+            descriptionHtml
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+DELETE_PRODUCT_MUTATION = """
+mutation productDelete($id: ID!) {
+    productDelete(input: {id: $id}) {
+        deletedProductId
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to retrieve product details
+def retrieve_product(product_id, client=None):
+    return get_client(client).execute(RETRIEVE_PRODUCT_QUERY, {"id": product_id}, cost=1)
+
+
+# Function to retrieve a product with its first variants and metafields
+def retrieve_product_variant(product_id, client=None):
+    return get_client(client).execute(RETRIEVE_PRODUCT_VARIANTS_QUERY, {"id": product_id}, cost=15)
+
+
+# Function to retrieve the first page of products with their variants
+def fetch_all_products(first=10, client=None):
+    variables = {"first": first, "after": None, "query": None}
+    return get_client(client).execute(PRODUCTS_PAGE_QUERY, variables, cost=first * 7 + 2)
+
+
+# Function to iterate over every product of the store
+def iter_products(search_query=None, page_size=None, client=None):
+    """
+    Yields every product (with up to 5 variants) matching `search_query`, following all pages.
+    Without a `page_size` the page size adapts to the observed throughput.
+    """
+    return paginate(PRODUCTS_PAGE_QUERY, {"query": search_query}, ("products",),
+                    page_size=page_size, client=client)
+
+
+# Function to create a product
+def create_product(title, description_html, metafields=None, client=None):
+    """
+    Creates a product with a title, an HTML description and optional metafields
+    (a list of {namespace, key, value, type} dicts).
+    """
+    product_input = {"title": title, "descriptionHtml": description_html}
+    if metafields:
+        product_input["metafields"] = metafields
+    return get_client(client).execute(CREATE_PRODUCT_MUTATION, {"input": product_input})
+
+
+# Function to update product details
+def update_product(product_id, new_title, new_description, client=None):
+    variables = {"input": {"id": product_id, "title": new_title, "descriptionHtml": new_description}}
+    return get_client(client).execute(UPDATE_PRODUCT_MUTATION, variables)
+
+
+# Function to delete a product
+def delete_product(product_id, client=None):
+    return get_client(client).execute(DELETE_PRODUCT_MUTATION, {"id": product_id})
+
+
+# Function to stream the IDs of all products matching a search query
+def search_product_ids(search_query, client=None):
+    """
+    Yields the GID of every product matching `search_query` (Shopify search syntax).
+    Only the ID is selected, which keeps every page cheap.
+    """
+    for node in paginate(PRODUCT_IDS_QUERY, {"query": search_query}, ("products",), page_size=250, client=client):
+        yield node["id"]
+
+
+# Function to count the products matching a search query without listing them
+def count_products(search_query=None, client=None):
+    data = raise_for_errors(get_client(client).execute(COUNT_PRODUCTS_QUERY, {"query": search_query}, cost=1),
+                            "Product count")
+    return data["data"]["productsCount"]["count"]
+
+
+# Function to find which of the given objects still exist
+def find_existing_nodes(ids, client=None):
+    """
+    Looks the IDs up with nodes(ids:) in batches of NODES_PER_LOOKUP and returns the
+    list of IDs that still resolve to an object.
+    """
+    client = get_client(client)
+    existing = []
+    for start in range(0, len(ids), NODES_PER_LOOKUP):
+        batch = ids[start:start + NODES_PER_LOOKUP]
+        data = raise_for_errors(client.execute(EXISTING_NODES_QUERY, {"ids": batch}, cost=len(batch)),
+                                "Node lookup")
+        existing.extend(node["id"] for node in data["data"]["nodes"] if node)
+    return existing
+
+
+# Function to get the error messages of a productDelete response
+def delete_errors(data):
+    if "errors" in data:
+        return [error["message"] for error in data["errors"]]
+    return [error["message"] for error in data["data"]["productDelete"]["userErrors"]]
+
+
+# Function to delete many products concurrently and verify the result
+def bulk_delete_products(product_ids=None, search_query=None, dry_run=True, max_workers=8, client=None):
+    """
+    Deletes the products given as `product_ids` or matching `search_query` with concurrent
+    productDelete calls, then verifies the deletions with batched nodes(ids:) lookups.
+    A dry run only returns the number of products that would be deleted.
+    """
+    client = get_client(client)
+    if dry_run:
+        if search_query is not None:
+            return {"would_delete": count_products(search_query, client=client)}
+        return {"would_delete": len(find_existing_nodes(list(product_ids), client=client))}
+
+    # The IDs are collected before deleting, so deletions cannot shift the search pagination
+    if product_ids is None:
+        product_ids = search_product_ids(search_query, client=client)
+    product_ids = list(product_ids)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = executor.map(lambda product_id: delete_product(product_id, client=client), product_ids)
+        errors = {product_id: delete_errors(data) for product_id, data in zip(product_ids, responses)}
+
+    remaining = find_existing_nodes(product_ids, client=client)
+    return {
+        "requested": len(product_ids),
+        "deleted": len(product_ids) - len(remaining),
+        "remaining": remaining,
+        "errors": {product_id: messages for product_id, messages in errors.items() if messages},
+    }
@@ -0,0 +1,108 @@
+"""
+Refund operations: retrieve the refundable details of an order and refund it.
+"""
+
+# Importing the necessary packages
+from .client import get_client, raise_for_errors
+
+REFUND_DETAILS_QUERY = """
+query getOrder($id: ID!) {
+    order(id: $id) {
+        id
+        name
+        refunds {
+            id
+            note
+            createdAt
+        }
+        totalRefundedSet {
+            presentmentMoney {
+                amount
+                currencyCode
+            }
+        }
+        transactions {
+            id
+            gateway
+            kind
+            amount
+        }
+        lineItems(first: 10) {
+            edges {
+                node {
+                    id                              # Line Item ID required for refunds
+                    title
+                    quantity
+                    originalTotalSet {
+                        presentmentMoney {
+                            amount
+                            currencyCode
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+REFUND_ORDER_MUTATION = """
+mutation orderRefundCreate($input: RefundInput!) {
+    refundCreate(input: $input) {
+        refund {
+            id
+            note
+            totalRefundedSet {
+                presentmentMoney {
+                    amount
+                    currencyCode
+                }
+            }
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to retrieve the refunds, transactions and line items of an order
+def retrieve_refund_details(order_id, client=None):
+    return get_client(client).execute(REFUND_DETAILS_QUERY, {"id": order_id}, cost=20)
+
+
+# Function to refund an order
+def refund_order(order_id, refund_line_items, order_transaction_details, note=None, notify=True, client=None):
+    """
+    Refunds the given line items and transactions of an order, including the full shipping cost.
+    """
+    variables = {
+        "input": {
+            "orderId": order_id,
+            "note": note,
+            "refundLineItems": refund_line_items,
+            "notify": notify,
+            "shipping": {"fullRefund": True},
+            "transactions": order_transaction_details,
+        }
+    }
+    return get_client(client).execute(REFUND_ORDER_MUTATION, variables)
+
+
+# Function to refund one unit of every line item of an order
+def refund_order_items(order_id, note=None, notify=True, client=None):
+    """
+    Refunds one unit of each line item against the order's transactions, as the refund script does.
+    Returns the refundCreate response.
+    """
+    order = raise_for_errors(retrieve_refund_details(order_id, client=client), "Refund details lookup")
+    order = order["data"]["order"]
+    refund_line_items = [{"lineItemId": line["node"]["id"], "quantity": 1} for line in order["lineItems"]["edges"]]
+    order_transaction_details = [
+        {"orderId": order_id, "gateway": transaction["gateway"], "kind": "REFUND",
+         "amount": transaction["amount"], "parentId": transaction["id"]}
+        for transaction in order["transactions"]
+    ]
+    return refund_order(order_id, refund_line_items, order_transaction_details, note, notify, client=client)
@@ -0,0 +1,174 @@
+"""
+Vectorized repricing of variant prices with NumPy.
+
+Prices are held as int64 cents next to int64 product and variant IDs, rule sets are applied to the
+whole array at once, and only the changed prices are sent as productVariantsBulkUpdate calls.
+
+Install NumPy using the Command - pip install numpy
+"""
+
+# Importing the necessary packages
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .client import get_client
+from .gid import format_gid, gid_number
+from .pagination import paginate
+from .variants import VARIANTS_PER_CALL, bulk_update_variants
+
+VARIANT_PRICES_QUERY = """
+query variantPrices($first: Int!, $after: String, $query: String) {
+    productVariants(first: $first, after: $after, query: $query) {
+        edges {
+            node {
+                id
+                price
+                product {
+                    id
+                }
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+
+# Function to build the arrays holding the variant prices
+def build_price_arrays(rows):
+    """
+    Converts (product_id, variant_id, price) rows into a dict of NumPy arrays:
+    "product" and "variant" hold the numeric IDs (int64), "cents" the prices in cents (int64).
+    """
+    product_numbers, variant_numbers, prices = [], [], []
+    for product_id, variant_id, price in rows:
+        product_numbers.append(gid_number(product_id))
+        variant_numbers.append(gid_number(variant_id))
+        prices.append(price)
+    return {
+        "product": np.array(product_numbers, dtype=np.int64),
+        "variant": np.array(variant_numbers, dtype=np.int64),
+        "cents": np.rint(np.array(prices, dtype=np.float64) * 100).astype(np.int64),
+    }
+
+
+# Function to load variant prices from a catalog export
+def load_prices_from_csv(csv_path):
+    """
+    Reads a CSV file with the columns product_id, variant_id and price.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        return build_price_arrays(
+            (record["product_id"], record["variant_id"], record["price"]) for record in csv.DictReader(csv_file)
+        )
+
+
+# Function to load variant prices with a paginated productVariants query
+def load_prices_from_shopify(search_query=None, client=None):
+    nodes = paginate(VARIANT_PRICES_QUERY, {"query": search_query}, ("productVariants",), client=client)
+    return build_price_arrays((node["product"]["id"], node["id"], node["price"]) for node in nodes)
+
+
+# Function to apply a rule set to all prices at once
+def apply_price_rules(cents, rules):
+    """
+    Applies the rules in order to an int64 array of prices in cents and returns the new prices.
+
+    Supported rules:
+      {"type": "percent", "value": 5}           Move prices by a percentage (-10 lowers them by 10%)
+      {"type": "convert", "rate": 0.92}         Multiply by a currency conversion rate
+      {"type": "round", "step": 0.05}           Round to the nearest multiple of a step
+      {"type": "ending", "value": 0.99}         Raise to the next price ending in .99
+      {"type": "clamp", "min": 5, "max": 500}   Keep prices within a range (at least one bound)
+    """
+    prices = cents.astype(np.float64) / 100
+    for rule in rules:
+        if rule["type"] == "percent":
+            prices = prices * (1 + rule["value"] / 100)
+        elif rule["type"] == "convert":
+            prices = prices * rule["rate"]
+        elif rule["type"] == "round":
+            prices = np.round(prices / rule["step"]) * rule["step"]
+        elif rule["type"] == "ending":
+            # Smallest price with the given ending that is not below the current price
+            prices = np.ceil(np.round(prices - rule["value"], 6)) + rule["value"]
+        elif rule["type"] == "clamp":
+            low, high = rule.get("min"), rule.get("max")
+            if low is None and high is None:
+                raise ValueError("A clamp rule needs a min or a max")
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"Clamp rule with min {low} above max {high}")
+            prices = np.clip(prices, low, high)
+        else:
+            raise ValueError(f"Unknown price rule: {rule['type']}")
+    return np.rint(prices * 100).astype(np.int64)
+
+
+# Function to group the changed prices per product
+def changed_prices_by_product(arrays, new_cents):
+    """
+    Returns a dict of {product GID: [ProductVariantsBulkInput, ...]} holding only the
+    variants whose price changed. Raises a ValueError when a changed price is not positive.
+    """
+    changed = np.flatnonzero(new_cents != arrays["cents"])
+    if changed.size == 0:
+        return {}
+    not_positive = changed[new_cents[changed] <= 0]
+    if not_positive.size:
+        examples = [format_gid("ProductVariant", variant) for variant in arrays["variant"][not_positive[:5]].tolist()]
+        raise ValueError(f"The rules leave {not_positive.size} prices at or below zero, e.g. for {examples}")
+
+    # Sorting the changed rows by product lets every product be sliced out of the arrays directly
+    order = changed[np.argsort(arrays["product"][changed], kind="stable")]
+    boundaries = np.flatnonzero(np.diff(arrays["product"][order])) + 1
+
+    updates = {}
+    for group in np.split(order, boundaries):
+        product_id = format_gid("Product", arrays["product"][group[0]])
+        updates[product_id] = [
+            {"id": format_gid("ProductVariant", variant), "price": f"{cents // 100}.{cents % 100:02d}"}
+            for variant, cents in zip(arrays["variant"][group].tolist(), new_cents[group].tolist())
+        ]
+    return updates
+
+
+# Function to update the prices of one product in chunks
+def update_product_prices(product_id, variants, client=None):
+    result = {"product_id": product_id, "updated": 0, "errors": []}
+    for start in range(0, len(variants), VARIANTS_PER_CALL):
+        data = bulk_update_variants(product_id, variants[start:start + VARIANTS_PER_CALL], client=client)
+        if "errors" in data:
+            result["errors"].extend(error["message"] for error in data["errors"])
+            continue
+        payload = data["data"]["productVariantsBulkUpdate"]
+        result["updated"] += len(payload["productVariants"] or [])
+        result["errors"].extend(error["message"] for error in payload["userErrors"])
+    return result
+
+
+# Function to reprice variants and send only the changed prices
+def reprice_variants(arrays, rules, dry_run=True, max_workers=4, client=None):
+    started = time.perf_counter()
+    new_cents = apply_price_rules(arrays["cents"], rules)
+    updates = changed_prices_by_product(arrays, new_cents)
+    report = {
+        "variants": int(arrays["cents"].size),
+        "changed": sum(len(variants) for variants in updates.values()),
+        "products": len(updates),
+        "compute_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    if dry_run:
+        return report
+
+    client = get_client(client)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda item: update_product_prices(*item, client=client), updates.items()))
+    report["updated"] = sum(result["updated"] for result in results)
+    report["errors"] = {result["product_id"]: result["errors"] for result in results if result["errors"]}
+    return report
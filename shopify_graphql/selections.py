@@ -0,0 +1,329 @@
+"""
+Declarative selection sets: callers list the fields they read and get the smallest query for them.
+
+A selection is a list of entries, each one of
+    - a dotted field path, e.g. "name", "shippingAddress.city" or "lineItems.sku"
+    - a dict mapping a field (with its arguments, e.g. "lineItems(first: 5)") to a nested selection
+    - a Fragment, such as ADDRESS, MONEY_BAG or LINE_ITEM, whose fields are selected in place
+    - a Connection, selecting edges { node { ... } } (and optionally pageInfo) of a connection
+
+Object fields named in FIELD_DEFAULTS may be given without subfields: "shippingAddress" selects
+the ADDRESS fragment, "totalPriceSet" the MONEY_BAG fragment and "lineItems" a connection of
+LINE_ITEM, while "lineItems.sku" narrows the connection to the SKU alone. Connections such as
+variants, metafields, media or fulfillmentOrders are known the same way, so "variants.price" selects
+variants(first: 10) { edges { node { price } } }; a dotted path through any other field treats it as
+a plain object. In a dict the nested selection of a known connection selects its nodes, so
+{"lineItems(first: 50)": ["title"]} selects lineItems(first: 50) { edges { node { title } } }.
+A connection is selected only once: explicit arguments replace the default ones, and two
+different explicit arguments raise a ValueError. Paths to the same field are merged, so
+
+    from shopify_graphql.selections import fetch_node
+
+    fetch_node("order", order_id, ["name", "lineItems.title", "lineItems.quantity"])
+
+sends `query order($id:ID!){order(id:$id){name lineItems(first:10){edges{node{title quantity}}}}}`.
+The documents are minified, a fragment is defined once and spread only where that is shorter than
+repeating its fields, and every document is cached per selection.
+"""
+
+# Importing the necessary packages
+import re
+import threading
+from collections import namedtuple
+
+from .client import get_client
+from .cost import estimate_query_cost
+
+# A named set of fields of one GraphQL type
+Fragment = namedtuple("Fragment", ["name", "type_condition", "selection"])
+
+# The nodes of a connection, e.g. Connection("first: 10", LINE_ITEM)
+Connection = namedtuple("Connection", ["arguments", "selection", "page_info"], defaults=[False])
+
+FIELD_PATTERN = re.compile(r"^\s*(\w+)\s*(?:\((.*)\))?\s*$", re.S)
+
+
+# Function to turn lists and dicts of a selection into tuples, so selections can be cached
+def freeze(selection):
+    if isinstance(selection, Fragment):
+        return selection
+    if isinstance(selection, Connection):
+        return Connection(selection.arguments, freeze(selection.selection), selection.page_info)
+    if isinstance(selection, dict):
+        return ("dict", tuple((field, freeze(child)) for field, child in selection.items()))
+    if isinstance(selection, (list, tuple)):
+        return tuple(freeze(entry) for entry in selection)
+    return selection
+
+
+# Function to define a fragment
+def fragment(name, type_condition, selection):
+    return Fragment(name, type_condition, freeze(selection))
+
+
+MONEY = ["amount", "currencyCode"]
+MONEY_BAG = fragment("MoneyBag", "MoneyBag", [{"shopMoney": MONEY}])
+ADDRESS = fragment("Address", "MailingAddress", [
+    "firstName", "lastName", "address1", "address2", "city", "province", "country", "zip", "phone",
+])
+LINE_ITEM = fragment("LineItem", "LineItem", [
+    "id", "title", "quantity", "sku", "variant.id", {"originalUnitPriceSet": MONEY_BAG},
+])
+
+# What an object field named without subfields selects. Every connection field must be listed,
+# since paths below a connection go through its edges { node { ... } }
+FIELD_DEFAULTS = {
+    "billingAddress": ADDRESS,
+    "shippingAddress": ADDRESS,
+    "customer": freeze(["id", "firstName", "lastName", "email"]),
+    "variant": freeze(["id"]),
+    "product": freeze(["id", "title"]),
+    "shopMoney": freeze(MONEY),
+    "presentmentMoney": freeze(MONEY),
+    "fulfillments": freeze(["id", "status", "createdAt"]),
+    "refunds": freeze(["id", "note", "createdAt"]),
+    "transactions": freeze(["id", "kind", "status", "gateway", "amountSet"]),
+    # Connections of orders, products, customers and collections
+    "lineItems": Connection("first: 10", LINE_ITEM),
+    "fulfillmentOrders": Connection("first: 10", freeze(["id", "status"])),
+    "fulfillmentLineItems": Connection("first: 10", freeze(["id", "quantity"])),
+    "variants": Connection("first: 10", freeze(["id", "title", "sku", "price"])),
+    "metafields": Connection("first: 10", freeze(["id", "namespace", "key", "value", "type"])),
+    "media": Connection("first: 10", freeze(["id", "alt", "mediaContentType"])),
+    "images": Connection("first: 10", freeze(["id", "url", "altText"])),
+    "collections": Connection("first: 10", freeze(["id", "title", "handle"])),
+    "products": Connection("first: 10", freeze(["id", "title"])),
+    "orders": Connection("first: 10", freeze(["id", "name"])),
+    "events": Connection("first: 10", freeze(["id", "message", "createdAt"])),
+}
+MONEY_BAG_SUFFIX = "Set"           # totalPriceSet, originalUnitPriceSet, totalTaxSet, ...
+
+documents = {}
+documents_lock = threading.Lock()
+
+
+# Function to get what a field named without subfields selects
+def field_default(name):
+    if name in FIELD_DEFAULTS:
+        return FIELD_DEFAULTS[name]
+    if name.endswith(MONEY_BAG_SUFFIX):
+        return MONEY_BAG
+    return None
+
+
+# Function to get the entries of a selection that may also be a single entry
+def entries(selection):
+    if isinstance(selection, (str, Fragment, Connection)) or selection[:1] == ("dict",):
+        return (selection,)
+    return selection
+
+
+# Function to get the selection a default expands to, or a Connection's edges { node } wrapper
+def expand(child):
+    """
+    Returns a field's child as a dict of fields (a tree), the form entries are merged into.
+    """
+    if child is None:
+        return None
+    if isinstance(child, Connection):
+        tree = {"edges": {"node": expand(child.selection) or {}}}
+        if child.page_info:
+            tree["pageInfo"] = {"hasNextPage": None, "endCursor": None}
+        return tree
+    tree = {}
+    add_selection(tree, entries(child.selection if isinstance(child, Fragment) else child))
+    return tree
+
+
+# Function to merge a child into the tree below a field key
+def merge(tree, key, child):
+    if key not in tree or tree[key] is None:
+        tree[key] = child
+    elif child is not None and tree[key] != child:
+        existing = tree[key]
+        if isinstance(existing, Fragment):
+            existing = tree[key] = expand(existing)
+        for child_key, grandchild in (expand(child) if isinstance(child, Fragment) else child).items():
+            merge(existing, child_key, grandchild)
+
+
+# Function to add the entries of a selection to a tree of fields
+def add_selection(tree, selection):
+    """
+    Trees map field keys ("name", "lineItems(first: 10)") to None for leaves, to a Fragment
+    selected as a whole, or to a nested tree; a key "...Name" spreads a fragment in place.
+    """
+    for entry in selection:
+        if isinstance(entry, Fragment):
+            tree["..." + entry.name] = entry
+        elif isinstance(entry, Connection):
+            for key, child in expand(entry).items():
+                merge(tree, key, child)
+        elif isinstance(entry, tuple) and entry[:1] == ("dict",):
+            for field, child in entry[1]:
+                add_field(tree, field, child)
+        elif isinstance(entry, str):
+            add_path(tree, entry.split("."))
+        else:
+            raise TypeError(f"Unsupported selection entry: {entry!r}")
+
+
+# Function to add one field, with a nested selection, to a tree
+def add_field(tree, field, child):
+    default = field_default(FIELD_PATTERN.match(field).group(1))
+    if isinstance(child, Connection):
+        merge(tree, connection_slot(tree, connection_key(field, child), default), expand(child))
+    elif isinstance(default, Connection):
+        # The nested selection of a known connection selects the fields of its nodes
+        child = expand(child if isinstance(child, Fragment) else freeze(child)) or {}
+        if not child or set(child) - {"edges", "pageInfo"}:
+            child = {"edges": {"node": child or expand(default.selection)}}
+        merge(tree, connection_slot(tree, connection_key(field, default), default), child)
+    elif isinstance(child, Fragment):
+        merge(tree, field, child)
+    else:
+        merge(tree, field, expand(freeze(child)))
+
+
+# Function to build the key of a connection field, e.g. lineItems(first: 10)
+def connection_key(field, connection):
+    return field if "(" in field or not connection.arguments else f"{field}({connection.arguments})"
+
+
+# Function to get the single key a connection field is selected under
+def connection_slot(tree, key, default):
+    """
+    A connection may be selected once per selection set, so a key with explicit arguments, e.g.
+    lineItems(first: 50), takes over the subtree of the default lineItems(first: 10); two
+    different explicit arguments raise a ValueError.
+    """
+    name = FIELD_PATTERN.match(key).group(1)
+    default_key = connection_key(name, default) if isinstance(default, Connection) else None
+    for existing in list(tree):
+        if existing == key or existing.startswith("...") or FIELD_PATTERN.match(existing).group(1) != name:
+            continue
+        if key == default_key:
+            return existing
+        if existing != default_key:
+            raise ValueError(f"Connection {name} is selected with different arguments: {existing} and {key}")
+        # Move the default selection under the explicit arguments
+        child = tree.pop(existing)
+        merge(tree, key, child)
+    return key
+
+
+# Function to add a dotted field path to a tree
+def add_path(tree, path):
+    name, rest = path[0], path[1:]
+    default = field_default(name)
+    if isinstance(default, Connection):
+        key = connection_slot(tree, connection_key(name, default), default)
+        if not rest:
+            merge(tree, key, expand(default))
+            return
+        merge(tree, key, {"edges": {"node": {}}})
+        add_path(tree[key]["edges"]["node"], rest)
+    elif not rest:
+        merge(tree, name, default if isinstance(default, Fragment) else expand(default))
+    else:
+        merge(tree, name, {})
+        if isinstance(tree[name], Fragment):
+            tree[name] = expand(tree[name])
+        add_path(tree[name], rest)
+
+
+# Function to count how often every fragment would be written out
+def count_fragments(tree, counts):
+    for key, child in tree.items():
+        if isinstance(child, Fragment):
+            counts[child.name] = counts.get(child.name, 0) + 1
+            count_fragments(expand(child), counts)
+        elif child:
+            count_fragments(child, counts)
+    return counts
+
+
+# Function to render a tree of fields as a minified selection set
+def render(tree, defined):
+    """
+    Fragments in `defined` are spread; the fields of the others are written in place.
+    """
+    parts = []
+    for key, child in tree.items():
+        match = FIELD_PATTERN.match(key.lstrip("."))
+        field = match.group(1) + (f"({minify(match.group(2))})" if match.group(2) else "")
+        if isinstance(child, Fragment):
+            body = f"...{child.name}" if child.name in defined else render(expand(child), defined)
+            parts.append(body if key.startswith("...") else f"{field}{{{body}}}")
+        elif child:
+            parts.append(f"{field}{{{render(child, defined)}}}")
+        else:
+            parts.append(field)
+    return " ".join(parts)
+
+
+# Function to remove the optional whitespace of field arguments, outside string literals
+def minify(arguments):
+    return "".join(
+        part if part.startswith('"') else re.sub(r"\s*([:,()\[\]{}$])\s*", r"\1", part).strip()
+        for part in re.split(r'("(?:[^"\\]|\\.)*")', arguments)
+    )
+
+
+# Function to render a document, deciding which fragments are worth defining
+def render_document(header, tree):
+    fragments = {}
+    for name, count in count_fragments(tree, {}).items():
+        found = find_fragment(tree, name)
+        inline = render(expand(found), set())
+        definition = f"fragment {name} on {found.type_condition}{{{inline}}}"
+        if count * len(inline) > len(definition) + count * len(f"...{name}"):
+            fragments[name] = found
+    body = render(tree, set(fragments))
+    definitions = "".join(
+        f"fragment {name} on {found.type_condition}{{{render(expand(found), set(fragments))}}}"
+        for name, found in fragments.items()
+    )
+    return f"{header}{{{body}}}{definitions}"
+
+
+# Function to find a fragment by name in a tree
+def find_fragment(tree, name):
+    for child in tree.values():
+        if isinstance(child, Fragment):
+            if child.name == name:
+                return child
+            child = expand(child)
+        if child:
+            found = find_fragment(child, name)
+            if found:
+                return found
+    return None
+
+
+# Function to build (or get from the cache) the document selecting `selection` below a root field
+def build_query(operation_name, root_field, selection, variables=None, operation_type="query"):
+    """
+    Returns a minified document such as query order($id:ID!){order(id:$id){...}}.
+    `root_field` is written with its arguments, e.g. "order(id: $id)", and `variables` maps the
+    variable names to their types, e.g. {"id": "ID!"}.
+    """
+    key = (operation_name, root_field, freeze(selection), tuple((variables or {}).items()), operation_type)
+    with documents_lock:
+        document = documents.get(key)
+    if document is None:
+        tree = {}
+        add_field(tree, root_field, key[2])
+        definitions = ",".join(f"${name}:{type_name}" for name, type_name in key[3])
+        header = f"{operation_type} {operation_name}" + (f"({definitions})" if definitions else "")
+        document = render_document(header, tree)
+        with documents_lock:
+            documents[key] = document
+    return document
+
+
+# Function to fetch the fields of one node, e.g. fetch_node("order", order_id, ["name", "lineItems.sku"])
+def fetch_node(root_field, node_id, selection, client=None):
+    query = build_query(root_field, f"{root_field}(id: $id)", selection, {"id": "ID!"})
+    variables = {"id": node_id}
+    return get_client(client).execute(query, variables, cost=estimate_query_cost(query, variables))
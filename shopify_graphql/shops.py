@@ -0,0 +1,127 @@
+"""
+Running operations across many stores at once.
+
+A shop registry lists the stores, and every store gets its own ShopifyClient, and so its own
+connection pool and cost bucket. Each store runs in its own thread, so a slow or throttled store
+only delays its own results. Results and failures are collected per store.
+"""
+
+# Importing the necessary packages
+import csv
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .client import DEFAULT_API_VERSION, ShopifyClient
+from .operations import resolve_operation
+from .products import iter_products
+
+# One store of the registry
+Shop = namedtuple("Shop", ["name", "shop", "access_token", "api_version"])
+
+
+# Function to read the shop registry from a JSON or CSV file
+def load_shop_registry(file_path):
+    """
+    Reads a list of {name, shop, access_token, api_version} records. Instead of access_token a
+    record may name the environment variable holding it in access_token_env, so the registry
+    does not have to contain secrets. api_version is optional.
+    """
+    with open(file_path, newline="", encoding="utf-8") as registry_file:
+        if file_path.lower().endswith(".json"):
+            records = json.load(registry_file)
+        else:
+            records = list(csv.DictReader(registry_file))
+
+    shops = []
+    for record in records:
+        access_token = record.get("access_token") or os.environ.get(record.get("access_token_env") or "")
+        if not access_token:
+            raise ValueError(f"No access token for shop {record.get('name') or record['shop']}")
+        shops.append(Shop(record.get("name") or record["shop"], record["shop"], access_token,
+                          record.get("api_version") or DEFAULT_API_VERSION))
+    return shops
+
+
+# Function to create one independent client per store
+def create_clients(shops, http2=False, **options):
+    """
+    With http2=True every store gets an Http2ShopifyClient (see shopify_graphql.http2).
+    """
+    client_class = ShopifyClient
+    if http2:
+        from .http2 import Http2ShopifyClient as client_class
+    return {shop.name: client_class(shop.shop, shop.access_token, shop.api_version, **options) for shop in shops}
+
+
+# Function to run an operation for one store and time it
+def run_for_shop(operation, client):
+    started = time.perf_counter()
+    try:
+        result = {"result": operation(client)}
+    except Exception as error:
+        result = {"error": f"{type(error).__name__}: {error}"}
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+# Function to run an operation across all stores concurrently
+def run_across_shops(operation, clients, max_workers=None, on_result=None):
+    """
+    Calls `operation(client)` once per store, each store in its own thread (unless `max_workers`
+    is lower than the number of stores). `on_result(name, result)` is called as each store
+    finishes. Returns {"succeeded", "failed", "results": {shop name: result}} where a result
+    holds either "result" or "error" and the "seconds" the store took.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(clients), 1)) as executor:
+        futures = {executor.submit(run_for_shop, operation, client): name for name, client in clients.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            results[name] = future.result()
+            if on_result:
+                on_result(name, results[name])
+    failed = sorted(name for name, result in results.items() if "error" in result)
+    return {"succeeded": len(results) - len(failed), "failed": failed, "results": results}
+
+
+# Function to run a registered operation (see shopify_graphql.operations) across all stores
+def run_operation_across_shops(operation_name, arguments, clients, max_workers=None, shop_arguments=None):
+    """
+    Order, product and owner IDs belong to one store, so `shop_arguments` maps shop names to the
+    arguments of that store, e.g. {"us": {"owner_id": "gid://shopify/Shop/1"}}. They are merged
+    over the shared `arguments`, which stores without an entry get alone.
+    """
+    function = resolve_operation(operation_name)
+    shop_arguments = shop_arguments or {}
+    unknown = set(shop_arguments) - set(clients)
+    if unknown:
+        raise KeyError(f"Arguments given for unknown shops: {sorted(unknown)}")
+    names = {id(client): name for name, client in clients.items()}
+
+    def operation(client):
+        return function(**{**arguments, **shop_arguments.get(names[id(client)], {})}, client=client)
+
+    return run_across_shops(operation, clients, max_workers)
+
+
+# Function to export the products of every store into one JSONL file per store
+def export_products_across_shops(clients, output_dir, search_query=None, page_size=None, max_workers=None):
+    """
+    Writes the products of each store to <output_dir>/<store domain>.jsonl, e.g.
+    exports/acme-eu.myshopify.com.jsonl, so stores never share a file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    def export(client):
+        file_path = os.path.join(output_dir, f"{client.shop}.jsonl")
+        count = 0
+        with open(file_path, "w", encoding="utf-8") as output:
+            for product in iter_products(search_query, page_size=page_size, client=client):
+                output.write(json.dumps(product) + "\n")
+                count += 1
+        return {"file": file_path, "products": count}
+
+    return run_across_shops(export, clients, max_workers)
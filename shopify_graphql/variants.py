@@ -0,0 +1,184 @@
+"""
+Variant operations: retrieve the variants of a product and create or update variants in bulk.
+
+productVariantsBulkCreate and productVariantsBulkUpdate work on many variants of one product per
+call, so sizing matrices and store-wide repricing take a handful of calls per product.
+"""
+
+# Importing the necessary packages
+import csv
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import get_client
+
+VARIANTS_PER_CALL = 100     # Variants sent in one bulk create or update call
+
+RETRIEVE_PRODUCT_VARIANTS_QUERY = """
+query getProduct($id: ID!) {
+    product(id: $id) {
+        id
+        title
+        variants(first: 10) {
+            edges {
+                node {
+                    id
+                    title
+                    sku
+                    price
+                }
+            }
+        }
+    }
+}
+"""
+
+BULK_CREATE_VARIANTS_MUTATION = """
+mutation createVariants($productId: ID!, $variants: [ProductVariantsBulkInput!]!) {
+    productVariantsBulkCreate(productId: $productId, variants: $variants) {
+        productVariants {
+            id
+            title
+            sku
+            price
+        }
+        userErrors {
+            field               # Path of the failing input, e.g. ["variants", "3", "price"]
+            message
+        }
+    }
+}
+"""
+
+BULK_UPDATE_VARIANTS_MUTATION = """
+mutation updateVariants($productId: ID!, $variants: [ProductVariantsBulkInput!]!) {
+    productVariantsBulkUpdate(productId: $productId, variants: $variants) {
+        productVariants {
+            id
+            price
+            compareAtPrice
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+
+# Function to retrieve the existing Variants of a Product
+def retrieve_product_variants(product_id, client=None):
+    return get_client(client).execute(RETRIEVE_PRODUCT_VARIANTS_QUERY, {"id": product_id}, cost=12)
+
+
+# Function to create a new variant for a product
+def create_variant(product_id, sku, price, title, option_name="Title", client=None):
+    """
+    Creates one variant whose value for `option_name` is `title`.
+    """
+    variant = {"optionValues": [{"optionName": option_name, "name": title}], "price": price,
+               "inventoryItem": {"sku": sku}}
+    return bulk_create_variants(product_id, [variant], client=client)
+
+
+# Function to create many variants of one product in a single call
+def bulk_create_variants(product_id, variants, client=None):
+    variables = {"productId": product_id, "variants": variants}
+    return get_client(client).execute(BULK_CREATE_VARIANTS_MUTATION, variables)
+
+
+# Function to update many variants of one product in a single call
+def bulk_update_variants(product_id, variants, client=None):
+    variables = {"productId": product_id, "variants": variants}
+    return get_client(client).execute(BULK_UPDATE_VARIANTS_MUTATION, variables)
+
+
+# Function to convert a CSV row into a ProductVariantsBulkInput for creation
+def variant_create_input(record):
+    """
+    Builds the variant input from the product_id, options, price, compareAtPrice and sku columns.
+    The options column lists "Option=Value" pairs separated by semicolons.
+    """
+    variant = {
+        "optionValues": [
+            {"optionName": name.strip(), "name": value.strip()}
+            for name, value in (pair.split("=", 1) for pair in record["options"].split(";") if pair.strip())
+        ],
+        "price": record["price"],
+    }
+    if record.get("compareAtPrice"):
+        variant["compareAtPrice"] = record["compareAtPrice"]
+    if record.get("sku"):
+        variant["inventoryItem"] = {"sku": record["sku"]}
+    return variant
+
+
+# Function to convert a CSV row into a ProductVariantsBulkInput for an update
+def variant_update_input(record):
+    variant = {"id": record["variant_id"]}
+    for field in ("price", "compareAtPrice"):
+        if record.get(field):
+            variant[field] = record[field]
+    return variant
+
+
+# Function to read variant rows from a CSV file and group them per product
+def read_variants_by_product(csv_path, build_input):
+    """
+    Returns a dict of {product_id: [variant input, ...]} built with `build_input`
+    (variant_create_input or variant_update_input).
+    """
+    variants_by_product = defaultdict(list)
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        for record in csv.DictReader(csv_file):
+            variants_by_product[record["product_id"]].append(build_input(record))
+    return variants_by_product
+
+
+# Function to send all the variants of one product in chunks
+def process_product_variants(product_id, variants, bulk_operation, client=None):
+    """
+    Sends the variants of a product in chunks of VARIANTS_PER_CALL using `bulk_operation`
+    (bulk_create_variants or bulk_update_variants).
+    Returns a result dict with the number of calls, the saved variants and the failed inputs.
+    """
+    result = {"product_id": product_id, "calls": 0, "saved": [], "failed": []}
+    for start in range(0, len(variants), VARIANTS_PER_CALL):
+        chunk = variants[start:start + VARIANTS_PER_CALL]
+        data = bulk_operation(product_id, chunk, client=client)
+        result["calls"] += 1
+        if "errors" in data:
+            result["failed"].extend({"input": variant, "errors": [e["message"] for e in data["errors"]]}
+                                    for variant in chunk)
+            continue
+
+        payload = next(iter(data["data"].values()))
+        for error in payload["userErrors"]:
+            field = error.get("field") or []
+            index = int(field[1]) if len(field) >= 2 and str(field[1]).isdigit() else None
+            failed_input = chunk[index] if index is not None and index < len(chunk) else None
+            result["failed"].append({"input": failed_input, "errors": [error["message"]]})
+        result["saved"].extend(payload["productVariants"] or [])
+    return result
+
+
+# Function to process the variants of many products concurrently
+def process_variants(variants_by_product, bulk_operation, max_workers=4, client=None):
+    client = get_client(client)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda item: process_product_variants(item[0], item[1], bulk_operation, client=client),
+            variants_by_product.items(),
+        ))
+
+
+# Function to summarize the results of all products
+def summarize(results):
+    return {
+        "products": len(results),
+        "calls": sum(result["calls"] for result in results),
+        "saved": sum(len(result["saved"]) for result in results),
+        "failed": [dict(failure, product_id=result["product_id"])
+                   for result in results for failure in result["failed"]],
+    }